@@ -0,0 +1,136 @@
+"""
+Read-replica routing.
+
+With DB_REPLICA_URLS set, safe-method (GET/HEAD/OPTIONS) requests to views
+marked `read_from_replica = True` — the catalogue viewsets — read from a
+replica; everything else, and every write, uses the primary ("default").
+
+Read-your-writes: replicas lag the primary a little, so a client that has
+just written must not read from one straight away.
+
+  * within a request, the first write pins all later reads to the primary;
+  * a successful POST/PUT/PATCH/DELETE sets a short-lived cookie
+    (DB_REPLICA_STICKY_SECONDS) that keeps the client's reads on the
+    primary until replication has caught up.
+
+Cached responses: a response cached under the version a write has just
+bumped (course/cache.py) would be served to everyone for API_CACHE_TIMEOUT,
+so a lagging replica must never build one. Cache misses fill the cache
+inside `primary_reads()`; only uncached (authenticated) reads use replicas.
+
+The routing decision lives in a context variable set by
+`ReplicaRoutingMiddleware`, so it follows the request into the threads
+sync_to_async uses. Outside a request (management commands, workers) reads
+go to the primary.
+"""
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+
+PRIMARY = "default"
+
+
+class _ReadRoute:
+    """Where this request's reads go; decided once, on its first read."""
+
+    def __init__(self, pinned):
+        self.pinned = pinned            # sticky cookie, or an unsafe method
+        self.replica_view = False       # set by process_view
+        self.wrote = False
+        self._alias = None
+
+    def read_alias(self):
+        if self.pinned or self.wrote or not self.replica_view or not settings.DATABASE_REPLICAS:
+            return PRIMARY
+        if self._alias is None:
+            self._alias = random.choice(settings.DATABASE_REPLICAS)
+        return self._alias
+
+
+_current_route = ContextVar("db_read_route", default=None)
+
+
+@contextmanager
+def primary_reads():
+    """Send this request's reads to the primary inside the block."""
+    route = _current_route.get()
+    if route is None:
+        yield
+        return
+    pinned, route.pinned = route.pinned, True
+    try:
+        yield
+    finally:
+        route.pinned = pinned
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        route = _current_route.get()
+        return route.read_alias() if route is not None else PRIMARY
+
+    def db_for_write(self, model, **hints):
+        route = _current_route.get()
+        if route is not None:
+            route.wrote = True
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True                     # replicas hold the same data
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == PRIMARY            # replicas are migrated by replication
+
+
+class ReplicaRoutingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        route, token = self._begin(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_route.reset(token)
+        return self._finish(request, response, route)
+
+    async def __acall__(self, request):
+        route, token = self._begin(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_route.reset(token)
+        return self._finish(request, response, route)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        route = _current_route.get()
+        if route is not None:
+            view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+            route.replica_view = getattr(view_class or view_func, "read_from_replica", False)
+
+    @staticmethod
+    def _begin(request):
+        sticky = settings.DB_REPLICA_STICKY_COOKIE in request.COOKIES
+        route = _ReadRoute(pinned=sticky or request.method not in SAFE_METHODS)
+        return route, _current_route.set(route)
+
+    @staticmethod
+    def _finish(request, response, route):
+        if settings.DATABASE_REPLICAS and route.wrote and response.status_code < 400:
+            response.set_cookie(
+                settings.DB_REPLICA_STICKY_COOKIE, "1",
+                max_age=settings.DB_REPLICA_STICKY_SECONDS, httponly=True, samesite="Lax",
+            )
+        return response
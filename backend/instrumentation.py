@@ -0,0 +1,302 @@
+"""
+Per-endpoint request instrumentation.
+
+`RequestMetricsMiddleware` measures every request:
+
+    queries  – SQL statements run (all database aliases)
+    db       – time spent inside those statements
+    serialize – time spent in `serializer.data` (views using TimedSerializerMixin)
+    render   – time spent rendering the response body (DRF's JSON renderer)
+    total    – wall time through the rest of the middleware stack
+
+It reports them to the client in a `Server-Timing` header (visible in the
+browser's network panel) and folds them into in-process histograms keyed
+by endpoint ("GET courses-list"), which admins can read at /api/metrics/.
+Histograms are per worker process and reset on restart.
+
+Statements are counted by an execute wrapper installed on every database
+connection, which reports to the timer of the current request through a
+context variable. Context variables follow the request into the threads
+that sync_to_async uses, so async views (and sync views under ASGI) are
+measured too. Serialization is timed the same way, by wrapping the
+`to_representation` of the serializers a view's `get_serializer` builds;
+without it, that cost would count as view time.
+
+Query budgets: a view may declare `query_budget = 3`, or QUERY_BUDGETS maps
+endpoints ("GET courses-list") to a budget. Going over logs a warning; with
+QUERY_BUDGET_STRICT (set it in CI) it raises `QueryBudgetExceeded`, so an
+N+1 regression fails the test that exercises it.
+"""
+import bisect
+import logging
+import threading
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from users.cache import user_cache
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 200)
+
+
+class QueryBudgetExceeded(Exception):
+    """A view ran more SQL statements than its declared budget."""
+
+
+# ─── Histograms ────────────────────────────────────────────────────────────
+class Histogram:
+    """Fixed-bucket histogram; cheap enough to update on every request."""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)   # last slot: above the top bucket
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of observations."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.buckets[index] if index < len(self.buckets) else self.max
+        return self.max
+
+    def snapshot(self):
+        return {
+            "count": self.count,
+            "mean": round(self.sum / self.count, 3) if self.count else None,
+            "p50": self.percentile(0.50),
+            "p95": self.percentile(0.95),
+            "p99": self.percentile(0.99),
+            "max": round(self.max, 3),
+            "buckets": dict(zip([*map(str, self.buckets), "+Inf"], self.counts)),
+        }
+
+
+class MetricsRegistry:
+    SERIES = {
+        "total_ms": LATENCY_BUCKETS_MS,
+        "db_ms": LATENCY_BUCKETS_MS,
+        "serialize_ms": LATENCY_BUCKETS_MS,
+        "render_ms": LATENCY_BUCKETS_MS,
+        "queries": QUERY_BUCKETS,
+    }
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, **values):
+        with self._lock:
+            series = self._endpoints.get(endpoint)
+            if series is None:
+                series = self._endpoints[endpoint] = {
+                    name: Histogram(buckets) for name, buckets in self.SERIES.items()
+                }
+            for name, value in values.items():
+                series[name].observe(value)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                endpoint: {name: histogram.snapshot() for name, histogram in series.items()}
+                for endpoint, series in sorted(self._endpoints.items())
+            }
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
+
+
+metrics = MetricsRegistry()
+
+
+# ─── Middleware ────────────────────────────────────────────────────────────
+class _QueryTimer:
+    """Statements run, and time spent in them, for one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.serialize_seconds = 0.0
+
+
+_current_timer = ContextVar("request_query_timer", default=None)
+
+
+def _timed_execute(execute, sql, params, many, context):
+    timer = _current_timer.get()
+    if timer is None:           # outside a request: management commands, workers
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.seconds += time.perf_counter() - start
+        timer.count += 1
+
+
+def _install_wrapper(connection):
+    if _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_timed_execute)
+
+
+def _on_connection_created(sender, connection, **kwargs):
+    _install_wrapper(connection)
+
+
+connection_created.connect(_on_connection_created, dispatch_uid="request-metrics")
+
+
+def timed_serializer(serializer):
+    """Count the time `serializer.data` spends in to_representation() as "serialize"."""
+    to_representation = serializer.to_representation
+
+    def timed(instance):
+        timer = _current_timer.get()
+        if timer is None:
+            return to_representation(instance)
+        start = time.perf_counter()
+        try:
+            return to_representation(instance)
+        finally:
+            timer.serialize_seconds += time.perf_counter() - start
+
+    serializer.to_representation = timed     # shadows the method on this instance only
+    return serializer
+
+
+class TimedSerializerMixin:
+    """Generic view mixin: serializers from get_serializer() report "serialize" time."""
+
+    def get_serializer(self, *args, **kwargs):
+        return timed_serializer(super().get_serializer(*args, **kwargs))
+
+
+class RequestMetricsMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        # connections opened before this module was imported
+        for alias in connections:
+            _install_wrapper(connections[alias])
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.REQUEST_METRICS_ENABLED:
+            return self.get_response(request)
+
+        timer, token, start = self._begin(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        return self._finish(request, response, timer, start)
+
+    async def __acall__(self, request):
+        if not settings.REQUEST_METRICS_ENABLED:
+            return await self.get_response(request)
+
+        timer, token, start = self._begin(request)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current_timer.reset(token)
+        return self._finish(request, response, timer, start)
+
+    @staticmethod
+    def _begin(request):
+        timer = _QueryTimer()
+        request._render_seconds = 0.0
+        return timer, _current_timer.set(timer), time.perf_counter()
+
+    def _finish(self, request, response, timer, start):
+        total = time.perf_counter() - start
+        endpoint = self._endpoint(request)
+        db_ms, serialize_ms = timer.seconds * 1000, timer.serialize_seconds * 1000
+        render_ms, total_ms = request._render_seconds * 1000, total * 1000
+        metrics.record(
+            endpoint, total_ms=total_ms, db_ms=db_ms, serialize_ms=serialize_ms,
+            render_ms=render_ms, queries=timer.count,
+        )
+        response["Server-Timing"] = ", ".join([
+            f'db;dur={db_ms:.1f};desc="{timer.count} queries"',
+            f"serialize;dur={serialize_ms:.1f}",
+            f"render;dur={render_ms:.1f}",
+            f"total;dur={total_ms:.1f}",
+        ])
+
+        self._check_budget(request, endpoint, timer.count)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses render after the view returns; time just that step
+        started = time.perf_counter()
+
+        def rendered(response):
+            request._render_seconds = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
+
+    @staticmethod
+    def _endpoint(request):
+        match = getattr(request, "resolver_match", None)
+        name = (match.view_name or match._func_path) if match else "unresolved"
+        return f"{request.method} {name}"
+
+    @staticmethod
+    def _check_budget(request, endpoint, count):
+        match = getattr(request, "resolver_match", None)
+        if match is None:
+            return
+        view_class = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+        budget = getattr(view_class, "query_budget", None)
+        if budget is None:
+            budget = settings.QUERY_BUDGETS.get(endpoint)
+        if budget is None or count <= budget:
+            return
+
+        message = f"{endpoint} ran {count} queries (budget {budget})"
+        if settings.QUERY_BUDGET_STRICT:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+# ─── Endpoint ──────────────────────────────────────────────────────────────
+class MetricsView(APIView):
+    """GET /api/metrics/ — this worker's request histograms (admins only)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            "endpoints": metrics.snapshot(),
+            "user_cache": user_cache.stats(),
+        })
@@ -35,9 +35,15 @@ INSTALLED_APPS = [
     'rest_framework_simplejwt',
     'course',
     'lessons',
+    'search',
+    'enrollments',
+    'payments',
+    'uploads',
 ]
 
 MIDDLEWARE = [
+    'backend.instrumentation.RequestMetricsMiddleware',  # outermost: times the whole stack
+    'backend.db_router.ReplicaRoutingMiddleware',        # picks primary / replica for this request's reads
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -72,6 +78,104 @@ DATABASES = {
     'default': env.db('DB_URL')
 }
 
+# ─── Connection reuse ───────────────────────────────────────────
+# Keep connections open between requests instead of paying the PostgreSQL
+# handshake every time (seconds; 0 = close after each request). Under ASGI
+# prefer DB_POOL: persistent connections are per thread there.
+DB_CONN_MAX_AGE = env.int('DB_CONN_MAX_AGE', default=60)
+# DB_POOL=true → Django's psycopg 3 pool (pip install "psycopg[pool]").
+# The pool then owns the connections, so CONN_MAX_AGE is forced to 0.
+DB_POOL = env.bool('DB_POOL', default=False)
+DB_POOL_OPTIONS = {
+    'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+    'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+    'timeout': env.int('DB_POOL_TIMEOUT', default=10),   # seconds to wait for a free connection
+}
+
+# ─── Read replicas ──────────────────────────────────────────────
+# DB_REPLICA_URLS=postgres://ro@replica1/lms,postgres://ro@replica2/lms
+# Catalogue reads go to a random replica (backend/db_router.py); writes and
+# everything else stay on "default". Tests mirror the replicas onto default.
+DATABASE_REPLICAS = []
+for number, url in enumerate(env.list('DB_REPLICA_URLS', default=[]), 1):
+    DATABASES[f'replica{number}'] = {**env.db_url_config(url), 'TEST': {'MIRROR': 'default'}}
+    DATABASE_REPLICAS.append(f'replica{number}')
+
+for database in DATABASES.values():
+    database['CONN_HEALTH_CHECKS'] = True   # drop a dead persistent connection, don't error on it
+    if DB_POOL:
+        database['CONN_MAX_AGE'] = 0
+        database.setdefault('OPTIONS', {})['pool'] = DB_POOL_OPTIONS
+    else:
+        database['CONN_MAX_AGE'] = DB_CONN_MAX_AGE
+
+DATABASE_ROUTERS = ['backend.db_router.ReplicaRouter']
+# After a write the client's reads stay on the primary this long (replication lag)
+DB_REPLICA_STICKY_SECONDS = env.int('DB_REPLICA_STICKY_SECONDS', default=10)
+DB_REPLICA_STICKY_COOKIE = 'db_primary'
+
+# Local memory by default (dev/tests); point CACHE_URL at redis://... in prod
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
+# Seconds an anonymous catalogue response may live in the cache. Writes
+# invalidate through version counters (course/cache.py), so this only bounds
+# staleness for changes that bypass Model.save().
+API_CACHE_TIMEOUT = env.int('API_CACHE_TIMEOUT', default=300)
+
+# Seconds a "not revoked" answer for a refresh token may be served from the
+# cache (users/revocation.py); only matters with a per-process cache
+TOKEN_REVOCATION_CACHE_TIMEOUT = env.int('TOKEN_REVOCATION_CACHE_TIMEOUT', default=60)
+
+# In-process LRU of User rows used by the JWT authentication (users/cache.py)
+USER_CACHE_MAX_SIZE = env.int('USER_CACHE_MAX_SIZE', default=1024)
+USER_CACHE_TTL = env.int('USER_CACHE_TTL', default=30)  # seconds
+
+# Rows validated and written per round trip by the bulk catalogue importers
+BULK_IMPORT_BATCH_SIZE = env.int('BULK_IMPORT_BATCH_SIZE', default=500)
+# Processes hashing passwords for bulk user imports (users/provisioning.py);
+# 0 hashes in the request / command process itself
+USER_IMPORT_HASH_WORKERS = env.int('USER_IMPORT_HASH_WORKERS', default=os.cpu_count() or 1)
+# Rows per server-side cursor fetch for the streaming catalogue exports
+EXPORT_CHUNK_SIZE = env.int('EXPORT_CHUNK_SIZE', default=2000)
+
+# Seconds an "is user X enrolled in course Y" answer is cached (enrollments/access.py)
+ENROLLMENT_CACHE_TIMEOUT = env.int('ENROLLMENT_CACHE_TIMEOUT', default=300)
+
+# Lesson progress write-behind (enrollments/progress.py): heartbeats wait in
+# the cache and are upserted in bulk every PROGRESS_FLUSH_INTERVAL seconds.
+# Needs a shared CACHE_URL (Redis / Memcached); with locmem they are written through
+PROGRESS_FLUSH_INTERVAL = env.int('PROGRESS_FLUSH_INTERVAL', default=5)
+PROGRESS_FLUSH_MAX_ROWS = env.int('PROGRESS_FLUSH_MAX_ROWS', default=20000)
+PROGRESS_BUFFER_TIMEOUT = env.int('PROGRESS_BUFFER_TIMEOUT', default=3600)
+
+# Request instrumentation (backend/instrumentation.py): Server-Timing headers
+# plus per-endpoint histograms at /api/metrics/. QUERY_BUDGETS maps endpoints
+# ("METHOD url-name") to the most SQL statements they may run; over budget logs a warning,
+# or raises when QUERY_BUDGET_STRICT is on (useful in CI).
+REQUEST_METRICS_ENABLED = env.bool('REQUEST_METRICS_ENABLED', default=True)
+QUERY_BUDGET_STRICT = env.bool('QUERY_BUDGET_STRICT', default=False)
+QUERY_BUDGETS = {
+    'GET courses-list': 2,
+    'GET courses-detail': 2,
+    'GET category-list': 2,
+    'GET course-lessons-list': 3,
+    'GET course-lessons-detail': 3,
+    'GET search': 3,
+}
+
+# Payments (payments/providers.py). The fake provider needs no network.
+PAYMENT_PROVIDER = env('PAYMENT_PROVIDER', default='payments.providers.FakeProvider')
+PAYMENT_WEBHOOK_SECRET = env('PAYMENT_WEBHOOK_SECRET', default='dev-webhook-secret')
+PAYMENT_CURRENCY = env('PAYMENT_CURRENCY', default='usd')
+# Webhook events claimed per worker transaction, and retries before giving up
+PAYMENT_EVENT_BATCH_SIZE = env.int('PAYMENT_EVENT_BATCH_SIZE', default=100)
+PAYMENT_EVENT_MAX_ATTEMPTS = env.int('PAYMENT_EVENT_MAX_ATTEMPTS', default=5)
+# Seconds before a failed event is retried, doubling per attempt up to the cap
+PAYMENT_EVENT_RETRY_DELAY = env.int('PAYMENT_EVENT_RETRY_DELAY', default=30)
+PAYMENT_EVENT_MAX_RETRY_DELAY = env.int('PAYMENT_EVENT_MAX_RETRY_DELAY', default=3600)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -87,17 +191,61 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# ─── Password hashing ───────────────────────────────────────────
+# PASSWORD_HASHER picks the algorithm for new hashes (pbkdf2 | scrypt |
+# argon2, the last needs argon2-cffi); PASSWORD_HASH_PROFILE its cost
+# (fast | standard | strong, see users/hashers.py). Hashes made under another
+# algorithm or cost still verify and are upgraded after the next login, in
+# the background (users/backends.py).
+PASSWORD_HASHER = env('PASSWORD_HASHER', default='pbkdf2')
+PASSWORD_HASH_PROFILE = env('PASSWORD_HASH_PROFILE', default='standard')
+_PASSWORD_HASHERS = {
+    'pbkdf2': 'users.hashers.ProfilePBKDF2PasswordHasher',
+    'scrypt': 'users.hashers.ProfileScryptPasswordHasher',
+    'argon2': 'users.hashers.ProfileArgon2PasswordHasher',
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHERS.items() if name != PASSWORD_HASHER
+]
+AUTHENTICATION_BACKENDS = ['users.backends.DeferredRehashBackend']
+# Threads per process re-hashing outdated passwords after login
+PASSWORD_REHASH_WORKERS = env.int('PASSWORD_REHASH_WORKERS', default=1)
+
 #restframework part
 
 REST_FRAMEWORK = {
    
     'DEFAULT_AUTHENTICATION_CLASSES': (
     
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
-    )
+        # builds request.user from the token's role/is_staff claims instead
+        # of loading the User row on every request
+        'users.authentication.ClaimsJWTAuthentication',
+    ),
+
+    # Default page size for the cursor-paginated list endpoints and the hard
+    # cap a client can ask for with ?page_size= (see course/pagination.py)
+    'PAGE_SIZE': env.int('API_PAGE_SIZE', default=20),
+    'MAX_PAGE_SIZE': env.int('API_MAX_PAGE_SIZE', default=100),
+
+    # Login / registration rate limits (users/throttles.py), counted in the
+    # default cache. Every attempt costs a password hash; an empty value
+    # turns a limit off (benchmarks/run.py needs all three off). Campus NAT puts whole labs behind one
+    # IP, so the per-IP limits are looser than the per-account one.
+    'DEFAULT_THROTTLE_RATES': {
+        'login_ip': env('LOGIN_IP_THROTTLE_RATE', default='60/min') or None,
+        'login_email': env('LOGIN_EMAIL_THROTTLE_RATE', default='10/min') or None,
+        'register_ip': env('REGISTER_IP_THROTTLE_RATE', default='30/hour') or None,
+    },
+    # Proxies in front of the app: the client IP is taken that many hops back
+    # in X-Forwarded-For. 0 = use REMOTE_ADDR, so the header can't be spoofed.
+    'NUM_PROXIES': env.int('NUM_PROXIES', default=0),
 
 }
 
+# PAGE_SIZE is global but pagination is opted into per viewset on purpose
+# (categories stay unpaginated), which is exactly what W001 warns about.
+SILENCED_SYSTEM_CHECKS = ['rest_framework.W001']
+
 
 #simplejwt settings
 from datetime import timedelta
@@ -105,7 +253,9 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=env.int('ACCESS_TOKEN_LIFETIME_MINUTES', default=15)),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=env.int('REFRESH_TOKEN_LIFETIME_DAYS', default=7)),
     "ROTATE_REFRESH_TOKENS": True,
-    "BLACKLIST_AFTER_ROTATION": True,
+    # token_blacklist isn't installed: rotated-away and logged-out refresh
+    # tokens are revoked by users/revocation.py instead
+    "BLACKLIST_AFTER_ROTATION": False,
         #     🔑 2. Old Access Token
         # The access token already issued is not revoked, because JWT is stateless.
 
@@ -128,8 +278,10 @@ SIMPLE_JWT = {
     "TOKEN_TYPE_CLAIM": "token_type",
     "JTI_CLAIM": "jti",
 
-    "TOKEN_OBTAIN_SERIALIZER": "rest_framework_simplejwt.serializers.TokenObtainPairSerializer",
-    "TOKEN_REFRESH_SERIALIZER": "rest_framework_simplejwt.serializers.TokenRefreshSerializer",
+    "TOKEN_USER_CLASS": "users.authentication.ClaimsUser",
+
+    "TOKEN_OBTAIN_SERIALIZER": "users.serializers.auth.RoleTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "users.serializers.auth.RevocableTokenRefreshSerializer",
     "TOKEN_BLACKLIST_SERIALIZER": "rest_framework_simplejwt.serializers.TokenBlacklistSerializer",
 }
 
@@ -146,6 +298,35 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# ─── Uploaded media ─────────────────────────────────────────────
+MEDIA_URL = 'media/'
+MEDIA_ROOT = env('MEDIA_ROOT', default=str(BASE_DIR / 'media'))
+
+# Resumable uploads (uploads app): parts are appended here until complete.
+# Must be on the same filesystem as MEDIA_ROOT so finishing is a rename.
+UPLOAD_TEMP_DIR = env('UPLOAD_TEMP_DIR', default=os.path.join(MEDIA_ROOT, 'uploads', 'partial'))
+UPLOAD_MAX_SIZE = env.int('UPLOAD_MAX_SIZE', default=5 * 1024 ** 3)        # 5 GiB
+UPLOAD_CHUNK_SIZE = env.int('UPLOAD_CHUNK_SIZE', default=1024 ** 2)        # read/write unit
+UPLOAD_SESSION_TTL_HOURS = env.int('UPLOAD_SESSION_TTL_HOURS', default=24) # since the last part
+
+# How lesson videos / banners are sent:
+#   django   → streamed by the worker, honouring Range
+#   nginx    → X-Accel-Redirect to FILE_SERVE_ACCEL_PREFIX (an `internal` location)
+#   sendfile → X-Sendfile with the absolute path (Apache mod_xsendfile, lighttpd)
+FILE_SERVE_BACKEND = env('FILE_SERVE_BACKEND', default='django')
+FILE_SERVE_ACCEL_PREFIX = env('FILE_SERVE_ACCEL_PREFIX', default='/protected-media/')
+
+# Media jobs (`manage.py process_media_jobs`): banner thumbnails + video metadata
+MEDIA_WORKERS = env.int('MEDIA_WORKERS', default=2)                  # pool processes
+MEDIA_JOB_BATCH_SIZE = env.int('MEDIA_JOB_BATCH_SIZE', default=8)
+MEDIA_JOB_MAX_ATTEMPTS = env.int('MEDIA_JOB_MAX_ATTEMPTS', default=3)
+MEDIA_JOB_TIMEOUT = env.int('MEDIA_JOB_TIMEOUT', default=900)        # seconds before a running job is retried
+MEDIA_THUMBNAIL_WIDTHS = env.list('MEDIA_THUMBNAIL_WIDTHS', cast=int, default=[320, 640, 1280])
+MEDIA_THUMBNAIL_QUALITY = env.int('MEDIA_THUMBNAIL_QUALITY', default=80)  # WebP
+# Optional: with ffmpeg on PATH videos also get a poster frame
+FFMPEG_BINARY = env('FFMPEG_BINARY', default='ffmpeg')
+FFPROBE_BINARY = env('FFPROBE_BINARY', default='ffprobe')
+
 
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
@@ -1,14 +1,13 @@
 from django.contrib import admin
-from django.urls import path,include
-from rest_framework_simplejwt.views import (
-    TokenObtainPairView,
-    TokenRefreshView,
-)
+from django.urls import path,include,re_path
+from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework_simplejwt.views import TokenVerifyView
 import users
+from users.views import LoginView, LogoutAllView, LogoutView
+from backend.instrumentation import MetricsView
 
 from rest_framework_nested.routers import DefaultRouter, NestedDefaultRouter
-from course.views import CourseViewSet,CategoryViewSet
+from course.views import CourseViewSet,CategoryViewSet,CatalogueExportView
 from lessons.views import LessonViewSet
 
 
@@ -32,8 +31,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),
 
      # ✅ JWT endpoints
-    path('api/login/', TokenObtainPairView.as_view(), name='token_obtain_pair'),  # login will get token here
-    # path('api/logout/', TokenDestroyView.as_view(), name='token_destroy'),
+    path('api/login/', LoginView.as_view(), name='token_obtain_pair'),            # login will get token here (throttled)
+    path('api/logout/', LogoutView.as_view(), name='logout'),                   # revoke one refresh token
+    path('api/logout/all/', LogoutAllView.as_view(), name='logout_all'),         # revoke every session
     path('api/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),  # refresh
     path('api/token/verify/', TokenVerifyView.as_view(), name='token_verify'),    # verify
 
@@ -44,6 +44,28 @@ urlpatterns = [
     path('api/users/', include('users.urls')),
 
 
+    # 📈 Per-endpoint latency / query histograms (admins)
+    path('api/metrics/', MetricsView.as_view(), name='metrics'),
+
+    # 🔎 Full-text search over courses + lessons
+    path('api/search/', include('search.urls')),
+
+    # 🎓 Enrollments
+    path('api/', include('enrollments.urls')),
+
+    # 💳 Checkout + provider webhooks
+    path('api/', include('payments.urls')),
+
+    # ⏫ Resumable lesson-video / banner uploads
+    path('api/', include('uploads.urls')),
+
+    # 📤 Streaming catalogue dumps (admins)
+    re_path(r'^api/export/(?P<model>courses|lessons|categories)\.(?P<fmt>ndjson|csv)$',
+            CatalogueExportView.as_view(), name='catalogue-export'),
+
+    # ⚡ Async (ASGI) catalogue reads — same payloads as /api/
+    path('api/async/', include('course.async_urls')),
+
     # 📚 Course & Lesson APIs
     path('api/', include(router.urls)),         # /api/courses/
     path('api/', include(course_router.urls)),  # /api/courses/<id>/lessons/
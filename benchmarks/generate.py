@@ -0,0 +1,146 @@
+"""
+Seed the database with a benchmark-sized catalogue.
+
+    python -m benchmarks.generate --categories 50 --courses 5000 \
+        --lessons-per-course 20 --students 20000 --teachers 200
+
+Everything goes in with bulk_create, so tens of thousands of rows take
+seconds. Every generated user shares one password hash (hashing 20k
+passwords would dominate the run); the credentials and a sample of ids
+are written to a manifest the scenarios read (--manifest).
+
+Run it against a throwaway database: --reset deletes earlier bench data
+(users whose email ends in @bench.local and the catalogue they own).
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_MANIFEST = Path(__file__).resolve().parent / "manifest.json"
+PASSWORD = "bench-pass-123"
+EMAIL_DOMAIN = "bench.local"
+TAGS = ["python", "django", "sql", "web", "data", "ml", "devops", "go", "rust", "design"]
+
+
+def setup_django():
+    sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "backend.settings")
+    import django
+    django.setup()
+
+
+def generate(opts):
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+
+    from course.models import Category, Course
+    from course.stats import recount_course_stats
+    from enrollments.models import Enrollment
+    from lessons.models import Lesson
+
+    User = get_user_model()
+    rng = random.Random(opts.seed)
+    batch = opts.batch_size
+    run = int(time.time())
+    password = make_password(PASSWORD)
+
+    def users(role, n):
+        return [
+            User(
+                username=f"bench-{role}-{run}-{i}", email=f"bench-{role}-{run}-{i}@{EMAIL_DOMAIN}",
+                role=role, password=password,
+            )
+            for i in range(n)
+        ]
+
+    with transaction.atomic():
+        if opts.reset:
+            bench = User.objects.all_users().filter(email__endswith=f"@{EMAIL_DOMAIN}")
+            Course.objects.filter(instructor__in=bench).delete()
+            bench.delete()
+            Category.objects.filter(title__startswith="Bench ").exclude(courses__isnull=False).delete()
+
+        teachers = User.objects.bulk_create(users("teacher", opts.teachers), batch_size=batch)
+        students = User.objects.bulk_create(users("student", opts.students), batch_size=batch)
+        categories = Category.objects.bulk_create(
+            [Category(title=f"Bench {run} {i}", slug=f"bench-{run}-{i}") for i in range(opts.categories)],
+            batch_size=batch,
+        )
+        courses = Course.objects.bulk_create(
+            [
+                Course(
+                    title=f"Bench course {i}", description="Lorem ipsum dolor sit amet. " * 40,
+                    syllabus="Week 1. Week 2. Week 3. " * 20,
+                    category=rng.choice(categories), instructor=rng.choice(teachers),
+                    level=rng.choice(Course.CourseLevel.values), duration=rng.randint(1, 60),
+                    tags=rng.sample(TAGS, 3),
+                )
+                for i in range(opts.courses)
+            ],
+            batch_size=batch,
+        )
+        Lesson.objects.bulk_create(
+            (
+                Lesson(
+                    course=course, title=f"Lesson {n}", content="Lesson body. " * 100,
+                    order=n, is_preview=n == 0,
+                )
+                for course in courses for n in range(opts.lessons_per_course)
+            ),
+            batch_size=batch,
+        )
+        enrollments = {
+            (student.pk, rng.choice(courses).pk)
+            for student in students for _ in range(opts.enrollments_per_student)
+        }
+        Enrollment.objects.bulk_create(
+            (Enrollment(student_id=s, course_id=c) for s, c in enrollments),
+            batch_size=batch, ignore_conflicts=True,
+        )
+        recount_course_stats([course.pk for course in courses])
+
+    sample = rng.sample(students, min(len(students), 500))
+    manifest = {
+        "password": PASSWORD,
+        "students": [user.email for user in sample],
+        "teachers": [user.email for user in teachers[:50]],
+        "courses": [course.pk for course in rng.sample(courses, min(len(courses), 500))],
+        "enrollments": [[s, c] for s, c in list(enrollments)[:500]],
+        "counts": {
+            "categories": len(categories), "courses": len(courses),
+            "lessons": len(courses) * opts.lessons_per_course,
+            "students": len(students), "teachers": len(teachers), "enrollments": len(enrollments),
+        },
+    }
+    Path(opts.manifest).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--courses", type=int, default=2000)
+    parser.add_argument("--lessons-per-course", type=int, default=15)
+    parser.add_argument("--teachers", type=int, default=100)
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--enrollments-per-student", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--reset", action="store_true", help="delete earlier bench data first")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST))
+    opts = parser.parse_args(argv)
+
+    setup_django()
+    started = time.perf_counter()
+    manifest = generate(opts)
+    print(json.dumps(manifest["counts"]), f"in {time.perf_counter() - started:.1f}s → {opts.manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+Benchmark runner: drive scenarios against a running server and record
+throughput and latency percentiles as JSON.
+
+    # 1. seed a local PostgreSQL and start a server, with the login and
+    #    sign-up rate limits off (users/throttles.py): the auth and register
+    #    scenarios send far more than they allow from one IP
+    python -m benchmarks.generate --reset
+    export LOGIN_IP_THROTTLE_RATE= LOGIN_EMAIL_THROTTLE_RATE= REGISTER_IP_THROTTLE_RATE=
+    gunicorn backend.wsgi -w 4 -b 127.0.0.1:8000      # or: manage.py runserver
+
+    # 2. run, then compare against an earlier run
+    python -m benchmarks.run --scenario browse --scenario lessons -c 16 -d 30
+    python -m benchmarks.run --compare benchmarks/results/before.json benchmarks/results/after.json
+
+Workers are threads: one keep-alive connection each, running their
+scenario's steps back to back (closed loop). Latency is per HTTP call and
+percentiles are exact (nearest rank over every sample). Throttled (429)
+responses are counted separately and flagged in the report: a run that
+hit the rate limits measured them, not the endpoint.
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.generate import DEFAULT_MANIFEST
+from benchmarks.scenarios import SCENARIOS, Client
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+class Recorder:
+    """Collects (label → latencies, errors) from every worker thread."""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.throttled = defaultdict(int)
+        self.recording = False
+        self._lock = threading.Lock()
+
+    def add(self, label, seconds, ok=True, throttled=False):
+        if not self.recording:
+            return                      # warm-up
+        with self._lock:
+            self.samples[label].append(seconds)
+            if not ok:
+                self.errors[label] += 1
+            if throttled:
+                self.throttled[label] += 1
+
+    def summary(self, elapsed):
+        return {label: summarise(samples, self.errors[label], self.throttled[label], elapsed)
+                for label, samples in sorted(self.samples.items())}
+
+
+def percentile(ordered, fraction):
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def summarise(samples, errors, throttled, elapsed):
+    ordered = sorted(samples)
+    ms = lambda seconds: round(seconds * 1000, 2)  # noqa: E731
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throttled": throttled,
+        "throughput_rps": round(len(ordered) / elapsed, 1),
+        "mean_ms": ms(sum(ordered) / len(ordered)),
+        "p50_ms": ms(percentile(ordered, 0.50)),
+        "p95_ms": ms(percentile(ordered, 0.95)),
+        "p99_ms": ms(percentile(ordered, 0.99)),
+        "max_ms": ms(ordered[-1]),
+    }
+
+
+def run_scenario(name, opts, manifest):
+    recorder = Recorder()
+    stop = threading.Event()
+    iterations = [0] * opts.concurrency
+    failures = []
+
+    def worker(index):
+        scenario = SCENARIOS[name](Client(opts.base_url, recorder), manifest, index)
+        try:
+            scenario.setup()
+            while not stop.is_set():
+                scenario.step()
+                iterations[index] += 1
+        except Exception as exc:  # a broken worker must not hang the run
+            failures.append(f"worker {index}: {exc!r}")
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(opts.concurrency)]
+    for thread in threads:
+        thread.start()
+    time.sleep(opts.warmup)
+    recorder.recording = True
+    started = time.perf_counter()
+    time.sleep(opts.duration)
+    elapsed = time.perf_counter() - started
+    recorder.recording = False
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=30)
+
+    return {
+        "iterations": sum(iterations),
+        "worker_failures": failures,
+        "requests": recorder.summary(elapsed),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(results):
+    print(f"{'scenario / request':<34}{'req':>8}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, result in results["scenarios"].items():
+        for label, s in result["requests"].items():
+            print(f"{name + ' / ' + label:<34}{s['requests']:>8}{s['errors']:>6}{s['throughput_rps']:>9}"
+                  f"{s['p50_ms']:>9}{s['p95_ms']:>9}{s['p99_ms']:>9}")
+        for failure in result["worker_failures"]:
+            print(f"  ! {failure}")
+        throttled = sum(s.get("throttled", 0) for s in result["requests"].values())
+        if throttled:
+            print(f"  ! {throttled} requests throttled (429): restart the server with "
+                  f"LOGIN_IP_THROTTLE_RATE= LOGIN_EMAIL_THROTTLE_RATE= REGISTER_IP_THROTTLE_RATE=")
+
+
+def compare(before_path, after_path):
+    before = json.loads(Path(before_path).read_text())["scenarios"]
+    after = json.loads(Path(after_path).read_text())["scenarios"]
+    print(f"{'scenario / request':<34}" + "".join(f"{h:>26}" for h in ("rps", "p50 ms", "p95 ms", "p99 ms")))
+    for name in sorted(before.keys() & after.keys()):
+        old_requests, new_requests = before[name]["requests"], after[name]["requests"]
+        for label in sorted(old_requests.keys() & new_requests.keys()):
+            old, new = old_requests[label], new_requests[label]
+            cells = [f"{old[k]}→{new[k]} ({delta(old[k], new[k])})"
+                     for k in ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")]
+            print(f"{name + ' / ' + label:<34}" + "".join(f"{c:>26}" for c in cells))
+
+
+def delta(old, new):
+    return f"{(new - old) / old * 100:+.0f}%" if old else "n/a"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="repeatable; default: all of them, one after another")
+    parser.add_argument("-c", "--concurrency", type=int, default=8)
+    parser.add_argument("-d", "--duration", type=float, default=20, help="measured seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=3, help="unmeasured seconds first")
+    parser.add_argument("--manifest", default=str(DEFAULT_MANIFEST))
+    parser.add_argument("--output", help="results file (default: benchmarks/results/<time>-<commit>.json)")
+    parser.add_argument("--label", help="free-form note stored with the results")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                        help="print the difference between two result files and exit")
+    opts = parser.parse_args(argv)
+
+    if opts.compare:
+        compare(*opts.compare)
+        return
+
+    manifest = json.loads(Path(opts.manifest).read_text())
+    revision = git_revision()
+    results = {
+        "meta": {
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": revision,
+            "label": opts.label,
+            "base_url": opts.base_url,
+            "concurrency": opts.concurrency,
+            "duration_s": opts.duration,
+            "warmup_s": opts.warmup,
+            "dataset": manifest.get("counts"),
+            "python": platform.python_version(),
+            "host": platform.node(),
+        },
+        "scenarios": {},
+    }
+    for name in opts.scenario or sorted(SCENARIOS):
+        print(f"→ {name}: {opts.concurrency} workers × {opts.duration:g}s", flush=True)
+        results["scenarios"][name] = run_scenario(name, opts, manifest)
+
+    output = Path(opts.output) if opts.output else RESULTS_DIR / (
+        f"{datetime.now():%Y%m%d-%H%M%S}-{revision or 'nogit'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    print_report(results)
+    print(f"results → {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Scripted user journeys for the benchmark runner.
+
+Each scenario gets its own `Client` per worker thread: `setup()` runs once
+(log in, pick ids from the manifest), then `step()` runs in a loop for the
+duration of the benchmark. Every HTTP call inside a step is timed and
+reported separately under its label.
+"""
+import http.client
+import itertools
+import json
+import random
+import time
+from urllib.parse import urlencode, urlsplit
+
+
+class Client:
+    """Keep-alive HTTP/1.1 JSON client that reports each call to a recorder."""
+
+    def __init__(self, base_url, recorder, timeout=30):
+        parts = urlsplit(base_url)
+        self.host, self.port = parts.hostname, parts.port or 80
+        self.recorder = recorder
+        self.timeout = timeout
+        self.token = None
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return self._conn
+
+    def request(self, label, method, path, body=None, expect=(200,), auth=True):
+        headers = {"Accept": "application/json"}
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers["Content-Type"] = "application/json"
+        if auth and self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        started = time.perf_counter()
+        try:
+            conn = self._connection()
+            conn.request(method, path, body=payload, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+        except (OSError, http.client.HTTPException):
+            self._conn = None          # reconnect on the next call
+            self.recorder.add(label, time.perf_counter() - started, ok=False)
+            return None, None
+        self.recorder.add(
+            label, time.perf_counter() - started, ok=resp.status in expect, throttled=resp.status == 429,
+        )
+
+        data = None
+        if raw and resp.getheader("Content-Type", "").startswith("application/json"):
+            data = json.loads(raw)
+        return resp.status, data
+
+    def get(self, label, path, params=None, **kwargs):
+        if params:
+            path = f"{path}?{urlencode(params)}"
+        return self.request(label, "GET", path, **kwargs)
+
+    def post(self, label, path, body, **kwargs):
+        return self.request(label, "POST", path, body=body, **kwargs)
+
+    def login(self, email, password, strict=True):
+        """Log in and keep the access token; None (or RuntimeError if strict) on failure."""
+        status, data = self.post("login", "/api/login/", {"email": email, "password": password}, auth=False)
+        if status != 200:
+            if strict:
+                raise RuntimeError(f"login as {email} failed ({status}): {data}")
+            return None
+        self.token = data["access"]
+        return data
+
+
+class Scenario:
+    name = None
+
+    def __init__(self, client, manifest, worker):
+        self.client = client
+        self.manifest = manifest
+        self.worker = worker
+        self.rng = random.Random(worker)
+
+    def setup(self):
+        pass
+
+    def step(self):
+        raise NotImplementedError
+
+
+class CatalogueBrowse(Scenario):
+    """Anonymous visitor: first pages of the catalogue, a filter, the categories."""
+    name = "browse"
+
+    def step(self):
+        status, page = self.client.get("courses:list", "/api/courses/", {"page_size": 20})
+        for _ in range(2):
+            if not page or not page.get("next"):
+                break
+            next_url = urlsplit(page["next"])
+            status, page = self.client.get("courses:next", f"{next_url.path}?{next_url.query}")
+        self.client.get("courses:filtered", "/api/courses/", {"level": "beginner", "tags": "python", "ordering": "price"})
+        self.client.get("categories:list", "/api/categories/")
+
+
+class CourseDetail(Scenario):
+    """Anonymous visitor opening random course pages."""
+    name = "course_detail"
+
+    def step(self):
+        course = self.rng.choice(self.manifest["courses"])
+        self.client.get("courses:detail", f"/api/courses/{course}/")
+
+
+class LessonListing(Scenario):
+    """Enrolled student paging through a curriculum and opening lessons."""
+    name = "lessons"
+
+    def setup(self):
+        student = self.manifest["students"][self.worker % len(self.manifest["students"])]
+        self.client.login(student, self.manifest["password"])
+        self.courses = self.manifest["courses"]
+
+    def step(self):
+        course = self.rng.choice(self.courses)
+        status, page = self.client.get("lessons:list", f"/api/courses/{course}/lessons/", {"page_size": 20})
+        results = (page or {}).get("results") or []
+        if results:
+            lesson = self.rng.choice(results)["id"]
+            # 403 is expected for lessons of courses the student isn't enrolled in
+            self.client.get("lessons:detail", f"/api/courses/{course}/lessons/{lesson}/", expect=(200, 403))
+
+
+class LoginRefresh(Scenario):
+    """Password login followed by a token refresh."""
+    name = "auth"
+
+    def step(self):
+        email = self.rng.choice(self.manifest["students"])
+        tokens = self.client.login(email, self.manifest["password"], strict=False)
+        if tokens:
+            self.client.post("token:refresh", "/api/token/refresh/", {"refresh": tokens["refresh"]}, auth=False)
+
+
+class Registration(Scenario):
+    """New sign-ups with unique emails."""
+    name = "register"
+
+    def setup(self):
+        self.seq = itertools.count()
+        self.run = int(time.time())
+
+    def step(self):
+        n = next(self.seq)
+        email = f"bench-signup-{self.run}-{self.worker}-{n}@bench.local"
+        self.client.post(
+            "register", "/api/users/register/",
+            {"email": email, "username": email.split("@")[0],
+             "password": "Bench-pass-123!", "password2": "Bench-pass-123!"},
+            expect=(201,), auth=False,
+        )
+
+
+class Search(Scenario):
+    """Full-text search with a few common words."""
+    name = "search"
+    TERMS = ("python", "django web", "sql data", "devops")
+
+    def step(self):
+        self.client.get("search", "/api/search/", {"q": self.rng.choice(self.TERMS)})
+
+
+SCENARIOS = {cls.name: cls for cls in (CatalogueBrowse, CourseDetail, LessonListing, LoginRefresh, Registration, Search)}
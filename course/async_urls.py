@@ -0,0 +1,10 @@
+from django.urls import path
+from course import async_views
+
+# Mounted at /api/async/: async twins of the catalogue read endpoints
+urlpatterns = [
+    path('courses/', async_views.course_list, name='async-course-list'),
+    path('courses/<int:pk>/', async_views.course_detail, name='async-course-detail'),
+    path('courses/<int:course_pk>/lessons/', async_views.lesson_list, name='async-lesson-list'),
+    path('categories/', async_views.category_list, name='async-category-list'),
+]
@@ -0,0 +1,144 @@
+"""
+Async (ASGI) read path for the catalogue, mounted under /api/async/.
+
+Same payloads, filters, ordering, ?fields= / ?expand= projection and
+cursors as the DRF endpoints under /api/: the DRF viewsets still build the
+querysets, paginators and serializers, but the rows are fetched with the
+async ORM and the response cache is read with the async cache API. Under
+an ASGI server a slow client then holds a cheap coroutine rather than a
+worker thread.
+
+Read-only. Course and category reads are public and cached like their DRF
+twins (versioned keys, ETag / 304); the lesson list honours a Bearer token
+so enrolled students see the whole curriculum.
+"""
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404, HttpResponse, HttpResponseNotAllowed, JsonResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.utils.encoders import JSONEncoder
+
+from backend.db_router import primary_reads
+from course.cache import aget_versions, etag_for, response_key
+from course.pagination import LessonPagination
+from course.views import CategoryViewSet, CourseViewSet
+from enrollments.access import acan_access_course
+from lessons.lesson_serializers import LessonSerializer
+from lessons.models import Lesson
+from users.authentication import ClaimsJWTAuthentication
+
+
+# ─── Plumbing ──────────────────────────────────────────────────────────────
+def _json(data, status=200):
+    return JsonResponse(data, status=status, encoder=JSONEncoder, safe=False)
+
+
+def async_api(view):
+    """GET/HEAD only; DRF and ORM errors become the same JSON errors DRF sends."""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return HttpResponseNotAllowed(["GET", "HEAD"])
+        try:
+            return await view(request, *args, **kwargs)
+        except APIException as exc:
+            detail = exc.detail if isinstance(exc.detail, (dict, list)) else {"detail": exc.detail}
+            return _json(detail, status=exc.status_code)
+        except (Http404, ObjectDoesNotExist):
+            return _json({"detail": "Not found."}, status=404)
+    wrapper.read_from_replica = True   # read-only: replicas may serve it (backend/db_router.py)
+    return wrapper
+
+
+def _viewset(viewset_class, request, action, **kwargs):
+    """A DRF viewset instance, used only to build querysets and serializers."""
+    drf_request = Request(request)
+    view = viewset_class(
+        action=action, request=drf_request, args=(), kwargs=kwargs, format_kwarg=None,
+    )
+    return view, drf_request
+
+
+async def _cached(request, cache_models, parts, build):
+    """Async twin of VersionedCacheMixin._cached (course/cache.py)."""
+    key = response_key(request, await aget_versions(cache_models), "async", *parts)
+    entry = await cache.aget(key)
+    if entry is None:
+        with primary_reads():   # never cache a lagging replica's rows
+            data = await build()
+        entry = (etag_for(data), data)
+        await cache.aset(key, entry, settings.API_CACHE_TIMEOUT)
+
+    etag, data = entry
+    if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+    if etag in if_none_match or if_none_match == ["*"]:
+        response = HttpResponse(status=304)
+    else:
+        response = _json(data)
+    response["ETag"] = etag
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+async def _authenticate(request):
+    if "HTTP_AUTHORIZATION" not in request.META:
+        return AnonymousUser()
+    # claims-only tokens need no query; older tokens may hit the user cache / DB
+    result = await sync_to_async(ClaimsJWTAuthentication().authenticate)(Request(request))
+    return result[0] if result else AnonymousUser()
+
+
+# ─── Views ─────────────────────────────────────────────────────────────────
+@async_api
+async def course_list(request):
+    async def build():
+        view, drf_request = _viewset(CourseViewSet, request, "list")
+        queryset = view.filter_queryset(view.get_queryset())
+        page = await view.paginator.apaginate_queryset(queryset, drf_request, view)
+        return view.paginator.get_paginated_response(view.get_serializer(page, many=True).data).data
+
+    return await _cached(request, CourseViewSet.cache_models, ("courses", "list"), build)
+
+
+@async_api
+async def course_detail(request, pk):
+    async def build():
+        view, _ = _viewset(CourseViewSet, request, "retrieve", pk=pk)
+        course = await view.get_queryset().aget(pk=pk)
+        return view.get_serializer(course).data
+
+    return await _cached(request, CourseViewSet.cache_models, ("courses", "retrieve"), build)
+
+
+@async_api
+async def category_list(request):
+    async def build():
+        view, _ = _viewset(CategoryViewSet, request, "list")
+        categories = [category async for category in view.get_queryset().aiterator()]
+        return view.get_serializer(categories, many=True).data
+
+    return await _cached(request, CategoryViewSet.cache_models, ("categories", "list"), build)
+
+
+@async_api
+async def lesson_list(request, course_pk):
+    user = await _authenticate(request)
+    queryset = Lesson.objects.filter(course_id=course_pk).defer("search_vector")
+    if not await acan_access_course(user, course_pk):
+        queryset = queryset.filter(is_preview=True)   # outsiders see the previews only
+
+    drf_request = Request(request)
+    paginator = LessonPagination()
+    page = await paginator.apaginate_queryset(queryset, drf_request)
+    data = LessonSerializer(page, many=True, context={"request": drf_request}).data
+    response = _json(paginator.get_paginated_response(data).data)
+    patch_vary_headers(response, ["Authorization"])
+    return response
@@ -0,0 +1,375 @@
+"""
+Bulk catalogue import / export shared by the bulk API endpoints and the
+`import_catalogue` / `export_catalogue` management commands.
+
+Records are streamed (JSON Lines or CSV), validated a batch at a time with
+the bulk row serializers, and written with bulk_create / bulk_update inside
+one transaction: a 500-lesson import costs a handful of queries, and any bad
+row rolls the whole import back.
+"""
+import codecs
+import csv
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, transaction
+from django.db.models import Max
+from rest_framework.exceptions import ValidationError
+
+from course.cache import bump_version
+from course.models import Category, Course
+from course.stats import recount_course_stats
+from course.serializers.course_serializers import CourseBulkSerializer
+from lessons.lesson_serializers import LessonBulkSerializer
+from lessons.models import Lesson
+
+User = get_user_model()
+
+# ArrayField columns are written to CSV as "a|b|c"
+CSV_LIST_FIELDS = {"tags"}
+CSV_LIST_SEPARATOR = "|"
+
+# Stop collecting row errors after this many; the import fails either way.
+MAX_REPORTED_ERRORS = 50
+
+JSONL_CONTENT_TYPES = {"application/x-ndjson", "application/jsonl", "application/x-jsonlines"}
+CSV_CONTENT_TYPES = {"text/csv"}
+
+
+class BulkImportError(ValidationError):
+    """400 listing the failing rows; row numbers stay ints in the payload."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.detail = {"errors": errors}
+
+
+# ─── Reading ───────────────────────────────────────────────────────────────
+def read_records(lines, fmt):
+    """Yield one dict per record from an iterable of text lines."""
+    if fmt == "jsonl":
+        for number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                raise BulkImportError([{"row": number, "errors": "Invalid JSON."}])
+    elif fmt == "csv":
+        for row in csv.DictReader(lines):
+            record = {}
+            for key, value in row.items():
+                if value in ("", None):
+                    continue            # let the serializer apply defaults
+                if key in CSV_LIST_FIELDS:
+                    value = [v for v in value.split(CSV_LIST_SEPARATOR) if v]
+                record[key] = value
+            yield record
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def request_records(request):
+    """
+    Records from an API request body: a JSON array, or JSON Lines / CSV which
+    are decoded line by line straight off the request stream.
+    """
+    content_type = request.content_type.split(";")[0].strip().lower()
+    if content_type in JSONL_CONTENT_TYPES | CSV_CONTENT_TYPES:
+        fmt = "csv" if content_type in CSV_CONTENT_TYPES else "jsonl"
+        lines = codecs.iterdecode(request.stream or [], "utf-8")
+        return read_records(lines, fmt)
+
+    if not isinstance(request.data, list):
+        raise ValidationError({"detail": "Expected a JSON array, JSON Lines or CSV body."})
+    return request.data
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+# ─── Writing ───────────────────────────────────────────────────────────────
+class _Echo:
+    """File-like object whose write() just returns the line (for csv.writer)."""
+    def write(self, value):
+        return value
+
+
+def write_records(rows, fields, fmt):
+    """Yield the export one line at a time from an iterable of dicts."""
+    if fmt == "jsonl":
+        for row in rows:
+            yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+    elif fmt == "csv":
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow([
+                CSV_LIST_SEPARATOR.join(row[f]) if f in CSV_LIST_FIELDS else row[f]
+                for f in fields
+            ])
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def export_fields(model):
+    """Concrete columns worth exporting (FKs come out as plain ids)."""
+    return [f.name for f in model._meta.concrete_fields if f.name != "search_vector"]
+
+
+EXPORT_MODELS = {"category": Category, "course": Course, "lesson": Lesson}
+
+
+def export_rows(model, fields=None, chunk_size=None, **filters):
+    """
+    Plain dicts in primary-key order, fetched `chunk_size` rows at a time
+    through a server-side cursor: memory stays flat however big the table.
+    """
+    fields = fields or export_fields(model)
+    rows = model.objects.filter(**filters).order_by("pk").values(*fields)
+    return rows.iterator(chunk_size=chunk_size or settings.EXPORT_CHUNK_SIZE)
+
+
+# ─── Importing ─────────────────────────────────────────────────────────────
+class BulkImporter:
+    """
+    Validate `records` in batches and write them in one transaction.
+
+    Records with an `id` update that row, which must exist inside `scope`
+    (an unknown id is a row error, not a new row); records without one are
+    created. Subclasses add set-based checks per batch in
+    `check_batch()` instead of letting the serializer query once per row.
+    """
+    model = None
+    serializer_class = None
+    cache_version = None
+
+    def __init__(self, batch_size=None, scope=None):
+        self.batch_size = batch_size or settings.BULK_IMPORT_BATCH_SIZE
+        self.scope = scope or {}        # e.g. {"course_id": 3} for lessons
+
+    def run(self, records):
+        errors = []
+        try:
+            with transaction.atomic():
+                self._import(records, errors)
+                if errors:
+                    raise BulkImportError(errors[:MAX_REPORTED_ERRORS])
+                self.finalize()
+        except IntegrityError as exc:
+            # whatever the per-batch checks could not see (concurrent writers)
+            raise BulkImportError([{"row": None, "errors": str(exc).splitlines()[0]}])
+
+        if self.cache_version:
+            # bulk writes skip Model.save(), so invalidate explicitly
+            bump_version(self.cache_version)
+        return {"created": self.created, "updated": self.updated}
+
+    def _import(self, records, errors):
+        self.created = self.updated = 0
+        row_offset = 0
+        for batch in chunked(records, self.batch_size):
+            batch = [{**record, **self._scope_data()} for record in batch]
+            serializer = self.serializer_class(data=batch, many=True)
+            if serializer.is_valid():
+                rows = serializer.validated_data
+                batch_errors = {**self.check_batch(rows), **self._check_ids(rows)}
+            else:
+                rows = None
+                batch_errors = self._row_errors(serializer.errors)
+
+            for index, error in sorted(batch_errors.items()):
+                errors.append({"row": row_offset + index + 1, "errors": error})
+            row_offset += len(batch)
+
+            if errors:
+                if len(errors) >= MAX_REPORTED_ERRORS:
+                    break
+                continue            # keep validating, but stop writing
+
+            created, updated = self.write_batch(rows)
+            self.created += created
+            self.updated += updated
+
+    def finalize(self):
+        """Last chance to check deferred constraints inside the transaction."""
+
+    def _scope_data(self):
+        return {}
+
+    @staticmethod
+    def _row_errors(errors):
+        # ListSerializer reports per-row errors as a list or as {index: error}
+        # depending on the DRF version
+        items = errors.items() if isinstance(errors, dict) else enumerate(errors)
+        return {index: error for index, error in items if error}
+
+    def check_batch(self, rows):
+        """Return {row_index: error} for rows that fail set-based checks."""
+        return {}
+
+    def _check_ids(self, rows):
+        # a mistyped id must not quietly become a duplicate new row
+        ids = {row["id"] for row in rows if row.get("id")}
+        if not ids:
+            return {}
+        known = set(
+            self.model.objects.filter(**self.scope, pk__in=ids).values_list("pk", flat=True)
+        )
+        return {
+            index: {"id": ["Invalid pk - object does not exist."]}
+            for index, row in enumerate(rows) if row.get("id") and row["id"] not in known
+        }
+
+    def write_batch(self, rows):
+        ids = [row["id"] for row in rows if row.get("id")]
+        existing = self.model.objects.filter(**self.scope).in_bulk(ids) if ids else {}
+
+        new, changed, fields = [], [], set()
+        for row in rows:
+            row = dict(row)
+            obj = existing.get(row.pop("id", None))
+            if obj is None:
+                new.append(self.model(**self.scope, **row))
+            else:
+                for name, value in row.items():
+                    setattr(obj, name, value)
+                fields.update(row)
+                changed.append(obj)
+
+        self.model.objects.bulk_create(new, batch_size=self.batch_size)
+        if changed:
+            self.model.objects.bulk_update(changed, sorted(fields), batch_size=self.batch_size)
+        return len(new), len(changed)
+
+
+class CourseImporter(BulkImporter):
+    model = Course
+    serializer_class = CourseBulkSerializer
+    cache_version = "course"
+
+    def check_batch(self, rows):
+        errors = {}
+        category_ids = {row["category_id"] for row in rows}
+        instructor_ids = {row["instructor_id"] for row in rows}
+
+        known_categories = set(
+            Category.objects.filter(pk__in=category_ids).values_list("pk", flat=True)
+        )
+        teachers = set(
+            User.objects.filter(pk__in=instructor_ids, role="teacher").values_list("pk", flat=True)
+        )
+        # (title, instructor) is unique: check the batch against itself and the DB
+        taken = {
+            (title, instructor): pk
+            for pk, title, instructor in Course.objects.filter(
+                title__in={row["title"] for row in rows}, instructor_id__in=instructor_ids,
+            ).values_list("pk", "title", "instructor_id")
+        }
+
+        seen = set()
+        for index, row in enumerate(rows):
+            key = (row["title"], row["instructor_id"])
+            if row["category_id"] not in known_categories:
+                errors[index] = {"category": ["Invalid pk - object does not exist."]}
+            elif row["instructor_id"] not in teachers:
+                errors[index] = {"instructor": ["Must be an existing teacher."]}
+            elif key in seen or taken.get(key, row.get("id")) != row.get("id"):
+                errors[index] = {"title": ["This instructor already has a course with this title."]}
+            seen.add(key)
+        return errors
+
+
+class LessonImporter(BulkImporter):
+    model = Lesson
+    serializer_class = LessonBulkSerializer
+    cache_version = "lesson"
+
+    def __init__(self, batch_size=None, scope=None):
+        super().__init__(batch_size, scope)
+        self.next_order = {}            # course_id -> first free position
+        self.touched = set()            # courses whose counters need a recount
+
+    def _scope_data(self):
+        # lessons posted under /courses/{id}/ belong to that course, whatever the body says
+        return {"course": self.scope["course_id"]} if "course_id" in self.scope else {}
+
+    def check_batch(self, rows):
+        errors = {}
+        course_ids = {row["course_id"] for row in rows}
+        if "course_id" not in self.scope:
+            known = set(Course.objects.filter(pk__in=course_ids).values_list("pk", flat=True))
+            errors = {
+                index: {"course": ["Invalid pk - object does not exist."]}
+                for index, row in enumerate(rows) if row["course_id"] not in known
+            }
+        errors.update(self._check_orders(rows, course_ids, errors))
+        return errors
+
+    def _check_orders(self, rows, course_ids, errors):
+        """
+        (course, order) is unique. Explicit positions must be free (or held by
+        a lesson this import also rewrites); rows without one are appended
+        after the course's last lesson.
+        """
+        next_order = self.next_order
+        unseen = course_ids - next_order.keys()
+        if unseen:
+            next_order.update({course_id: 0 for course_id in unseen})
+            next_order.update(
+                Lesson.objects.filter(course_id__in=unseen).values("course_id")
+                .annotate(last=Max("order") + 1).values_list("course_id", "last")
+            )
+
+        explicit = {(row["course_id"], row["order"]) for row in rows if "order" in row}
+        taken = {}
+        if explicit:
+            taken = {
+                (course_id, order): pk
+                for pk, course_id, order in Lesson.objects.filter(
+                    course_id__in={c for c, _ in explicit}, order__in={o for _, o in explicit},
+                ).values_list("pk", "course_id", "order")
+            }
+        rewritten = {row["id"] for row in rows if row.get("id")}
+
+        clashes, seen = {}, set()
+        for index, row in enumerate(rows):
+            if index in errors or "order" not in row:
+                continue
+            key = (row["course_id"], row["order"])
+            holder = taken.get(key)
+            if key in seen or (holder is not None and holder != row.get("id") and holder not in rewritten):
+                clashes[index] = {"order": ["Another lesson of this course already has this position."]}
+            seen.add(key)
+            next_order[key[0]] = max(next_order[key[0]], key[1] + 1)
+
+        for row in rows:
+            if "order" not in row and not row.get("id"):
+                row["order"] = next_order[row["course_id"]]
+                next_order[row["course_id"]] += 1
+        return clashes
+
+    def finalize(self):
+        Lesson.objects.enforce_unique_order()
+        # bulk writes skip the counter signals
+        recount_course_stats(self.touched)
+
+    def write_batch(self, rows):
+        self.touched.update(row["course_id"] for row in rows)
+        if "course_id" in self.scope:
+            rows = [{k: v for k, v in row.items() if k != "course_id"} for row in rows]
+        else:
+            # lessons moved to another course leave their old course behind
+            ids = [row["id"] for row in rows if row.get("id")]
+            if ids:
+                self.touched.update(
+                    Lesson.objects.filter(pk__in=ids).values_list("course_id", flat=True)
+                )
+        return super().write_batch(rows)
@@ -0,0 +1,132 @@
+"""
+Versioned response cache for the public catalogue reads.
+
+Every cached model family ("course", "category", ...) has a version counter
+in the cache. Cached responses are keyed by the versions they were built
+from, so a write never has to find and delete stale entries: bumping the
+counter simply makes every old key unreachable and they age out on their own.
+
+The backend is whatever CACHES["default"] points at — local memory in dev
+and tests, Redis in production (CACHE_URL=redis://...).
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
+
+from backend.db_router import primary_reads
+
+VERSION_KEY = "api:version:{}"
+RESPONSE_KEY = "api:response:{}"
+
+
+# ─── Version counters ──────────────────────────────────────────────────────
+def get_versions(names):
+    """Return the current version of each name, in order (one cache round trip)."""
+    keys = [VERSION_KEY.format(name) for name in names]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            # Seed from the clock, not 1: if the counter was evicted, restarting
+            # at 1 could resurrect responses cached under an old "1".
+            cache.add(key, time.time_ns(), timeout=None)
+            found[key] = cache.get(key)
+    return tuple(found[key] for key in keys)
+
+
+async def aget_versions(names):
+    """`get_versions` for async views (course/async_views.py)."""
+    keys = [VERSION_KEY.format(name) for name in names]
+    found = await cache.aget_many(keys)
+    for key in keys:
+        if key not in found:
+            await cache.aadd(key, time.time_ns(), timeout=None)
+            found[key] = await cache.aget(key)
+    return tuple(found[key] for key in keys)
+
+
+def _incr(name):
+    key = VERSION_KEY.format(name)
+    try:
+        cache.incr(key)
+    except ValueError:  # counter missing / evicted
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def bump_version(name):
+    """
+    Invalidate every cached response built from `name`.
+
+    Bumps now and once more after the surrounding transaction commits, so a
+    reader that races the write can't re-cache the pre-commit rows under the
+    new version.
+    """
+    _incr(name)
+    transaction.on_commit(lambda: _incr(name))
+
+
+# ─── Viewset mixin ─────────────────────────────────────────────────────────
+class VersionedCacheMixin:
+    """
+    Cache list/retrieve responses for anonymous GETs and answer
+    `If-None-Match` with 304 when the ETag still matches.
+
+    Set `cache_models` to the version names the response depends on.
+    """
+    cache_models = ()
+
+    def list(self, request, *args, **kwargs):
+        return self._cached(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self._cached(super().retrieve, request, *args, **kwargs)
+
+    def _cached(self, handler, request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD") or request.user.is_authenticated:
+            return handler(request, *args, **kwargs)
+
+        key = self._response_key(request)
+        entry = cache.get(key)
+        if entry is None:
+            with primary_reads():   # never cache a lagging replica's rows
+                response = handler(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            entry = (self._etag(response.data), response.data)
+            cache.set(key, entry, settings.API_CACHE_TIMEOUT)
+        else:
+            response = Response(entry[1])
+
+        etag = entry[0]
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if etag in if_none_match or if_none_match == ["*"]:
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        response["ETag"] = etag
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+    def _response_key(self, request):
+        return response_key(request, get_versions(self.cache_models), self.basename, self.action)
+
+    @staticmethod
+    def _etag(data):
+        return etag_for(data)
+
+
+# ─── Shared by the sync mixin and the async views ──────────────────────────
+def response_key(request, versions, *parts):
+    raw = "|".join([*parts, str(versions), request.get_host(), request.get_full_path()])
+    return RESPONSE_KEY.format(hashlib.md5(raw.encode()).hexdigest())
+
+
+def etag_for(data):
+    body = json.dumps(data, cls=JSONEncoder, sort_keys=True).encode()
+    return '"%s"' % hashlib.md5(body).hexdigest()
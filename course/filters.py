@@ -0,0 +1,91 @@
+from decimal import Decimal, InvalidOperation
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend, OrderingFilter
+
+
+def split_param(value):
+    """'a, b,,c' → ['a', 'b', 'c']"""
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+class CourseFilterBackend(BaseFilterBackend):
+    """
+    Query-parameter filters for the course catalogue (list only):
+
+        ?level=beginner,intermediate   → level IN (...)
+        ?type=paid                     → type IN (...)
+        ?category=3  /  ?category=web  → by category id or slug
+        ?tags=python,django            → tags @> {python,django}   (GIN)
+        ?tags_any=python,go            → tags && {python,go}       (GIN)
+        ?price_min=10&price_max=50     → price range
+        ?is_active=true
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if getattr(view, "action", None) != "list":
+            return queryset
+
+        params = request.query_params
+
+        levels = split_param(params.get("level"))
+        if levels:
+            queryset = queryset.filter(level__in=levels)
+
+        types = split_param(params.get("type"))
+        if types:
+            queryset = queryset.filter(type__in=types)
+
+        category = params.get("category")
+        if category:
+            if category.isdigit():
+                queryset = queryset.filter(category_id=int(category))
+            else:
+                queryset = queryset.filter(category__slug=category)
+
+        tags = split_param(params.get("tags"))
+        if tags:
+            queryset = queryset.filter(tags__contains=tags)
+
+        tags_any = split_param(params.get("tags_any"))
+        if tags_any:
+            queryset = queryset.filter(tags__overlap=tags_any)
+
+        price_min = self._decimal(params, "price_min")
+        if price_min is not None:
+            queryset = queryset.filter(price__gte=price_min)
+
+        price_max = self._decimal(params, "price_max")
+        if price_max is not None:
+            queryset = queryset.filter(price__lte=price_max)
+
+        is_active = params.get("is_active")
+        if is_active is not None:
+            queryset = queryset.filter(is_active=is_active.lower() in ("1", "true", "yes"))
+
+        return queryset
+
+    @staticmethod
+    def _decimal(params, name):
+        value = params.get(name)
+        if value in (None, ""):
+            return None
+        try:
+            return Decimal(value)
+        except InvalidOperation:
+            raise ValidationError({name: "A valid number is required."})
+
+
+class CourseOrderingFilter(OrderingFilter):
+    """
+    ?ordering=price / -created_at / title ...
+
+    Always appends `id` as a tiebreaker so the keyset cursor (which is built
+    from this ordering) stays unique when many rows share a price or title.
+    """
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if ordering and not {"id", "-id"} & set(ordering):
+            ordering = [*ordering, "id"]
+        return ordering
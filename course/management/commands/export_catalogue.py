@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from course.bulk import EXPORT_MODELS as MODELS, export_fields, export_rows, write_records
+
+
+class Command(BaseCommand):
+    help = "Stream courses, lessons or categories to JSON Lines or CSV in constant memory."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--model", choices=sorted(MODELS), default="course")
+        parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+        parser.add_argument("--output", default="-", help="output file, or '-' for stdout")
+        parser.add_argument("--chunk-size", type=int, help="default: EXPORT_CHUNK_SIZE")
+
+    def handle(self, *args, **options):
+        model = MODELS[options["model"]]
+        fields = export_fields(model)
+        rows = export_rows(model, fields, chunk_size=options["chunk_size"])
+
+        if options["output"] == "-":
+            for line in write_records(rows, fields, options["format"]):
+                self.stdout.write(line, ending="")
+            return
+
+        with open(options["output"], "w", newline="", encoding="utf-8") as out:
+            for line in write_records(rows, fields, options["format"]):
+                out.write(line)
@@ -0,0 +1,45 @@
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from course.bulk import CourseImporter, LessonImporter, read_records
+
+IMPORTERS = {"course": CourseImporter, "lesson": LessonImporter}
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk-import courses or lessons from a JSON Lines or CSV file "
+        "(use '-' for stdin). Rows with an existing id are updated."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="input file, or '-' for stdin")
+        parser.add_argument("--model", choices=sorted(IMPORTERS), default="course")
+        parser.add_argument("--format", choices=("jsonl", "csv"),
+                            help="defaults to the file extension")
+        parser.add_argument("--course", type=int,
+                            help="attach every lesson to this course id")
+        parser.add_argument("--batch-size", type=int)
+
+    def handle(self, *args, **options):
+        path, fmt = options["path"], options["format"]
+        if fmt is None:
+            fmt = "csv" if path.endswith(".csv") else "jsonl"
+
+        scope = {"course_id": options["course"]} if options["course"] else None
+        importer = IMPORTERS[options["model"]](batch_size=options["batch_size"], scope=scope)
+
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            result = importer.run(read_records(stream, fmt))
+        except ValidationError as exc:
+            raise CommandError(f"Import failed, nothing was written: {exc.detail}")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['model']}: {result['created']} created, {result['updated']} updated"
+        ))
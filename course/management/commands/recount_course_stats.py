@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from course.stats import recount_course_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the denormalised course counters (lessons, previews, "
+        "enrollments) from the source tables and fix any that drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--course", type=int, action="append", dest="courses",
+                            help="only this course id (repeatable)")
+
+    def handle(self, *args, **options):
+        fixed = recount_course_stats(options["courses"])
+        self.stdout.write(self.style.SUCCESS(f"{fixed} course(s) corrected"))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0002_alter_course_banner'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['-created_at', 'id'], name='course_cour_created_e78d14_idx'),
+        ),
+    ]
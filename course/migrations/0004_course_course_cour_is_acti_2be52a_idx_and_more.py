@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:58
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0003_course_course_cour_created_e78d14_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['is_active', 'type', 'level', '-created_at'], name='course_cour_is_acti_2be52a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['tags'], name='course_cour_tags_fa1595_gin'),
+        ),
+    ]
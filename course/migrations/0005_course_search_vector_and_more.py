@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+# The vector is filled by a trigger rather than in Course.save() so that
+# bulk_create / queryset.update() and raw SQL writes keep it in sync as well.
+SEARCH_TRIGGER_SQL = """
+CREATE FUNCTION course_course_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(array_to_string(NEW.tags, ' '), '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.description, '')), 'B') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.syllabus, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER course_course_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, tags, description, syllabus
+    ON course_course
+    FOR EACH ROW EXECUTE FUNCTION course_course_search_vector_update();
+
+-- backfill existing rows
+UPDATE course_course SET title = title;
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS course_course_search_vector_trigger ON course_course;
+DROP FUNCTION IF EXISTS course_course_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0004_course_course_cour_is_acti_2be52a_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='course_cour_search__960fe0_gin'),
+        ),
+        migrations.RunSQL(SEARCH_TRIGGER_SQL, DROP_SEARCH_TRIGGER_SQL),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:22
+
+from django.db import migrations, models
+
+# Backfill the new counters; afterwards signals keep them current.
+BACKFILL = """
+UPDATE course_course c SET
+    lesson_count     = (SELECT count(*) FROM lessons_lesson l WHERE l.course_id = c.id),
+    preview_count    = (SELECT count(*) FROM lessons_lesson l WHERE l.course_id = c.id AND l.is_preview),
+    enrollment_count = (SELECT count(*) FROM enrollments_enrollment e
+                        WHERE e.course_id = c.id AND e.status IN ('active', 'completed'));
+"""
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0005_course_search_vector_and_more'),
+        ('lessons', '0004_unique_course_order'),
+        ('enrollments', '0002_lessonprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='enrollment_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='lesson_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='course',
+            name='preview_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+    ]
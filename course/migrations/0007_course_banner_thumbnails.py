@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0006_course_counters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='banner_thumbnails',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:43
+
+from django.db import migrations, models
+
+# Backfill the new counter; afterwards signals and the media worker keep it current.
+BACKFILL = """
+UPDATE course_course c SET
+    total_duration_seconds = COALESCE(
+        (SELECT sum(l.duration_seconds) FROM lessons_lesson l WHERE l.course_id = c.id), 0);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0007_course_banner_thumbnails'),
+        ('lessons', '0005_lesson_duration_seconds_lesson_poster'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='course',
+            name='total_duration_seconds',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunSQL(BACKFILL, migrations.RunSQL.noop),
+    ]
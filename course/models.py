@@ -4,7 +4,10 @@ from django.utils.text import slugify
 from django.core.validators import MinValueValidator
 from django.core.exceptions import ValidationError
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth import get_user_model
+from course.cache import bump_version
 User = get_user_model()
 
 # ---------------------------------------------------------------------------
@@ -27,6 +30,12 @@ class Category(models.Model):
         if not self.slug:
             self.slug = slugify(self.title)
         super().save(*args, **kwargs)
+        bump_version("category")
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_version("category")
+        return result
 
 
 # ---------------------------------------------------------------------------
@@ -48,6 +57,9 @@ class Course(models.Model):
     title       = models.CharField(max_length=255)
     description = models.TextField()
     banner = models.ImageField(upload_to="course_banners/", null=True, blank=True)
+    # {"320": "course_banners/thumbs/x-320.webp", ...}, written by the media
+    # worker (uploads/jobs.py) whenever the banner changes
+    banner_thumbnails = models.JSONField(default=dict, blank=True, editable=False)
 
 
     price       = models.DecimalField(
@@ -97,6 +109,21 @@ class Course(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # ─── Denormalised counters ──────────────────────────────────────────────
+    # Kept current with F() updates from lesson / enrollment signals (see
+    # course/stats.py) so listings show them without a COUNT per row;
+    # `manage.py recount_course_stats` repairs any drift.
+    lesson_count     = models.PositiveIntegerField(default=0, editable=False)
+    preview_count    = models.PositiveIntegerField(default=0, editable=False)
+    enrollment_count = models.PositiveIntegerField(default=0, editable=False)
+    # sum of the lessons' video lengths (Lesson.duration_seconds)
+    total_duration_seconds = models.PositiveIntegerField(default=0, editable=False)
+
+    # ─── Full-text search ───────────────────────────────────────────────────
+    # Maintained by a database trigger (see migration 0005) from title,
+    # tags, description and syllabus, so bulk writes keep it fresh too.
+    search_vector = SearchVectorField(null=True, editable=False)
+
     # ─── Meta & indexes ─────────────────────────────────────────────────────
     class Meta:
         ordering = ("-created_at",)
@@ -104,6 +131,10 @@ class Course(models.Model):
             models.Index(fields=("type",)),
             models.Index(fields=("level",)),
             models.Index(fields=("category", "is_active")),
+            models.Index(fields=("-created_at", "id")),   # keyset pagination
+            models.Index(fields=("is_active", "type", "level", "-created_at")),  # catalogue browse
+            GinIndex(fields=("tags",)),                    # tags @> / && filters
+            GinIndex(fields=("search_vector",)),           # full-text search
         ]
         unique_together = ("title", "instructor")      # optional: avoid dup titles per teacher
 
@@ -127,5 +158,24 @@ class Course(models.Model):
         """Return True if the course requires payment."""
         return self.type == self.CourseType.PAID
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remembered so the media signals can tell whether the banner changed
+        banner = instance.__dict__.get("banner")
+        instance._loaded = {"banner": getattr(banner, "name", banner)}
+        return instance
+
+    # ─── Cache invalidation ────────────────────────────────────────────────
+    # Any write (including the `publish` action) invalidates cached reads.
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        bump_version("course")
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_version("course")
+        return result
+
     def __str__(self) -> str:
         return self.title
\ No newline at end of file
@@ -0,0 +1,158 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.utils.urls import remove_query_param
+
+
+def _reverse_ordering(ordering):
+    return tuple(f[1:] if f.startswith("-") else f"-{f}" for f in ordering)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    True keyset pagination over a composite ordering such as (-created_at, id).
+
+    DRF's CursorPagination only filters on the first ordering field and falls
+    back to OFFSET for ties. Here the cursor stores the *whole* ordering tuple
+    of the last row, so every page is a single
+    `WHERE (a, b) > (x, y) ORDER BY a, b LIMIT n+1` query no matter how deep.
+
+    Cursors stay opaque (base64) and the page size can be tuned with
+    ?page_size=, capped by REST_FRAMEWORK["MAX_PAGE_SIZE"].
+    """
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self):
+        return settings.REST_FRAMEWORK.get("MAX_PAGE_SIZE", 100)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        queryset = self._page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self._set_page(list(queryset))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """`paginate_queryset` for async views: the page is fetched with the async ORM."""
+        queryset = self._page_queryset(queryset, request, view)
+        if queryset is None:
+            return None
+        return self._set_page([row async for row in queryset])
+
+    def _page_queryset(self, queryset, request, view):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        self.reverse = bool(self.cursor and self.cursor.reverse)
+        ordering = _reverse_ordering(self.ordering) if self.reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+
+        if self.cursor and self.cursor.position is not None:
+            values = self._decode_position(self.cursor.position)
+            try:
+                queryset = queryset.filter(self._after(ordering, values))
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+
+        # Fetch one extra row to learn whether another page follows.
+        return queryset[:self.page_size + 1]
+
+    def _set_page(self, results):
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.cursor is not None
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    # ─── Links ──────────────────────────────────────────────────────────────
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        position = self._encode_position(self.page[-1])
+        return self.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        position = self._encode_position(self.page[0])
+        return self.encode_cursor(Cursor(offset=0, reverse=True, position=position))
+
+    # ─── Keyset helpers ─────────────────────────────────────────────────────
+    def _after(self, ordering, values):
+        """
+        Build `(a, b, ...) > (x, y, ...)` honouring per-field direction:
+        (a > x) OR (a = x AND b > y) OR ...
+        """
+        condition = Q()
+        equal = {}
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return condition
+
+    def _encode_position(self, instance):
+        values = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(value.isoformat() if hasattr(value, "isoformat") else str(value))
+        return json.dumps(values)
+
+    def _decode_position(self, position):
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+
+class CoursePagination(KeysetCursorPagination):
+    ordering = ("-created_at", "id")
+
+
+class LessonPagination(KeysetCursorPagination):
+    ordering = ("order", "id")
+
+
+class EnrollmentPagination(KeysetCursorPagination):
+    ordering = ("-created_at", "id")
+
+
+class SearchPagination(PageNumberPagination):
+    """
+    Ranked search results can't be keyset-paged on a stable key, and nobody
+    reads page 500 of a search anyway, so plain ?page= numbering is used.
+    """
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self):
+        return settings.REST_FRAMEWORK.get("MAX_PAGE_SIZE", 100)
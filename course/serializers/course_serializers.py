@@ -2,15 +2,100 @@ from rest_framework import serializers
 from course.models import Course
 
 
-class CourseSerializer(serializers.ModelSerializer):
+class FieldProjectionMixin:
+    """
+    Let the caller narrow a serializer to a subset of its fields:
+
+        CourseSerializer(qs, many=True, fields=["id", "title"])
+
+    `model_columns()` maps the remaining fields back to model columns so the
+    view can hand them to `QuerySet.only()` and keep the SELECT just as narrow.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop("fields", None)
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def model_columns(cls, names):
+        model = cls.Meta.model
+        concrete = {f.name for f in model._meta.concrete_fields}
+        columns = set()
+        for name in names:
+            source = cls._declared_fields.get(name)
+            source = getattr(source, "source", None) or name
+            if source.startswith("get_") and source.endswith("_display"):
+                source = source[len("get_"):-len("_display")]
+            source = source.split(".")[0]
+            if source in concrete:
+                columns.add(source)
+        return columns
+
+
+class ThumbnailURLsField(serializers.Field):
+    """{"320": "https://.../x-320.webp", ...} from the stored thumbnail names."""
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, names):
+        storage = Course._meta.get_field("banner").storage
+        request = self.context.get("request")
+        urls = {}
+        for width, name in sorted((names or {}).items(), key=lambda item: int(item[0])):
+            url = storage.url(name)
+            urls[width] = request.build_absolute_uri(url) if request is not None else url
+        return urls
+
+
+class CourseSerializer(FieldProjectionMixin, serializers.ModelSerializer):
     level_display = serializers.CharField(source="get_level_display", read_only=True)
     type_display  = serializers.CharField(source="get_type_display", read_only=True)
+    banner_thumbnails = ThumbnailURLsField()
 
     class Meta:
         model  = Course
-        fields = "__all__"
+        exclude = ("search_vector",)   # internal, maintained by a DB trigger
         read_only_fields = ("created_at", "updated_at")
 
-        
-    
 
+class CourseSummarySerializer(FieldProjectionMixin, serializers.ModelSerializer):
+    """
+    Compact card used by the catalogue list. Leaves out the heavy text blobs
+    (description, syllabus, feedback, prerequisites) and tags; clients can
+    pull any of them back in with ?expand=. The counters are plain columns,
+    so showing them costs no extra query. `banner_thumbnails` lets the card
+    load a small WebP instead of the full-size banner.
+    """
+    level_display = serializers.CharField(source="get_level_display", read_only=True)
+    type_display  = serializers.CharField(source="get_type_display", read_only=True)
+    banner_thumbnails = ThumbnailURLsField()
+
+    class Meta:
+        model  = Course
+        fields = (
+            "id", "title", "banner", "banner_thumbnails", "price",
+            "level", "level_display", "type", "type_display",
+            "duration", "category", "instructor", "is_active", "created_at",
+            "lesson_count", "preview_count", "enrollment_count", "total_duration_seconds",
+        )
+        read_only_fields = fields
+
+
+class CourseBulkSerializer(CourseSerializer):
+    """
+    Row serializer for bulk imports. Foreign keys are plain ids and the
+    per-row uniqueness validator is dropped: `CourseImporter` checks all of
+    that with one query per batch instead of several per row.
+    """
+    id         = serializers.IntegerField(required=False)
+    category   = serializers.IntegerField(source="category_id")
+    instructor = serializers.IntegerField(source="instructor_id")
+    banner     = serializers.CharField(required=False, allow_blank=True, allow_null=True)  # storage path
+
+    class Meta(CourseSerializer.Meta):
+        validators = []
@@ -0,0 +1,81 @@
+"""
+Denormalised course counters: lesson_count, preview_count, enrollment_count,
+and total_duration_seconds (the lessons' video lengths added up).
+
+Row-level writes adjust them incrementally with F() expressions (signal
+receivers in lessons/signals.py and enrollments/signals.py, and the media
+worker when it fills in a video's duration, uploads/jobs.py); bulk writes,
+which skip signals, call `recount_course_stats()` for the courses they
+touched. The `recount_course_stats` command runs the same reconciliation
+over the whole catalogue.
+
+The counters are rendered by the course list and detail, so every change
+bumps the "course" cache version (course/cache.py), after commit as well.
+"""
+from django.apps import apps
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from course.cache import bump_version
+
+COUNTERS = ("lesson_count", "preview_count", "enrollment_count", "total_duration_seconds")
+
+
+def adjust_course_counters(course_id, **deltas):
+    """adjust_course_counters(3, lesson_count=1, preview_count=-1) — one UPDATE."""
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    if not deltas or course_id is None:
+        return
+    Course = apps.get_model("course", "Course")
+    Course.objects.filter(pk=course_id).update(**{
+        # never below zero, even if a counter had drifted
+        name: Greatest(F(name) + delta, Value(0)) for name, delta in deltas.items()
+    })
+    bump_version("course")
+
+
+def _count(model, aggregate=None, **filters):
+    queryset = (
+        apps.get_model(*model.split(".")).objects
+        .filter(course=OuterRef("pk"), **filters)
+        .order_by().values("course").annotate(n=aggregate or Count("pk")).values("n")
+    )
+    return Coalesce(Subquery(queryset, output_field=IntegerField()), 0)
+
+
+def recount_course_stats(course_ids=None):
+    """
+    Recompute the counters from the source tables and write only the rows
+    that drifted. Returns the number of courses corrected.
+    """
+    Course = apps.get_model("course", "Course")
+    Enrollment = apps.get_model("enrollments", "Enrollment")
+
+    courses = Course.objects.all()
+    if course_ids is not None:
+        courses = courses.filter(pk__in=course_ids)
+    drifted = (
+        courses.annotate(
+            real_lesson_count=_count("lessons.Lesson"),
+            real_preview_count=_count("lessons.Lesson", is_preview=True),
+            real_enrollment_count=_count("enrollments.Enrollment", status__in=Enrollment.GRANTING),
+            real_total_duration_seconds=_count("lessons.Lesson", Sum("duration_seconds")),
+        )
+        .filter(
+            ~Q(lesson_count=F("real_lesson_count"))
+            | ~Q(preview_count=F("real_preview_count"))
+            | ~Q(enrollment_count=F("real_enrollment_count"))
+            | ~Q(total_duration_seconds=F("real_total_duration_seconds"))
+        )
+        .only("pk", *COUNTERS)
+    )
+
+    fixed = []
+    for course in drifted.iterator(chunk_size=1000):
+        for name in COUNTERS:
+            setattr(course, name, getattr(course, f"real_{name}"))
+        fixed.append(course)
+    Course.objects.bulk_update(fixed, COUNTERS, batch_size=1000)
+    if fixed:
+        bump_version("course")
+    return len(fixed)
@@ -0,0 +1,66 @@
+"""
+Fixture factory for the catalogue tests.
+
+    make = CatalogueFactory()
+    course = make.course()
+    make.lessons(course, 10)
+
+Every call gets fresh unique titles / emails, so the factory can keep
+growing a fixture between measurements (see QueryCountMixin).
+"""
+from itertools import count
+
+from django.contrib.auth import get_user_model
+
+from course.models import Category, Course
+from enrollments.models import Enrollment
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class CatalogueFactory:
+
+    def __init__(self):
+        self._seq = count(1)
+        self._teacher = None
+        self._category = None
+
+    def user(self, role="student", **fields):
+        n = next(self._seq)
+        return User.objects.create_user(
+            username=f"{role}{n}", email=f"{role}{n}@example.com",
+            password="pass123", role=role, **fields,
+        )
+
+    def teacher(self):
+        """The shared default instructor."""
+        if self._teacher is None:
+            self._teacher = self.user(role="teacher")
+        return self._teacher
+
+    def category(self, **fields):
+        fields.setdefault("title", f"Category {next(self._seq)}")
+        return Category.objects.create(**fields)
+
+    def default_category(self):
+        if self._category is None:
+            self._category = self.category()
+        return self._category
+
+    def course(self, **fields):
+        fields.setdefault("title", f"Course {next(self._seq)}")
+        fields.setdefault("description", "...")
+        fields.setdefault("instructor", self.teacher())
+        fields.setdefault("category", self.default_category())
+        return Course.objects.create(**fields)
+
+    def lessons(self, course, n, **fields):
+        start = Lesson.objects.next_order(course.pk)
+        return [
+            Lesson.objects.create(course=course, title=f"Lesson {next(self._seq)}", order=start + i, **fields)
+            for i in range(n)
+        ]
+
+    def enroll(self, student, course):
+        return Enrollment.objects.enroll(student.pk, course.pk)[0]
@@ -0,0 +1,33 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryCountMixin:
+    """
+    N+1 guard for APITestCase subclasses.
+
+    `assertConstantQueries(url, grow)` calls `grow(n)` to bring the fixture
+    up to each size in `sizes`, requests `url` after each step, and fails
+    if the number of SQL statements changes with the number of rows.
+    """
+    query_sizes = (2, 12)
+
+    def count_queries(self, url, method="get", **kwargs):
+        cache.clear()   # measure the real work, not a cached response / access check
+        with CaptureQueriesContext(connection) as ctx:
+            resp = getattr(self.client, method)(url, **kwargs)
+        self.assertLess(resp.status_code, 400, f"{method.upper()} {url} → {resp.status_code}")
+        return len(ctx.captured_queries), resp
+
+    def assertConstantQueries(self, url, grow, sizes=None, **kwargs):
+        sizes = sizes or self.query_sizes
+        counts = []
+        for n in sizes:
+            grow(n)
+            counts.append(self.count_queries(url, **kwargs)[0])
+        self.assertEqual(
+            len(set(counts)), 1,
+            f"{url}: {dict(zip(sizes, counts))} queries per row count — N+1?",
+        )
+        return counts[0]
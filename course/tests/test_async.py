@@ -0,0 +1,63 @@
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import TestCase
+from django.urls import reverse
+
+from course.tests.factories import CatalogueFactory
+from users.tokens import RoleRefreshToken
+
+
+class AsyncCatalogueTests(TestCase):
+    """/api/async/ serves the same payloads as the DRF endpoints under /api/."""
+
+    def setUp(self):
+        cache.clear()
+        self.make = CatalogueFactory()
+        self.courses = [self.make.course() for _ in range(3)]
+        self.lessons = self.make.lessons(self.courses[0], 2)
+        self.preview = self.make.lessons(self.courses[0], 1, is_preview=True)[0]
+
+    async def test_course_list_matches_sync(self):
+        expected = (await self.async_client.get(reverse("courses-list") + "?page_size=2")).json()
+        resp = await self.async_client.get(reverse("async-course-list") + "?page_size=2")
+        self.assertEqual(resp.status_code, 200)
+        body = resp.json()
+        self.assertEqual(body["results"], expected["results"])
+
+        # the cursor walks on the same keyset
+        following = await self.async_client.get(body["next"])
+        self.assertEqual(len(following.json()["results"]), 1)
+
+    async def test_course_list_rejects_unknown_fields(self):
+        resp = await self.async_client.get(reverse("async-course-list") + "?fields=password")
+        self.assertEqual(resp.status_code, 400)
+
+    async def test_course_detail_and_etag(self):
+        course = self.courses[0]
+        resp = await self.async_client.get(reverse("async-course-detail", args=[course.pk]))
+        self.assertEqual(resp.json()["title"], course.title)
+
+        again = await self.async_client.get(
+            reverse("async-course-detail", args=[course.pk]), headers={"If-None-Match": resp["ETag"]},
+        )
+        self.assertEqual(again.status_code, 304)
+
+        missing = await self.async_client.get(reverse("async-course-detail", args=[999999]))
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_category_list(self):
+        resp = await self.async_client.get(reverse("async-category-list"))
+        self.assertEqual([c["id"] for c in resp.json()], [self.make.default_category().pk])
+
+    async def test_lesson_list_honours_the_token(self):
+        url = reverse("async-lesson-list", args=[self.courses[0].pk])
+        anonymous = (await self.async_client.get(url)).json()
+        self.assertEqual([row["id"] for row in anonymous["results"]], [self.preview.pk])
+
+        token = await sync_to_async(RoleRefreshToken.for_user)(self.make.teacher())
+        owner = await self.async_client.get(url, headers={"Authorization": f"Bearer {token.access_token}"})
+        self.assertEqual(len(owner.json()["results"]), 3)
+
+    async def test_writes_are_not_allowed(self):
+        resp = await self.async_client.post(reverse("async-course-list"), {})
+        self.assertEqual(resp.status_code, 405)
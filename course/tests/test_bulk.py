@@ -0,0 +1,114 @@
+import io
+import json
+import os
+import tempfile
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class BulkImportTests(APITestCase):
+    """
+    Bulk endpoints and the import/export commands validate per batch and
+    write with bulk_create/bulk_update in one transaction.
+    """
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.other_teacher = User.objects.create_user(
+            username="other", email="other@example.com",
+            password="pass123", role="teacher",
+        )
+        self.admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="admin123",
+        )
+        self.category = Category.objects.create(title="Programming")
+        self.course = Course.objects.create(
+            title="Python 101", description="...",
+            category=self.category, instructor=self.teacher,
+        )
+        self.lessons_url = reverse("course-lessons-bulk", kwargs={"course_pk": self.course.pk})
+
+    def test_lesson_bulk_is_a_handful_of_queries(self):
+        self.client.force_authenticate(user=self.teacher)
+        body = "\n".join(
+            json.dumps({"title": f"Lesson {i}", "order": i}) for i in range(200)
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.generic("POST", self.lessons_url, body,
+                                       content_type="application/x-ndjson")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual(resp.data, {"created": 200, "updated": 0})
+        self.assertEqual(self.course.lessons.count(), 200)
+        self.assertLess(len(ctx.captured_queries), 10)
+
+    def test_bad_row_rolls_back_everything(self):
+        self.client.force_authenticate(user=self.teacher)
+        resp = self.client.post(self.lessons_url, [{"title": "ok"}, {"order": 2}], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data["errors"][0]["row"], 2)
+        self.assertFalse(self.course.lessons.exists())
+
+    def test_unknown_or_foreign_id_is_a_row_error(self):
+        other_course = Course.objects.create(
+            title="Go", description="...", category=self.category, instructor=self.teacher,
+        )
+        foreign = Lesson.objects.create(course=other_course, title="Elsewhere", order=0)
+        self.client.force_authenticate(user=self.teacher)
+        resp = self.client.post(
+            self.lessons_url,
+            [{"title": "ok"}, {"id": 999999, "title": "typo"}, {"id": foreign.pk, "title": "not ours"}],
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([error["row"] for error in resp.data["errors"]], [2, 3])
+        self.assertFalse(self.course.lessons.exists())
+        self.assertEqual(Lesson.objects.get(pk=foreign.pk).title, "Elsewhere")
+
+    def test_only_the_owner_can_bulk_import_lessons(self):
+        self.client.force_authenticate(user=self.other_teacher)
+        resp = self.client.post(self.lessons_url, [{"title": "x"}], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_course_bulk_from_csv_checks_uniqueness_per_batch(self):
+        self.client.force_authenticate(user=self.admin)
+        csv_body = (
+            "title,description,category,instructor,tags\n"
+            f"Go,Intro,{self.category.pk},{self.teacher.pk},go|backend\n"
+            f"Python 101,Dup,{self.category.pk},{self.teacher.pk},\n"
+        )
+        resp = self.client.generic("POST", reverse("courses-bulk"), csv_body, content_type="text/csv")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(resp.data["errors"][0]["row"], 2)
+
+        csv_body = csv_body.splitlines()[0] + "\n" + csv_body.splitlines()[1] + "\n"
+        resp = self.client.generic("POST", reverse("courses-bulk"), csv_body, content_type="text/csv")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual(Course.objects.get(title="Go").tags, ["go", "backend"])
+
+    def test_export_then_import_updates_in_place(self):
+        Lesson.objects.create(course=self.course, title="Intro", order=1)
+        out = io.StringIO()
+        call_command("export_catalogue", model="lesson", stdout=out)
+        record = json.loads(out.getvalue().splitlines()[0])
+        record["title"] = "Introduction"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lessons.jsonl")
+            with open(path, "w") as handle:
+                handle.write(json.dumps(record) + "\n")
+            call_command("import_catalogue", path, model="lesson", stdout=io.StringIO())
+        self.assertEqual(list(self.course.lessons.values_list("title", flat=True)), ["Introduction"])
@@ -0,0 +1,71 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+
+User = get_user_model()
+
+
+class VersionedCacheTests(APITestCase):
+    """
+    Anonymous catalogue reads are served from the cache until a write bumps
+    the model version; ETags turn repeat reads into 304s.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.category = Category.objects.create(title="Programming")
+        self.course = Course.objects.create(
+            title="Python 101", description="...",
+            category=self.category, instructor=self.teacher, is_active=False,
+        )
+        self.url = reverse("courses-detail", args=[self.course.id])
+
+    def test_second_read_skips_the_database(self):
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(self.url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_publish_invalidates(self):
+        self.assertFalse(self.client.get(self.url).data["is_active"])
+
+        self.client.force_authenticate(user=self.teacher)
+        self.client.patch(reverse("courses-publish", args=[self.course.id]))
+        self.client.force_authenticate(user=None)
+
+        self.assertTrue(self.client.get(self.url).data["is_active"])
+
+    def test_category_save_invalidates_category_list(self):
+        url = reverse("category-list")
+        self.assertEqual(len(self.client.get(url).data), 1)
+        Category.objects.create(title="Design")
+        self.assertEqual(len(self.client.get(url).data), 2)
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get(self.url)["ETag"]
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.course.title = "Python 102"
+        self.course.save()
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(resp["ETag"], etag)
+
+    def test_authenticated_reads_bypass_the_cache(self):
+        self.client.force_authenticate(user=self.teacher)
+        self.client.get(self.url)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(self.url)
+        self.assertGreater(len(ctx.captured_queries), 0)
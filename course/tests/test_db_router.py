@@ -0,0 +1,87 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.urls import resolve, reverse
+
+from rest_framework.response import Response
+
+from backend.db_router import ReplicaRouter, ReplicaRoutingMiddleware
+from course.cache import VersionedCacheMixin
+from course.models import Course
+
+router = ReplicaRouter()
+
+
+@override_settings(DATABASE_REPLICAS=["replica1"], DB_REPLICA_STICKY_COOKIE="db_primary")
+class ReplicaRoutingTests(SimpleTestCase):
+    """Catalogue reads go to a replica; writes, and reads right after them, don't."""
+
+    def route(self, method, path, cookies=None, write=False):
+        """Alias a read would use inside this request, and the response."""
+        seen = {}
+
+        def view(request):
+            match = resolve(path)
+            middleware.process_view(request, match.func, match.args, match.kwargs)
+            if write:
+                router.db_for_write(Course)
+            seen["alias"] = router.db_for_read(Course)
+            return HttpResponse(status=201 if write else 200)
+
+        middleware = ReplicaRoutingMiddleware(view)
+        request = getattr(RequestFactory(), method)(path)
+        request.COOKIES.update(cookies or {})
+        response = middleware(request)
+        return seen["alias"], response
+
+    def test_safe_catalogue_reads_use_replica(self):
+        self.assertEqual(self.route("get", reverse("courses-list"))[0], "replica1")
+        self.assertEqual(self.route("get", reverse("category-list"))[0], "replica1")
+        self.assertEqual(self.route("get", reverse("course-lessons-list", args=[1]))[0], "replica1")
+        self.assertEqual(self.route("get", reverse("async-course-list"))[0], "replica1")
+
+    def test_other_views_stay_on_primary(self):
+        self.assertEqual(self.route("get", reverse("metrics"))[0], "default")
+        self.assertEqual(router.db_for_read(Course), "default")   # outside any request
+
+    def test_write_sets_sticky_cookie(self):
+        alias, response = self.route("post", reverse("courses-list"), write=True)
+        self.assertEqual(alias, "default")
+        self.assertEqual(response.cookies["db_primary"]["max-age"], 10)
+
+        alias, _ = self.route("get", reverse("courses-list"), cookies={"db_primary": "1"})
+        self.assertEqual(alias, "default")
+
+    def test_read_after_write_in_same_request(self):
+        alias, response = self.route("get", reverse("courses-list"), write=True)
+        self.assertEqual(alias, "default")
+        self.assertIn("db_primary", response.cookies)
+
+    def test_cache_misses_are_built_on_primary(self):
+        cache.clear()
+        seen = []
+
+        class Cached(VersionedCacheMixin):
+            basename, action, cache_models = "courses", "list", ("course",)
+
+        def handler(request):
+            seen.append(router.db_for_read(Course))
+            return Response({"results": []})
+
+        def view(request):
+            middleware.process_view(request, match.func, match.args, match.kwargs)
+            request.user = AnonymousUser()
+            Cached()._cached(handler, request)      # miss: fills the cache
+            seen.append(router.db_for_read(Course))  # other reads may still use the replica
+            return HttpResponse()
+
+        path = reverse("courses-list")
+        match = resolve(path)
+        middleware = ReplicaRoutingMiddleware(view)
+        middleware(RequestFactory().get(path))
+        self.assertEqual(seen, ["default", "replica1"])
+
+    def test_replicas_are_not_migrated(self):
+        self.assertTrue(router.allow_migrate("default", "course"))
+        self.assertFalse(router.allow_migrate("replica1", "course"))
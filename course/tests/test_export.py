@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .factories import CatalogueFactory
+
+
+def export_url(model, fmt):
+    return reverse("catalogue-export", kwargs={"model": model, "fmt": fmt})
+
+
+class CatalogueExportTests(APITestCase):
+    """GET /api/export/... streams the catalogue a line at a time."""
+
+    def setUp(self):
+        self.make = CatalogueFactory()
+        self.admin = self.make.user(role="admin", is_staff=True)
+        self.python = self.make.course(title="Python 101")
+        self.django = self.make.course(title="Django 201", is_active=False)
+        self.make.lessons(self.python, 3)
+        self.make.lessons(self.django, 2)
+
+    def fetch(self, url, **params):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode(), response
+
+    def test_admins_only(self):
+        url = export_url("courses", "ndjson")
+        self.assertIn(self.client.get(url).status_code,
+                      (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN))
+        self.client.force_authenticate(self.make.teacher())
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(EXPORT_CHUNK_SIZE=1)
+    def test_ndjson_one_record_per_line(self):
+        body, response = self.fetch(export_url("courses", "ndjson"))
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        self.assertIn("attachment;", response["Content-Disposition"])
+
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual([r["title"] for r in rows], ["Python 101", "Django 201"])
+        self.assertNotIn("search_vector", rows[0])
+
+    def test_csv_header_and_field_selection(self):
+        body, response = self.fetch(export_url("categories", "csv"), fields="id,title")
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        rows = list(csv.reader(io.StringIO(body)))
+        self.assertEqual(rows[0], ["id", "title"])
+        self.assertEqual(len(rows), 2)
+
+    def test_filters(self):
+        body, _ = self.fetch(export_url("lessons", "ndjson"), course=str(self.django.pk))
+        self.assertEqual({json.loads(line)["course"] for line in body.splitlines()}, {self.django.pk})
+        self.assertEqual(len(body.splitlines()), 2)
+
+        body, _ = self.fetch(export_url("courses", "ndjson"), is_active="true")
+        self.assertEqual([json.loads(line)["title"] for line in body.splitlines()], ["Python 101"])
+
+    def test_unknown_field_rejected(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.get(export_url("courses", "csv"), {"fields": "title,password"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.data)
@@ -0,0 +1,70 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+
+User = get_user_model()
+
+
+class CourseFilterTests(APITestCase):
+    """
+    Server-side catalogue filters and ?ordering=.
+    """
+
+    def setUp(self):
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.web = Category.objects.create(title="Web Development")
+        data = Category.objects.create(title="Data")
+
+        def make(title, category, **extra):
+            return Course.objects.create(
+                title=title, description="...", category=category,
+                instructor=teacher, **extra,
+            )
+
+        self.django = make("Django", self.web, tags=["python", "django"], level="intermediate",
+                           type="paid", price=40)
+        self.flask = make("Flask", self.web, tags=["python", "flask"], type="paid", price=15)
+        self.pandas = make("Pandas", data, tags=["python", "pandas"], level="advanced")
+        self.url = reverse("courses-list")
+
+    def _ids(self, query):
+        resp = self.client.get(self.url + query)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return [row["id"] for row in resp.data["results"]]
+
+    def test_filter_by_level_and_type(self):
+        self.assertEqual(self._ids("?level=intermediate,advanced&type=paid"), [self.django.id])
+
+    def test_filter_by_category_id_or_slug(self):
+        self.assertCountEqual(self._ids(f"?category={self.web.id}"), [self.django.id, self.flask.id])
+        self.assertCountEqual(self._ids("?category=web-development"), [self.django.id, self.flask.id])
+
+    def test_tags_containment_and_overlap(self):
+        self.assertEqual(self._ids("?tags=python,django"), [self.django.id])
+        self.assertCountEqual(self._ids("?tags_any=flask,pandas"), [self.flask.id, self.pandas.id])
+
+    def test_price_range(self):
+        self.assertEqual(self._ids("?price_min=10&price_max=20"), [self.flask.id])
+
+    def test_bad_price_is_400(self):
+        resp = self.client.get(self.url + "?price_min=cheap")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ordering_pages_through_ties(self):
+        # pandas is free (0) and both paid courses are distinct; add a tie on price
+        tie = Course.objects.create(
+            title="Flask 2", description="...", category=self.web,
+            instructor=self.flask.instructor, type="paid", price=15,
+        )
+        seen, url = [], self.url + "?ordering=price&page_size=1"
+        while url:
+            resp = self.client.get(url)
+            seen += [row["id"] for row in resp.data["results"]]
+            url = resp.data["next"]
+        self.assertEqual(seen, [self.pandas.id, *sorted([self.flask.id, tie.id]), self.django.id])
@@ -0,0 +1,69 @@
+import time
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from backend.instrumentation import QueryBudgetExceeded, metrics
+from course.models import Category, Course
+from course.serializers.course_serializers import CourseSummarySerializer
+
+User = get_user_model()
+
+
+class RequestMetricsTests(APITestCase):
+    """Server-Timing headers, the metrics endpoint and query budgets."""
+
+    def setUp(self):
+        metrics.clear()
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=teacher,
+        )
+
+    def test_server_timing_header(self):
+        resp = self.client.get(reverse("courses-list"))
+        self.assertIn('db;dur=', resp["Server-Timing"])
+        self.assertIn('desc="1 queries"', resp["Server-Timing"])
+        self.assertIn("serialize;dur=", resp["Server-Timing"])
+        self.assertIn("total;dur=", resp["Server-Timing"])
+
+    def test_metrics_endpoint_aggregates_per_view(self):
+        for _ in range(3):
+            self.client.get(reverse("courses-list"))
+        admin = User.objects.create_superuser(
+            email="admin@example.com", username="admin", password="pass123",
+        )
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        self.client.force_authenticate(admin)
+        data = self.client.get(reverse("metrics")).data
+        series = data["endpoints"]["GET courses-list"]
+        self.assertEqual(series["total_ms"]["count"], 3)
+        self.assertEqual(series["queries"]["max"], 1)
+        self.assertIn("hits", data["user_cache"])
+
+    def test_serialization_is_its_own_phase(self):
+        to_representation = CourseSummarySerializer.to_representation
+
+        def slow(serializer, instance):
+            time.sleep(0.03)
+            return to_representation(serializer, instance)
+
+        with mock.patch.object(CourseSummarySerializer, "to_representation", slow):
+            self.client.get(reverse("courses-list"))
+        series = metrics.snapshot()["GET courses-list"]
+        self.assertGreaterEqual(series["serialize_ms"]["max"], 30)
+        self.assertLess(series["render_ms"]["max"], 30)
+
+    @override_settings(QUERY_BUDGET_STRICT=True, QUERY_BUDGETS={"GET courses-list": 0})
+    def test_strict_budget_fails_the_request(self):
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get(reverse("courses-list"))
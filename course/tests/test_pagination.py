@@ -0,0 +1,83 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class KeysetPaginationTests(APITestCase):
+    """
+    Walk the course and lesson lists page by page and make sure every row
+    comes back exactly once, including rows that tie on the first sort key.
+    """
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.category = Category.objects.create(title="Programming")
+        self.courses = [
+            Course.objects.create(
+                title=f"Course {i}", description="...",
+                category=self.category, instructor=self.teacher,
+            )
+            for i in range(7)
+        ]
+        # force a tie on created_at so only the id tiebreaker separates them
+        same_instant = timezone.now()
+        Course.objects.filter(pk__in=[c.pk for c in self.courses[2:5]]).update(created_at=same_instant)
+
+    def _walk(self, url):
+        seen, pages = [], 0
+        while url:
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, status.HTTP_200_OK)
+            seen += [row["id"] for row in resp.data["results"]]
+            url = resp.data["next"]
+            pages += 1
+        return seen, pages
+
+    def test_course_pages_cover_every_row_once(self):
+        seen, pages = self._walk(reverse("courses-list") + "?page_size=2")
+        expected = list(
+            Course.objects.order_by("-created_at", "id").values_list("id", flat=True)
+        )
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 4)
+
+    def test_previous_link_returns_the_prior_page(self):
+        first = self.client.get(reverse("courses-list") + "?page_size=3")
+        second = self.client.get(first.data["next"])
+        back = self.client.get(second.data["previous"])
+        self.assertEqual(
+            [r["id"] for r in back.data["results"]],
+            [r["id"] for r in first.data["results"]],
+        )
+
+    def test_page_size_is_capped(self):
+        with self.settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "MAX_PAGE_SIZE": 3}):
+            resp = self.client.get(reverse("courses-list") + "?page_size=500")
+        self.assertEqual(len(resp.data["results"]), 3)
+
+    def test_garbage_cursor_is_404(self):
+        resp = self.client.get(reverse("courses-list") + "?cursor=cD1ub3Bl")  # p=nope
+        self.assertEqual(resp.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_lessons_are_paged_by_order_then_id(self):
+        course = self.courses[0]
+        # (course, order) is unique, so create out of order to keep id and
+        # position from lining up
+        for i in (3, 0, 4, 1, 2):
+            Lesson.objects.create(course=course, title=f"L{i}", order=i)
+        self.client.force_authenticate(self.teacher)  # full curriculum, not just previews
+        url = reverse("course-lessons-list", kwargs={"course_pk": course.pk}) + "?page_size=2"
+        seen, _ = self._walk(url)
+        expected = list(course.lessons.order_by("order", "id").values_list("id", flat=True))
+        self.assertEqual(seen, expected)
@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from course.serializers.course_serializers import CourseSummarySerializer
+
+User = get_user_model()
+
+
+class CourseProjectionTests(APITestCase):
+    """
+    The catalogue list renders the summary card and only SELECTs its columns;
+    ?fields= narrows and ?expand= widens both the payload and the query.
+    """
+
+    def setUp(self):
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", description="Intro to Python", syllabus="week 1",
+            category=Category.objects.create(title="Programming"), instructor=teacher,
+        )
+        self.url = reverse("courses-list")
+
+    def _list(self, query=""):
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(self.url + query)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        sql = " ".join(q["sql"] for q in ctx.captured_queries)
+        return resp.data["results"][0], sql
+
+    def test_list_uses_summary_card(self):
+        row, sql = self._list()
+        self.assertEqual(set(row), set(CourseSummarySerializer.Meta.fields))
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"syllabus"', sql)
+
+    def test_expand_adds_heavy_fields(self):
+        row, sql = self._list("?expand=description")
+        self.assertEqual(row["description"], "Intro to Python")
+        self.assertIn('"description"', sql)
+        self.assertNotIn('"syllabus"', sql)
+
+    def test_fields_narrows_the_payload(self):
+        row, _ = self._list("?fields=id,title")
+        self.assertEqual(set(row), {"id", "title"})
+
+    def test_retrieve_returns_everything_by_default(self):
+        resp = self.client.get(reverse("courses-detail", args=[self.course.id]))
+        self.assertEqual(resp.data["syllabus"], "week 1")
+
+    def test_unknown_field_is_rejected(self):
+        resp = self.client.get(self.url + "?fields=id,password")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,82 @@
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from course.tests.factories import CatalogueFactory
+from course.tests.mixins import QueryCountMixin
+
+
+class QueryCountTests(QueryCountMixin, APITestCase):
+    """List and retrieve cost the same number of queries at 2 rows or 12."""
+
+    def setUp(self):
+        self.make = CatalogueFactory()
+
+    # ─── growers: bring the fixture up to n rows ───────────────────────────
+    def _courses(self, n):
+        for _ in range(n - Course.objects.count()):
+            self.make.course()
+
+    def _lessons_of(self, course, **fields):
+        def grow(n):
+            self.make.lessons(course, n - course.lessons.count(), **fields)
+        return grow
+
+    # ─── CourseViewSet ─────────────────────────────────────────────────────
+    def test_course_list(self):
+        self.assertConstantQueries(reverse("courses-list"), self._courses)
+
+    def test_course_list_expanded_and_filtered(self):
+        url = reverse("courses-list") + "?expand=description,tags&level=beginner&ordering=price"
+        self.assertConstantQueries(url, self._courses)
+
+    def test_course_list_as_teacher(self):
+        self.client.force_authenticate(self.make.teacher())
+        self.assertConstantQueries(reverse("courses-list"), self._courses)
+
+    def test_course_retrieve(self):
+        course = self.make.course()
+
+        def grow(n):
+            # what the detail renders per item: banner thumbnails and tags
+            Course.objects.filter(pk=course.pk).update(
+                banner_thumbnails={str(320 * (i + 1)): f"banners/x-{i}.webp" for i in range(n)},
+                tags=[f"tag-{i}" for i in range(n)],
+            )
+
+        url = reverse("courses-detail", args=[course.pk])
+        self.assertConstantQueries(url, grow)
+        resp = self.count_queries(url)[1]
+        self.assertEqual(len(resp.data["banner_thumbnails"]), self.query_sizes[-1])
+
+    # ─── CategoryViewSet ───────────────────────────────────────────────────
+    def test_category_list(self):
+        def grow(n):
+            for _ in range(n - Category.objects.count()):
+                self.make.category()
+        self.assertConstantQueries(reverse("category-list"), grow)
+
+    # ─── LessonViewSet ─────────────────────────────────────────────────────
+    def test_lesson_list_as_instructor(self):
+        course = self.make.course()
+        self.client.force_authenticate(self.make.teacher())
+        self.assertConstantQueries(
+            reverse("course-lessons-list", args=[course.pk]), self._lessons_of(course),
+        )
+
+    def test_lesson_list_previews_for_anonymous(self):
+        course = self.make.course()
+        self.assertConstantQueries(
+            reverse("course-lessons-list", args=[course.pk]), self._lessons_of(course, is_preview=True),
+        )
+
+    def test_lesson_retrieve_as_enrolled_student(self):
+        course = self.make.course()
+        lesson = self.make.lessons(course, 1)[0]
+        student = self.make.user()
+        self.make.enroll(student, course)
+        self.client.force_authenticate(student)
+        self.assertConstantQueries(
+            reverse("course-lessons-detail", args=[course.pk, lesson.pk]), self._lessons_of(course),
+        )
+
@@ -0,0 +1,109 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from enrollments.models import Enrollment
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class CourseCounterTests(APITestCase):
+    """lesson_count / preview_count / enrollment_count follow every write path."""
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=self.teacher,
+        )
+
+    def _counts(self):
+        self.course.refresh_from_db()
+        return self.course.lesson_count, self.course.preview_count, self.course.enrollment_count
+
+    def test_lesson_writes_move_the_counters(self):
+        first = Lesson.objects.create(course=self.course, title="Intro", order=0, is_preview=True)
+        Lesson.objects.create(course=self.course, title="Next", order=1)
+        self.assertEqual(self._counts(), (2, 1, 0))
+
+        first = Lesson.objects.get(pk=first.pk)
+        first.is_preview = False
+        first.save()
+        self.assertEqual(self._counts(), (2, 0, 0))
+
+        first.delete()
+        self.assertEqual(self._counts(), (1, 0, 0))
+
+    def test_lesson_writes_move_the_total_duration(self):
+        first = Lesson.objects.create(course=self.course, title="Intro", order=0, duration_seconds=100)
+        Lesson.objects.create(course=self.course, title="Next", order=1, duration_seconds=50)
+        Lesson.objects.create(course=self.course, title="Reading", order=2)   # no video
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.total_duration_seconds, 150)
+
+        other = Course.objects.create(title="Other", category=self.course.category, instructor=self.teacher)
+        first = Lesson.objects.get(pk=first.pk)
+        first.course = other
+        first.save()
+        self.course.refresh_from_db()
+        other.refresh_from_db()
+        self.assertEqual((self.course.total_duration_seconds, other.total_duration_seconds), (50, 100))
+
+        first.delete()
+        other.refresh_from_db()
+        self.assertEqual(other.total_duration_seconds, 0)
+
+    def test_enrollment_writes_move_the_counter(self):
+        Enrollment.objects.enroll(self.student.id, self.course.id)
+        Enrollment.objects.enroll(self.student.id, self.course.id)  # repeat: no change
+        self.assertEqual(self._counts()[2], 1)
+
+        enrollment = Enrollment.objects.get()
+        enrollment.status = Enrollment.Status.CANCELLED
+        enrollment.save()
+        self.assertEqual(self._counts()[2], 0)
+
+        Enrollment.objects.enroll(self.student.id, self.course.id)  # reactivated
+        self.assertEqual(self._counts()[2], 1)
+
+    def test_bulk_import_is_counted(self):
+        self.client.force_authenticate(self.teacher)
+        resp = self.client.post(
+            reverse("course-lessons-bulk", args=[self.course.id]),
+            [{"title": "A", "is_preview": True}, {"title": "B"}, {"title": "C"}], format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self._counts(), (3, 1, 0))
+
+    def test_recount_repairs_drift(self):
+        Lesson.objects.create(course=self.course, title="Intro", order=0)
+        Lesson.objects.filter(course=self.course).update(duration_seconds=90)   # skips signals
+        Course.objects.filter(pk=self.course.pk).update(lesson_count=42, enrollment_count=7)
+        call_command("recount_course_stats", stdout=open("/dev/null", "w"))
+        self.assertEqual(self._counts(), (1, 0, 0))
+        self.assertEqual(self.course.total_duration_seconds, 90)
+
+    def test_list_shows_counters_without_extra_queries(self):
+        Lesson.objects.create(course=self.course, title="Intro", order=0)
+        with self.assertNumQueries(1):
+            resp = self.client.get(reverse("courses-list"))
+        self.assertEqual(resp.data["results"][0]["lesson_count"], 1)
+
+    def test_counter_change_invalidates_cached_course(self):
+        url = reverse("courses-detail", args=[self.course.id])
+        self.assertEqual(self.client.get(url).data["enrollment_count"], 0)  # now cached
+        with self.captureOnCommitCallbacks(execute=True):
+            Enrollment.objects.enroll(self.student.id, self.course.id)
+        self.assertEqual(self.client.get(url).data["enrollment_count"], 1)
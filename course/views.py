@@ -6,21 +6,93 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAdminUser,AllowAny
+from rest_framework.exceptions import ValidationError
 from .models import Course
-from course.serializers.course_serializers import CourseSerializer
+from course.serializers.course_serializers import CourseSerializer, CourseSummarySerializer
 from .permissions import IsCourseTeacherOrAdmin
+from .pagination import CoursePagination
+from .filters import CourseFilterBackend, CourseOrderingFilter, split_param
+from .cache import VersionedCacheMixin
+from backend.instrumentation import TimedSerializerMixin
+from uploads.files import serve_file
+from .bulk import CourseImporter, EXPORT_MODELS, export_fields, export_rows, request_records, write_records
 
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from rest_framework.views import APIView
 from rest_framework.viewsets import ReadOnlyModelViewSet
 from course.models import Category
 from course.serializers.category_serializers import CategorySerializer
 
-class CourseViewSet(ModelViewSet):
+class CourseViewSet(TimedSerializerMixin, VersionedCacheMixin, ModelViewSet):
     """
     Standard CRUD + an extra 'publish' action teachers/admins can call.
+    Anonymous list/retrieve responses are cached (see course/cache.py).
     """
     queryset = Course.objects.all()
     serializer_class = CourseSerializer
     permission_classes = [IsCourseTeacherOrAdmin]
+    pagination_class = CoursePagination  # keyset on (-created_at, id)
+    filter_backends = [CourseFilterBackend, CourseOrderingFilter]
+    ordering_fields = ("created_at", "price", "title", "duration")
+    cache_models = ("course", "category", "lesson")  # lesson writes move the counters
+    read_from_replica = True  # safe-method reads (backend/db_router.py)
+
+    # Columns the ORM must always load: the pk and the pagination keys.
+    always_loaded = {"id", "created_at"}
+
+    # ─── Field projection: ?fields=a,b  /  ?expand=description,syllabus ────
+    def get_projection(self):
+        """
+        Serializer fields to render, or None for "everything".
+        list     → the summary card, narrowed by ?fields= / widened by ?expand=
+        retrieve → the full course, narrowed by ?fields=
+        Writes are never projected.
+        """
+        if self.action not in ("list", "retrieve"):
+            return None
+        if not hasattr(self, "_projection"):
+            params = self.request.query_params
+            requested = set(split_param(params.get("fields")))
+            expand = set(split_param(params.get("expand")))
+
+            unknown = (requested | expand) - set(CourseSerializer().fields)
+            if unknown:
+                raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+
+            if requested:
+                self._projection = requested | expand
+            elif self.action == "list":
+                self._projection = set(CourseSummarySerializer.Meta.fields) | expand
+            else:
+                self._projection = None
+        return self._projection
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        projection = self.get_projection()
+        if projection is not None:
+            # SELECT only what will be rendered — skips the big text columns
+            columns = CourseSerializer.model_columns(projection) | self.always_loaded
+            # the cursor is built from the sort keys, so they must be loaded too
+            ordering = CourseOrderingFilter().get_ordering(self.request, queryset, self) or ()
+            columns |= {field.lstrip("-") for field in ordering}
+            queryset = queryset.only(*columns)
+        else:
+            queryset = queryset.defer("search_vector")
+        return queryset
+
+    def get_serializer_class(self):
+        projection = self.get_projection()
+        if self.action == "list" and projection <= set(CourseSummarySerializer.Meta.fields):
+            return CourseSummarySerializer
+        return CourseSerializer
+
+    def get_serializer(self, *args, **kwargs):
+        projection = self.get_projection()
+        if projection is not None:
+            kwargs.setdefault("fields", projection)
+        return super().get_serializer(*args, **kwargs)
 
     # Example custom endpoint: PATCH /courses/{id}/publish/
     #publish action to set the course as active
@@ -29,17 +101,82 @@ class CourseViewSet(ModelViewSet):
     def publish(self, request, pk=None):
         course = self.get_object()
         course.is_active = True
-        course.save(update_fields=["is_active"])
+        course.save(update_fields=["is_active"])  # also bumps the course cache version
         return Response({"status": "published"}, status=status.HTTP_200_OK)
 
+    # GET /courses/{id}/banner/ — the image itself, with Range support
+    @action(detail=True, methods=["get"])
+    def banner(self, request, pk=None):
+        return serve_file(request, self.get_object().banner)
+
+    # POST /courses/bulk/  — JSON array, JSON Lines or CSV; admins seed the catalogue
+    @action(detail=False, methods=["post"], url_path="bulk", permission_classes=[IsAdminUser])
+    def bulk(self, request):
+        result = CourseImporter().run(request_records(request))
+        return Response(result, status=status.HTTP_201_CREATED)
+
 
 
 #catergory viewset for read-only access to categories
-class CategoryViewSet(ReadOnlyModelViewSet):
+class CategoryViewSet(TimedSerializerMixin, VersionedCacheMixin, ReadOnlyModelViewSet):
     """
-    Read-only viewset for categories.
+    Read-only viewset for categories (cached for anonymous readers).
     """
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [AllowAny]
+    cache_models = ("category",)
+    read_from_replica = True
+
+
+# ─── Streaming exports ─────────────────────────────────────────────────────
+class CatalogueExportView(APIView):
+    """
+    GET /api/export/{courses|lessons|categories}.{ndjson|csv}   (admins)
+
+        ?fields=id,title             → only these columns
+        ?course=3,7                  → lessons of these courses
+        ?category=2 / ?is_active=1   → courses filter
+
+    Rows are read through a server-side cursor and written one line at a
+    time, so a full dump runs in constant memory.
+    """
+    permission_classes = [IsAdminUser]
+    MODELS = {"courses": "course", "lessons": "lesson", "categories": "category"}
+    CONTENT_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+    def get(self, request, model, fmt):
+        model_name = self.MODELS[model]
+        model_class = EXPORT_MODELS[model_name]
+        fields = export_fields(model_class)
+
+        requested = split_param(request.query_params.get("fields"))
+        unknown = set(requested) - set(fields)
+        if unknown:
+            raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+        fields = requested or fields
+
+        rows = export_rows(model_class, fields, **self._filters(model_name, request.query_params))
+        response = StreamingHttpResponse(
+            write_records(rows, fields, "csv" if fmt == "csv" else "jsonl"),
+            content_type=f"{self.CONTENT_TYPES[fmt]}; charset=utf-8",
+        )
+        filename = f"{model}-{timezone.now():%Y%m%d-%H%M%S}.{fmt}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        response["X-Accel-Buffering"] = "no"   # let nginx pass chunks straight through
+        return response
 
+    @staticmethod
+    def _filters(model_name, params):
+        filters = {}
+        if model_name == "lesson" and params.get("course"):
+            ids = split_param(params["course"])
+            if not all(i.isdigit() for i in ids):
+                raise ValidationError({"course": "Expected comma-separated course ids."})
+            filters["course_id__in"] = ids
+        if model_name == "course":
+            if params.get("category", "").isdigit():
+                filters["category_id"] = int(params["category"])
+            if params.get("is_active") is not None:
+                filters["is_active"] = params["is_active"].lower() in ("1", "true", "yes")
+        return filters
@@ -0,0 +1,79 @@
+"""
+Cached "is this user enrolled in course X" answers.
+
+Lesson permissions ask this on every request, so the answer (positive or
+negative) is kept in the default cache. A miss costs one index-only lookup
+on the (student, course) unique index; enrollment writes drop the key.
+"""
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+ENROLLED_KEY = "enrollment:{}:{}"
+
+
+def is_enrolled(user_id, course_id):
+    key = ENROLLED_KEY.format(user_id, course_id)
+    enrolled = cache.get(key)
+    if enrolled is None:
+        Enrollment = apps.get_model("enrollments", "Enrollment")
+        enrolled = Enrollment.objects.filter(
+            student_id=user_id, course_id=course_id, status__in=Enrollment.GRANTING,
+        ).exists()
+        cache.set(key, enrolled, settings.ENROLLMENT_CACHE_TIMEOUT)
+    return enrolled
+
+
+def forget_enrollment(user_id, course_id):
+    """
+    Drop the cached answer now and again after commit, so a reader racing
+    the write can't re-cache the pre-commit state.
+    """
+    key = ENROLLED_KEY.format(user_id, course_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def can_access_course(user, course_id, instructor_id=None):
+    """
+    Full lesson access: admins, the course's instructor and enrolled students.
+    Pass `instructor_id` when the caller already has it to save a query.
+    """
+    if not user.is_authenticated:
+        return False
+    if user.role == "admin":
+        return True
+    if user.role == "teacher":
+        if instructor_id is None:
+            Course = apps.get_model("course", "Course")
+            instructor_id = Course.objects.filter(pk=course_id).values_list("instructor_id", flat=True).first()
+        if instructor_id == user.id:
+            return True
+    return is_enrolled(user.id, course_id)
+
+
+# ─── Async twins (course/async_views.py) ───────────────────────────────────
+async def ais_enrolled(user_id, course_id):
+    key = ENROLLED_KEY.format(user_id, course_id)
+    enrolled = await cache.aget(key)
+    if enrolled is None:
+        Enrollment = apps.get_model("enrollments", "Enrollment")
+        enrolled = await Enrollment.objects.filter(
+            student_id=user_id, course_id=course_id, status__in=Enrollment.GRANTING,
+        ).aexists()
+        await cache.aset(key, enrolled, settings.ENROLLMENT_CACHE_TIMEOUT)
+    return enrolled
+
+
+async def acan_access_course(user, course_id):
+    if not user.is_authenticated:
+        return False
+    if user.role == "admin":
+        return True
+    if user.role == "teacher":
+        Course = apps.get_model("course", "Course")
+        instructor_id = await Course.objects.filter(pk=course_id).values_list("instructor_id", flat=True).afirst()
+        if instructor_id == user.id:
+            return True
+    return await ais_enrolled(user.id, course_id)
@@ -0,0 +1,31 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from enrollments.progress import flush_progress
+
+
+class Command(BaseCommand):
+    help = (
+        "Write buffered lesson-progress heartbeats to the database in bulk, "
+        "every PROGRESS_FLUSH_INTERVAL seconds (or once with --once)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="flush once and exit")
+        parser.add_argument("--interval", type=float,
+                            help="seconds between flushes (default PROGRESS_FLUSH_INTERVAL)")
+
+    def handle(self, *args, **options):
+        interval = options["interval"] or settings.PROGRESS_FLUSH_INTERVAL
+        total = 0
+        try:
+            while True:
+                total += flush_progress()
+                if options["once"]:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"{total} progress row(s) written"))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:15
+
+import django.core.validators
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('course', '0005_course_search_vector_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Enrollment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('active', 'Active'), ('completed', 'Completed'), ('cancelled', 'Cancelled')], default='active', max_length=20)),
+                ('progress', models.PositiveSmallIntegerField(default=0, help_text='Completed share of the course, in percent', validators=[django.core.validators.MaxValueValidator(100)])),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('course', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to='course.course')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='enrollments', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+                'indexes': [models.Index(fields=['course', 'status'], name='enrollments_course__f8877c_idx'), models.Index(fields=['student', '-created_at'], name='enrollments_student_05041f_idx')],
+                'constraints': [models.UniqueConstraint(fields=('student', 'course'), include=('status',), name='enrollments_unique_student_course')],
+            },
+        ),
+    ]
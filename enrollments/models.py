@@ -1,3 +1,157 @@
-from django.db import models
+from django.conf import settings
+from django.core.validators import MaxValueValidator
+from django.db import connection, models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
 
-# Create your models here.
+from course.models import Course
+from course.stats import adjust_course_counters
+from enrollments.access import forget_enrollment
+
+
+class EnrollmentManager(models.Manager):
+
+    def enroll(self, student_id, course_id):
+        """
+        Enroll idempotently and return (enrollment, created).
+
+        A single INSERT ... ON CONFLICT DO NOTHING: a burst of clicks (or a
+        launch-day stampede) never raises IntegrityError and never takes a
+        lock on an existing row. A repeat costs one more indexed SELECT.
+        """
+        now = timezone.now()
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                INSERT INTO {self.model._meta.db_table}
+                    (student_id, course_id, status, progress, created_at, updated_at)
+                VALUES (%s, %s, %s, 0, %s, %s)
+                ON CONFLICT (student_id, course_id) DO NOTHING
+                RETURNING id
+                """,
+                [student_id, course_id, Enrollment.Status.ACTIVE, now, now],
+            )
+            row = cursor.fetchone()
+
+        if row is not None:
+            # raw SQL skips post_save, so count the new student here
+            adjust_course_counters(course_id, enrollment_count=1)
+            enrollment, created = self.model(
+                id=row[0], student_id=student_id, course_id=course_id,
+                status=Enrollment.Status.ACTIVE, progress=0, created_at=now, updated_at=now,
+            ), True
+        else:
+            enrollment, created = self.get(student_id=student_id, course_id=course_id), False
+            if enrollment.status == Enrollment.Status.CANCELLED:
+                enrollment.status = Enrollment.Status.ACTIVE
+                enrollment.save(update_fields=["status", "updated_at"])
+
+        # raw SQL skips post_save, so drop any cached "not enrolled" here
+        forget_enrollment(student_id, course_id)
+        return enrollment, created
+
+
+# ---------------------------------------------------------------------------
+# Enrollment
+# ---------------------------------------------------------------------------
+class Enrollment(models.Model):
+
+    class Status(models.TextChoices):
+        ACTIVE    = "active",    _("Active")
+        COMPLETED = "completed", _("Completed")
+        CANCELLED = "cancelled", _("Cancelled")
+
+    # statuses that grant access to the course's lessons
+    GRANTING = (Status.ACTIVE, Status.COMPLETED)
+
+    student  = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="enrollments",
+    )
+    course   = models.ForeignKey(
+        Course,
+        on_delete=models.CASCADE,
+        related_name="enrollments",
+    )
+    status   = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE)
+    progress = models.PositiveSmallIntegerField(
+        default=0,
+        validators=[MaxValueValidator(100)],
+        help_text=_("Completed share of the course, in percent"),
+    )
+
+    created_at   = models.DateTimeField(auto_now_add=True)
+    updated_at   = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    objects = EnrollmentManager()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remembered so the counter signal can tell whether access changed
+        instance._loaded_status = instance.__dict__.get("status")
+        return instance
+
+    class Meta:
+        ordering = ("-created_at",)
+        constraints = [
+            # INCLUDE status: the access check is an index-only scan
+            models.UniqueConstraint(
+                fields=("student", "course"),
+                include=("status",),
+                name="enrollments_unique_student_course",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=("course", "status")),        # roster / counts per course
+            models.Index(fields=("student", "-created_at")),  # "my courses"
+        ]
+
+    @property
+    def grants_access(self) -> bool:
+        return self.status in self.GRANTING
+
+    def __str__(self) -> str:
+        return f"{self.student_id} → {self.course_id} ({self.status})"
+
+
+# ---------------------------------------------------------------------------
+# LessonProgress — how far a student is into one lesson
+# ---------------------------------------------------------------------------
+class LessonProgress(models.Model):
+    """
+    Video heartbeats reach this table through the write-behind buffer in
+    enrollments/progress.py; completions are written straight through.
+    """
+    student  = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="lesson_progress",
+    )
+    lesson   = models.ForeignKey("lessons.Lesson", on_delete=models.CASCADE, related_name="progress")
+    # denormalised from lesson.course so per-course rollups need no join
+    course   = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="lesson_progress")
+
+    position_seconds = models.PositiveIntegerField(default=0)
+    completed        = models.BooleanField(default=False)
+    completed_at     = models.DateTimeField(null=True, blank=True)
+
+    created_at   = models.DateTimeField(auto_now_add=True)
+    # time of the heartbeat that produced the row, not of the flush
+    last_seen_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("student", "lesson"),
+                name="enrollments_unique_student_lesson",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=("student", "course", "completed")),  # completion rollup
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.student_id} @ lesson {self.lesson_id}: {self.position_seconds}s"
@@ -0,0 +1,19 @@
+from rest_framework.permissions import BasePermission, SAFE_METHODS
+
+from enrollments.access import can_access_course
+
+
+class IsEnrolledOrPreview(BasePermission):
+    """
+    Reading a lesson requires an enrollment in its course, unless the lesson
+    is a free preview. The course instructor and admins always pass.
+    Writes are left to the other permission classes.
+    """
+    message = "Enroll in this course to access its lessons."
+
+    def has_object_permission(self, request, view, obj):
+        if request.method not in SAFE_METHODS or obj.is_preview:
+            return True
+        # LessonViewSet annotates the instructor id so this costs no extra query
+        instructor_id = getattr(obj, "course_instructor_id", None)
+        return can_access_course(request.user, obj.course_id, instructor_id)
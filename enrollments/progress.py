@@ -0,0 +1,182 @@
+"""
+Lesson progress with a write-behind buffer.
+
+Players send a heartbeat every few seconds. Writing each one would mean
+thousands of single-row UPDATEs per second during a busy evening, so
+heartbeats are appended to the cache instead:
+
+    slot = incr("progress:seq");  set("progress:slot:<slot>", heartbeat)
+
+and `flush_progress()` (run on an interval by the `flush_lesson_progress`
+command) reads every slot since the last flush, keeps the newest heartbeat
+per (student, lesson) and writes them all with one INSERT ... ON CONFLICT
+DO UPDATE per batch. A heartbeat lost to cache eviction is harmless: the
+next one carries the newer position anyway.
+
+The slot number comes from the `incr`, so a slot exists a moment before its
+heartbeat is written. A flush never reads past a missing slot: it stops
+there and looks again on the next run; only a slot still missing then is
+taken as evicted and skipped.
+
+The buffer only works in a cache every web process and the flusher share
+(Redis, Memcached). With a per-process cache such as the default locmem the
+flusher would never see the heartbeats, so they are written through instead.
+
+Completions are rare and matter, so they are written through immediately
+and refresh the enrollment's completion percentage.
+"""
+import uuid
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache, caches
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+from django.utils import timezone
+
+from enrollments.models import Enrollment, LessonProgress
+from lessons.models import Lesson
+
+SEQ_KEY = "progress:seq"
+FLUSHED_KEY = "progress:flushed"
+SLOT_KEY = "progress:slot:{}"
+LOCK_KEY = "progress:flush-lock"
+WAITING_KEY = "progress:waiting-for"
+
+# caches shared between processes, with an atomic incr
+SHARED_CACHES = (RedisCache, BaseMemcachedCache)
+
+READ_CHUNK = 1000
+
+
+# ─── Heartbeats ────────────────────────────────────────────────────────────
+def buffer_is_shared():
+    """Whether the flusher can see heartbeats buffered by this process."""
+    # `cache` is a proxy; the backend class is only visible on caches[...]
+    return isinstance(caches["default"], SHARED_CACHES)
+
+
+def record_heartbeat(student_id, course_id, lesson_id, position):
+    """Buffer a position update; costs two cache round trips and no query."""
+    beat = (student_id, int(course_id), int(lesson_id), position, timezone.now())
+    if not buffer_is_shared():
+        _upsert([beat])
+        return
+    cache.add(SEQ_KEY, 0, timeout=None)
+    slot = cache.incr(SEQ_KEY)
+    cache.set(SLOT_KEY.format(slot), beat, settings.PROGRESS_BUFFER_TIMEOUT)
+
+
+def flush_progress(max_rows=None):
+    """Write buffered heartbeats to LessonProgress; return the rows upserted."""
+    token = uuid.uuid4().hex
+    if not cache.add(LOCK_KEY, token, timeout=settings.PROGRESS_FLUSH_INTERVAL * 10):
+        return 0  # another flusher is busy with the same slots
+    try:
+        start = cache.get(FLUSHED_KEY, 0)
+        end = cache.get(SEQ_KEY, 0)
+        if end < start:  # the counter was evicted and restarted
+            start = 0
+        end = min(end, start + (max_rows or settings.PROGRESS_FLUSH_MAX_ROWS))
+        if end == start:
+            return 0
+
+        keys = [SLOT_KEY.format(n) for n in range(start + 1, end + 1)]
+        found = {}
+        for offset in range(0, len(keys), READ_CHUNK):
+            found.update(cache.get_many(keys[offset:offset + READ_CHUNK]))
+
+        # a missing slot may be one whose heartbeat is still being written:
+        # stop short of it, unless it was already missing on the last flush
+        waiting_for = cache.get(WAITING_KEY)
+        missing = next(
+            (n for n, key in enumerate(keys, start + 1) if key not in found and n != waiting_for),
+            None,
+        )
+        if missing is not None:
+            cache.set(WAITING_KEY, missing, timeout=None)
+            end = missing - 1
+            keys = keys[:end - start]
+
+        latest = {}
+        for key in keys:
+            beat = found.get(key)
+            if beat is None:
+                continue
+            student_id, course_id, lesson_id, position, seen_at = beat
+            known = latest.get((student_id, lesson_id))
+            if known is None or seen_at >= known[-1]:
+                latest[student_id, lesson_id] = beat
+
+        written = _upsert(latest.values())
+        cache.set(FLUSHED_KEY, end, timeout=None)
+        cache.delete_many(keys)
+        return written
+    finally:
+        # a flush that outlived the lock must not free the next flusher's
+        if cache.get(LOCK_KEY) == token:
+            cache.delete(LOCK_KEY)
+
+
+def _upsert(beats):
+    beats = list(beats)
+    if not beats:
+        return 0
+    # drop heartbeats for lessons / users deleted meanwhile (or forged ids):
+    # one bad row must not fail the whole batch on a foreign key
+    lessons = dict(
+        Lesson.objects.filter(pk__in={b[2] for b in beats}).values_list("pk", "course_id")
+    )
+    students = set(
+        get_user_model().objects.all_users()
+        .filter(pk__in={b[0] for b in beats}).values_list("pk", flat=True)
+    )
+    rows = [
+        LessonProgress(
+            student_id=student_id, course_id=course_id, lesson_id=lesson_id,
+            position_seconds=position, last_seen_at=seen_at,
+        )
+        for student_id, course_id, lesson_id, position, seen_at in beats
+        if lessons.get(lesson_id) == course_id and student_id in students
+    ]
+    LessonProgress.objects.bulk_create(
+        rows,
+        batch_size=settings.BULK_IMPORT_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["student", "lesson"],
+        update_fields=["position_seconds", "last_seen_at"],   # never touches `completed`
+    )
+    return len(rows)
+
+
+# ─── Completion ────────────────────────────────────────────────────────────
+def mark_completed(student_id, course_id, lesson_id, position=0):
+    """Record a finished lesson now and refresh the course percentage."""
+    now = timezone.now()
+    LessonProgress.objects.bulk_create(
+        [LessonProgress(
+            student_id=student_id, course_id=course_id, lesson_id=lesson_id,
+            position_seconds=position, completed=True, completed_at=now, last_seen_at=now,
+        )],
+        update_conflicts=True,
+        unique_fields=["student", "lesson"],
+        update_fields=["position_seconds", "completed", "completed_at", "last_seen_at"],
+    )
+    return update_course_progress(student_id, course_id)
+
+
+def update_course_progress(student_id, course_id):
+    """Store the completed share of the course on the enrollment; return it."""
+    done = LessonProgress.objects.filter(
+        student_id=student_id, course_id=course_id, completed=True,
+    ).count()
+    total = Lesson.objects.filter(course_id=course_id).count()
+    percent = min(100, done * 100 // total) if total else 0
+
+    enrollments = Enrollment.objects.filter(student_id=student_id, course_id=course_id)
+    enrollments.update(progress=percent, updated_at=timezone.now())
+    if percent == 100:
+        enrollments.filter(status=Enrollment.Status.ACTIVE).update(
+            status=Enrollment.Status.COMPLETED, completed_at=timezone.now(),
+        )
+    return percent
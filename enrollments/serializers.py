@@ -0,0 +1,28 @@
+from rest_framework import serializers
+
+from enrollments.models import Enrollment, LessonProgress
+
+
+class EnrollmentSerializer(serializers.ModelSerializer):
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = Enrollment
+        fields = (
+            "id", "course", "status", "status_display", "progress",
+            "created_at", "updated_at", "completed_at",
+        )
+        read_only_fields = fields
+
+
+class HeartbeatSerializer(serializers.Serializer):
+    """Body of POST .../lessons/{id}/progress/."""
+    position  = serializers.IntegerField(min_value=0)   # seconds into the video
+    completed = serializers.BooleanField(default=False)
+
+
+class LessonProgressSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = LessonProgress
+        fields = ("lesson", "position_seconds", "completed", "completed_at", "last_seen_at")
+        read_only_fields = fields
@@ -0,0 +1,34 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from course.stats import adjust_course_counters
+from enrollments.access import forget_enrollment
+from enrollments.models import Enrollment
+
+
+@receiver(post_save, sender=Enrollment)
+@receiver(post_delete, sender=Enrollment)
+def drop_cached_access(sender, instance, **kwargs):
+    """Status changes and deletes must not be answered from cache."""
+    forget_enrollment(instance.student_id, instance.course_id)
+
+
+@receiver(post_save, sender=Enrollment)
+def count_saved_enrollment(sender, instance, created, **kwargs):
+    """Course.enrollment_count counts active and completed enrollments."""
+    if created:
+        was_granting = False
+    else:
+        loaded = getattr(instance, "_loaded_status", None)
+        if loaded is None:
+            return
+        was_granting = loaded in Enrollment.GRANTING
+    if was_granting != instance.grants_access:
+        adjust_course_counters(instance.course_id, enrollment_count=1 if instance.grants_access else -1)
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Enrollment)
+def count_deleted_enrollment(sender, instance, **kwargs):
+    if instance.grants_access:
+        adjust_course_counters(instance.course_id, enrollment_count=-1)
@@ -1,3 +1,213 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from enrollments.access import is_enrolled
+from enrollments.models import Enrollment, LessonProgress
+from enrollments import progress
+from enrollments.progress import LOCK_KEY, SEQ_KEY, SLOT_KEY, buffer_is_shared, flush_progress
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class EnrollmentTests(APITestCase):
+    """Idempotent enroll, and lessons gated behind enrollment."""
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+        category = Category.objects.create(title="Programming")
+        self.course = Course.objects.create(
+            title="Python 101", category=category, instructor=self.teacher,
+        )
+        self.preview = Lesson.objects.create(course=self.course, title="Intro", order=0, is_preview=True)
+        self.lesson = Lesson.objects.create(course=self.course, title="Deep dive", order=1)
+        self.enroll_url = reverse("course-enroll", args=[self.course.id])
+        self.client.force_authenticate(self.student)
+
+    def _lesson(self, lesson):
+        return self.client.get(reverse("course-lessons-detail", args=[self.course.id, lesson.id]))
+
+    def test_enroll_is_idempotent(self):
+        first = self.client.post(self.enroll_url)
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        again = self.client.post(self.enroll_url)
+        self.assertEqual(again.status_code, status.HTTP_200_OK)
+        self.assertEqual(again.data["id"], first.data["id"])
+        self.assertEqual(Enrollment.objects.count(), 1)
+
+    def test_enroll_reactivates_a_cancelled_enrollment(self):
+        Enrollment.objects.create(student=self.student, course=self.course, status="cancelled")
+        resp = self.client.post(self.enroll_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["status"], "active")
+
+    def test_paid_course_needs_checkout(self):
+        self.course.type, self.course.price = "paid", 10
+        self.course.save()
+        resp = self.client.post(self.enroll_url)
+        self.assertEqual(resp.status_code, status.HTTP_402_PAYMENT_REQUIRED)
+
+    def test_lessons_are_gated_until_enrolled(self):
+        self.assertEqual(self._lesson(self.preview).status_code, status.HTTP_200_OK)
+        self.assertEqual(self._lesson(self.lesson).status_code, status.HTTP_403_FORBIDDEN)
+
+        listed = self.client.get(reverse("course-lessons-list", args=[self.course.id]))
+        self.assertEqual([row["id"] for row in listed.data["results"]], [self.preview.id])
+
+        self.client.post(self.enroll_url)  # must drop the cached "not enrolled"
+        self.assertEqual(self._lesson(self.lesson).status_code, status.HTTP_200_OK)
+
+    def test_instructor_reads_without_enrolling(self):
+        self.client.force_authenticate(self.teacher)
+        self.assertEqual(self._lesson(self.lesson).status_code, status.HTTP_200_OK)
+
+    def test_access_check_is_cached(self):
+        with self.assertNumQueries(1):
+            self.assertFalse(is_enrolled(self.student.id, self.course.id))
+        with self.assertNumQueries(0):
+            self.assertFalse(is_enrolled(self.student.id, self.course.id))
+
+        Enrollment.objects.create(student=self.student, course=self.course)  # signal drops the key
+        self.assertTrue(is_enrolled(self.student.id, self.course.id))
+
+    def test_my_enrollments(self):
+        self.client.post(self.enroll_url)
+        resp = self.client.get(reverse("enrollment-list"))
+        self.assertEqual([row["course"] for row in resp.data["results"]], [self.course.id])
+
+
+class LessonProgressTests(APITestCase):
+    """Heartbeats are buffered and flushed in bulk; completions write through."""
+
+    def setUp(self):
+        cache.clear()
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=teacher,
+        )
+        self.lessons = [
+            Lesson.objects.create(course=self.course, title=f"Lesson {i}", order=i) for i in range(2)
+        ]
+        Enrollment.objects.create(student=self.student, course=self.course)
+        self.client.force_authenticate(self.student)
+        # the test process is the only process: locmem is as good as shared here
+        shared = mock.patch("enrollments.progress.buffer_is_shared", return_value=True)
+        shared.start()
+        self.addCleanup(shared.stop)
+
+    def _beat(self, lesson_id, **body):
+        url = reverse("lesson-progress", args=[self.course.id, lesson_id])
+        return self.client.post(url, body, format="json")
+
+    def test_heartbeats_are_buffered_then_flushed_once(self):
+        self._beat(self.lessons[0].id, position=1)  # warms the enrollment cache
+        with self.assertNumQueries(0):
+            for position in (10, 20, 30):
+                resp = self._beat(self.lessons[0].id, position=position)
+                self.assertEqual(resp.status_code, status.HTTP_202_ACCEPTED)
+        self.assertFalse(LessonProgress.objects.exists())
+
+        self.assertEqual(flush_progress(), 1)
+        self.assertEqual(LessonProgress.objects.get().position_seconds, 30)
+        self.assertEqual(flush_progress(), 0)  # nothing left in the buffer
+
+    def test_per_process_cache_writes_through(self):
+        with mock.patch("enrollments.progress.buffer_is_shared", return_value=False):
+            self._beat(self.lessons[0].id, position=40)
+        self.assertEqual(LessonProgress.objects.get().position_seconds, 40)
+        self.assertEqual(flush_progress(), 0)
+
+    def test_flush_keeps_a_lock_it_no_longer_owns(self):
+        self._beat(self.lessons[0].id, position=5)
+        upsert = progress._upsert
+
+        def slow_upsert(beats):
+            cache.set(LOCK_KEY, "next-flusher")   # ours expired, another flusher took it
+            return upsert(beats)
+
+        with mock.patch("enrollments.progress._upsert", slow_upsert):
+            self.assertEqual(flush_progress(), 1)
+        self.assertEqual(cache.get(LOCK_KEY), "next-flusher")
+
+    def test_flush_waits_for_a_slot_being_written(self):
+        cache.add(SEQ_KEY, 0, timeout=None)
+        slot = cache.incr(SEQ_KEY)           # reserved, heartbeat not written yet
+        self._beat(self.lessons[1].id, position=5)
+        self.assertEqual(flush_progress(), 0)
+
+        cache.set(SLOT_KEY.format(slot), (self.student.id, self.course.id, self.lessons[0].id, 7,
+                                          timezone.now()))
+        self.assertEqual(flush_progress(), 2)
+        self.assertEqual(LessonProgress.objects.get(lesson=self.lessons[0]).position_seconds, 7)
+
+    def test_evicted_slot_is_skipped_on_the_next_flush(self):
+        cache.add(SEQ_KEY, 0, timeout=None)
+        cache.incr(SEQ_KEY)                  # never written
+        self._beat(self.lessons[1].id, position=5)
+        self.assertEqual(flush_progress(), 0)
+        self.assertEqual(flush_progress(), 1)
+        self.assertEqual(flush_progress(), 0)
+
+    def test_unknown_lesson_is_dropped_at_flush(self):
+        self._beat(999999, position=5)
+        self._beat(self.lessons[1].id, position=5)
+        self.assertEqual(flush_progress(), 1)
+
+    def test_completion_updates_course_percentage(self):
+        resp = self._beat(self.lessons[0].id, position=600, completed=True)
+        self.assertEqual(resp.data["course_progress"], 50)
+
+        # a late heartbeat for a finished lesson must not undo the completion
+        self._beat(self.lessons[0].id, position=10)
+        flush_progress()
+        self.assertTrue(LessonProgress.objects.get(lesson=self.lessons[0]).completed)
+
+        self._beat(self.lessons[1].id, position=600, completed=True)
+        enrollment = Enrollment.objects.get()
+        self.assertEqual((enrollment.progress, enrollment.status), (100, "completed"))
+
+        resp = self.client.get(reverse("course-progress", args=[self.course.id]))
+        self.assertEqual(resp.data["progress"], 100)
+        self.assertEqual(len(resp.data["lessons"]), 2)
+
+    def test_not_enrolled_is_forbidden(self):
+        Enrollment.objects.all().delete()
+        resp = self._beat(self.lessons[0].id, position=5)
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ProgressBufferBackendTests(APITestCase):
+    """Only a cache every process shares can hold the buffer."""
+
+    @override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379",
+    }})
+    def test_redis_is_shared(self):
+        self.assertTrue(buffer_is_shared())
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_locmem_is_not_shared(self):
+        self.assertFalse(buffer_is_shared())
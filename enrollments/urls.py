@@ -0,0 +1,10 @@
+from django.urls import path
+from enrollments.views import CourseProgressView, EnrollView, LessonProgressView, MyEnrollmentsView
+
+urlpatterns = [
+    path('enrollments/', MyEnrollmentsView.as_view(), name='enrollment-list'),
+    path('courses/<int:course_pk>/enroll/', EnrollView.as_view(), name='course-enroll'),
+    path('courses/<int:course_pk>/progress/', CourseProgressView.as_view(), name='course-progress'),
+    path('courses/<int:course_pk>/lessons/<int:lesson_pk>/progress/',
+         LessonProgressView.as_view(), name='lesson-progress'),
+]
@@ -1,3 +1,97 @@
-from django.shortcuts import render
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from backend.instrumentation import TimedSerializerMixin
+from course.models import Course
+from course.pagination import EnrollmentPagination
+from enrollments.access import can_access_course
+from enrollments.models import Enrollment, LessonProgress
+from enrollments.progress import mark_completed, record_heartbeat
+from enrollments.serializers import (
+    EnrollmentSerializer, HeartbeatSerializer, LessonProgressSerializer,
+)
+from lessons.models import Lesson
+
+
+class EnrollView(APIView):
+    """
+    POST /api/courses/{course_pk}/enroll/
+
+    Idempotent: 201 the first time, 200 with the same enrollment afterwards.
+    Paid courses go through checkout instead (402); the payment worker
+    enrolls the student once the provider confirms the charge.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, course_pk):
+        course = get_object_or_404(Course.objects.only("id", "type"), pk=course_pk, is_active=True)
+        if course.is_paid:
+            return Response(
+                {"detail": "This course requires payment. Use the checkout endpoint."},
+                status=status.HTTP_402_PAYMENT_REQUIRED,
+            )
+        # request.user.id comes straight from the token claims: no user query
+        enrollment, created = Enrollment.objects.enroll(request.user.id, course.pk)
+        return Response(
+            EnrollmentSerializer(enrollment).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class MyEnrollmentsView(TimedSerializerMixin, ListAPIView):
+    """GET /api/enrollments/ — the caller's enrollments, newest first."""
+    serializer_class = EnrollmentSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = EnrollmentPagination
+
+    def get_queryset(self):
+        return Enrollment.objects.filter(student_id=self.request.user.id)
+
+
+class LessonProgressView(APIView):
+    """
+    POST /api/courses/{course_pk}/lessons/{lesson_pk}/progress/
+         {"position": 312}                     → 202, buffered (no query)
+         {"position": 900, "completed": true}  → 200, written now
+
+    Heartbeats land in the database on the next flush (see
+    enrollments/progress.py), so reads may trail by a few seconds.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, course_pk, lesson_pk):
+        # cached enrollment check; the lesson id is validated at flush time
+        if not can_access_course(request.user, course_pk):
+            return Response({"detail": "Enroll in this course to track progress."},
+                            status=status.HTTP_403_FORBIDDEN)
+        beat = HeartbeatSerializer(data=request.data)
+        beat.is_valid(raise_exception=True)
+        position = beat.validated_data["position"]
+
+        if not beat.validated_data["completed"]:
+            record_heartbeat(request.user.id, course_pk, lesson_pk, position)
+            return Response(status=status.HTTP_202_ACCEPTED)
+
+        get_object_or_404(Lesson.objects.only("id"), pk=lesson_pk, course_id=course_pk)
+        percent = mark_completed(request.user.id, course_pk, lesson_pk, position)
+        return Response({"course_progress": percent}, status=status.HTTP_200_OK)
+
+
+class CourseProgressView(APIView):
+    """GET /api/courses/{course_pk}/progress/ — the caller's per-lesson progress."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, course_pk):
+        enrollment = get_object_or_404(
+            Enrollment.objects.only("progress"), student_id=request.user.id, course_id=course_pk,
+        )
+        lessons = LessonProgress.objects.filter(student_id=request.user.id, course_id=course_pk)
+        return Response({
+            "course": course_pk,
+            "progress": enrollment.progress,
+            "lessons": LessonProgressSerializer(lessons, many=True).data,
+        })
@@ -4,4 +4,51 @@ from .models import Lesson
 class LessonSerializer(serializers.ModelSerializer):
     class Meta:
         model = Lesson
-        fields = '__all__'
+        exclude = ('search_vector',)  # internal, maintained by a DB trigger
+        # (course, order) uniqueness is checked in validate() instead of by
+        # DRF's UniqueTogetherValidator, which would make `order` required;
+        # an omitted order means "append to the end" (see perform_create).
+        validators = []
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        order = attrs.get('order')
+        if order is None:
+            return attrs
+
+        view = self.context.get('view')
+        course_id = (
+            (view.kwargs.get('course_pk') if view else None)
+            or getattr(attrs.get('course'), 'pk', None)
+            or getattr(self.instance, 'course_id', None)
+        )
+        taken = Lesson.objects.filter(course_id=course_id, order=order)
+        if self.instance is not None:
+            taken = taken.exclude(pk=self.instance.pk)
+        if taken.exists():
+            raise serializers.ValidationError({'order': 'Another lesson of this course already has this position.'})
+        return attrs
+
+
+class LessonBulkSerializer(LessonSerializer):
+    """
+    Row serializer for bulk imports: the course is a plain id and `video` is
+    an existing storage path. Course existence and (course, order) clashes
+    are checked once per batch by `LessonImporter`, not once per row.
+    """
+    id = serializers.IntegerField(required=False)
+    course = serializers.IntegerField(source='course_id')
+    video = serializers.CharField(required=False, allow_blank=True, allow_null=True)
+
+    def validate(self, attrs):
+        return attrs
+
+
+class LessonReorderSerializer(serializers.Serializer):
+    """Body of PATCH .../lessons/reorder/: every lesson id of the course, in order."""
+    order = serializers.ListField(child=serializers.IntegerField(), allow_empty=False)
+
+    def validate_order(self, value):
+        if len(value) != len(set(value)):
+            raise serializers.ValidationError('Lesson ids must not repeat.')
+        return value
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0003_course_course_cour_created_e78d14_idx'),
+        ('lessons', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lesson',
+            index=models.Index(fields=['course', 'order', 'id'], name='lessons_les_course__8b44ec_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:59
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Filled by a trigger so bulk writes keep the vector in sync too.
+SEARCH_TRIGGER_SQL = """
+CREATE FUNCTION lessons_lesson_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('pg_catalog.english', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER lessons_lesson_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, content
+    ON lessons_lesson
+    FOR EACH ROW EXECUTE FUNCTION lessons_lesson_search_vector_update();
+
+-- backfill existing rows
+UPDATE lessons_lesson SET title = title;
+"""
+
+DROP_SEARCH_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS lessons_lesson_search_vector_trigger ON lessons_lesson;
+DROP FUNCTION IF EXISTS lessons_lesson_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0005_course_search_vector_and_more'),
+        ('lessons', '0002_lesson_lessons_les_course__8b44ec_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='lesson',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='lessons_les_search__9a647c_gin'),
+        ),
+        migrations.RunSQL(SEARCH_TRIGGER_SQL, DROP_SEARCH_TRIGGER_SQL),
+    ]
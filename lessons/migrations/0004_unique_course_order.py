@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:09
+
+import django.db.models.constraints
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def renumber_duplicate_orders(apps, schema_editor):
+    """
+    Lessons used to default to order=0, so a course can hold duplicates.
+    Renumber only those courses, 0..n-1 by (order, id), before the unique
+    constraint goes on.
+    """
+    Lesson = apps.get_model("lessons", "Lesson")
+    clashing = set(
+        Lesson.objects.values("course_id", "order")
+        .annotate(n=Count("id")).filter(n__gt=1)
+        .values_list("course_id", flat=True)
+    )
+    for course_id in clashing:
+        lessons = list(Lesson.objects.filter(course_id=course_id).order_by("order", "id"))
+        for position, lesson in enumerate(lessons):
+            lesson.order = position
+        Lesson.objects.bulk_update(lessons, ["order"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('course', '0005_course_search_vector_and_more'),
+        ('lessons', '0003_lesson_search_vector_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(renumber_duplicate_orders, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='lesson',
+            constraint=models.UniqueConstraint(deferrable=django.db.models.constraints.Deferrable['DEFERRED'], fields=('course', 'order'), name='lessons_lesson_unique_course_order'),
+        ),
+    ]
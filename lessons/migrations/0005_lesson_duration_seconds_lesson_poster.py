@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lessons', '0004_unique_course_order'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lesson',
+            name='duration_seconds',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='lesson',
+            name='poster',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='lessons/posters/'),
+        ),
+    ]
@@ -1,18 +1,80 @@
 
 # Create your models here.
-from django.db import models
+from django.db import connection, models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from course.models import Course
+from course.cache import bump_version
+
+class LessonManager(models.Manager):
+    def next_order(self, course_id):
+        """Position right after the course's current last lesson."""
+        last = self.filter(course_id=course_id).aggregate(last=models.Max("order"))["last"]
+        return 0 if last is None else last + 1
+
+    def enforce_unique_order(self):
+        """
+        Check the deferred (course, order) constraint now rather than at COMMIT,
+        so a clash surfaces as an IntegrityError inside the caller's atomic block.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute("SET CONSTRAINTS lessons_lesson_unique_course_order IMMEDIATE")
+
 
 class Lesson(models.Model):
     course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="lessons")
     title = models.CharField(max_length=255)
     content = models.TextField(blank=True)
     video = models.FileField(upload_to="lessons/videos/", null=True, blank=True)
+    # filled in from the video by the media worker (uploads/jobs.py)
+    duration_seconds = models.PositiveIntegerField(null=True, blank=True, editable=False)
+    poster = models.ImageField(upload_to="lessons/posters/", null=True, blank=True, editable=False)
     order = models.PositiveIntegerField(default=0)
     is_preview = models.BooleanField(default=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    # kept up to date by a database trigger from title + content (migration 0003)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = LessonManager()
+
     class Meta:
         ordering = ["order"]
+        indexes = [
+            models.Index(fields=["course", "order", "id"]),  # keyset pagination per course
+            GinIndex(fields=["search_vector"]),  # full-text search
+        ]
+        constraints = [
+            # DEFERRED so a reorder can swap positions inside one transaction;
+            # the check runs at COMMIT against the final ordering.
+            models.UniqueConstraint(
+                fields=["course", "order"],
+                name="lessons_lesson_unique_course_order",
+                deferrable=models.Deferrable.DEFERRED,
+            ),
+        ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # remembered so the counter signals can tell what a save changed
+        video = instance.__dict__.get("video")
+        instance._loaded = {
+            "course_id": instance.__dict__.get("course_id"),
+            "is_preview": instance.__dict__.get("is_preview"),
+            "video": getattr(video, "name", video),
+        }
+        if "duration_seconds" in instance.__dict__:   # absent when deferred
+            instance._loaded["duration_seconds"] = instance.duration_seconds
+        return instance
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        bump_version("lesson")
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        bump_version("lesson")
+        return result
+
     def __str__(self):
         return f"{self.course.title} - {self.title}"
@@ -0,0 +1,52 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from course.stats import adjust_course_counters
+from lessons.models import Lesson
+
+
+@receiver(post_save, sender=Lesson)
+def count_saved_lesson(sender, instance, created, **kwargs):
+    """
+    Keep Course.lesson_count / preview_count / total_duration_seconds in
+    step with row-level writes.
+    """
+    if created:
+        adjust_course_counters(
+            instance.course_id, lesson_count=1, preview_count=int(instance.is_preview),
+            total_duration_seconds=instance.duration_seconds or 0,
+        )
+        return
+
+    loaded = getattr(instance, "_loaded", {})
+    old_course, was_preview = loaded.get("course_id"), loaded.get("is_preview")
+    if old_course is None or was_preview is None:
+        return  # not loaded from the database (or deferred): nothing to compare
+    seconds = instance.duration_seconds or 0
+    old_seconds = loaded.get("duration_seconds", instance.duration_seconds) or 0
+    if old_course != instance.course_id:
+        adjust_course_counters(
+            old_course, lesson_count=-1, preview_count=-int(was_preview),
+            total_duration_seconds=-old_seconds,
+        )
+        adjust_course_counters(
+            instance.course_id, lesson_count=1, preview_count=int(instance.is_preview),
+            total_duration_seconds=seconds,
+        )
+    else:
+        adjust_course_counters(
+            instance.course_id, preview_count=int(instance.is_preview) - int(was_preview),
+            total_duration_seconds=seconds - old_seconds,
+        )
+    instance._loaded = {
+        **loaded, "course_id": instance.course_id, "is_preview": instance.is_preview,
+        "duration_seconds": instance.duration_seconds,
+    }
+
+
+@receiver(post_delete, sender=Lesson)
+def count_deleted_lesson(sender, instance, **kwargs):
+    adjust_course_counters(
+        instance.course_id, lesson_count=-1, preview_count=-int(instance.is_preview),
+        total_duration_seconds=-(instance.duration_seconds or 0),
+    )
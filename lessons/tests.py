@@ -1,3 +1,93 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from lessons.lesson_serializers import LessonSerializer
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class LessonReorderTests(APITestCase):
+    """PATCH .../lessons/reorder/ rewrites the whole curriculum order at once."""
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=self.teacher,
+        )
+        self.lessons = [
+            Lesson.objects.create(course=self.course, title=f"Lesson {i}", order=i)
+            for i in range(3)
+        ]
+        self.url = reverse("course-lessons-reorder", args=[self.course.id])
+        self.client.force_authenticate(self.teacher)
+
+    def _orders(self):
+        return list(Lesson.objects.filter(course=self.course).values_list("id", flat=True))
+
+    def test_reorder_swaps_positions(self):
+        a, b, c = (lesson.id for lesson in self.lessons)
+        resp = self.client.patch(self.url, {"order": [c, a, b]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._orders(), [c, a, b])
+
+    def test_reorder_must_list_every_lesson(self):
+        a, b, _ = (lesson.id for lesson in self.lessons)
+        resp = self.client.patch(self.url, {"order": [b, a]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        resp = self.client.patch(self.url, {"order": [b, a, a]}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_the_owner_can_reorder(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="pass123", role="teacher",
+        )
+        self.client.force_authenticate(other)
+        order = [lesson.id for lesson in reversed(self.lessons)]
+        resp = self.client.patch(self.url, {"order": order}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_create_without_order_appends(self):
+        resp = self.client.post(
+            reverse("course-lessons-list", args=[self.course.id]), {"title": "Lesson 3", "course": self.course.id}, format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(resp.data["order"], 3)
+
+    def test_create_with_taken_order_is_rejected(self):
+        resp = self.client.post(
+            reverse("course-lessons-list", args=[self.course.id]),
+            {"title": "Clash", "order": 1, "course": self.course.id}, format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_position_taken_after_validation_is_a_400(self):
+        # as if a concurrent create took position 1 between validate() and the insert
+        with mock.patch.object(LessonSerializer, "validate", lambda serializer, attrs: attrs):
+            resp = self.client.post(
+                reverse("course-lessons-list", args=[self.course.id]),
+                {"title": "Clash", "order": 1, "course": self.course.id}, format="json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_import_appends_and_checks_positions(self):
+        url = reverse("course-lessons-bulk", args=[self.course.id])
+        resp = self.client.post(url, [{"title": "A"}, {"title": "B"}], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            list(Lesson.objects.filter(course=self.course).values_list("order", flat=True)),
+            [0, 1, 2, 3, 4],
+        )
+
+        resp = self.client.post(url, [{"title": "C", "order": 0}], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
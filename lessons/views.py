@@ -1,32 +1,129 @@
 from django.shortcuts import render
 
 # Create your views here.
+from django.db import transaction
+from django.db.models import F
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 from .models import Lesson
-from .lesson_serializers import LessonSerializer
+from .lesson_serializers import LessonSerializer, LessonReorderSerializer
 from rest_framework.permissions import IsAuthenticated
 from course.permissions import IsCourseTeacherOrAdmin #custom permission to check if the user is a teacher or admin of the course
+from course.pagination import LessonPagination
+from course.bulk import LessonImporter, request_records
+from course.models import Course
+from course.cache import bump_version
+from backend.instrumentation import TimedSerializerMixin
+from enrollments.access import can_access_course
+from enrollments.permissions import IsEnrolledOrPreview
+from uploads.files import serve_file
 
-class LessonViewSet(ModelViewSet):
+class LessonViewSet(TimedSerializerMixin, ModelViewSet):
     """
     ViewSet for managing lessons nested under a course.
     URL: /api/courses/<course_pk>/lessons/
     """
     serializer_class = LessonSerializer
-    permission_classes = [IsCourseTeacherOrAdmin]
+    permission_classes = [IsCourseTeacherOrAdmin, IsEnrolledOrPreview]
+    pagination_class = LessonPagination  # keyset on (order, id)
+    read_from_replica = True  # safe-method reads (backend/db_router.py)
 
     def get_queryset(self):
         """
         Returns the queryset of lessons filtered by the course primary key.
         """
         course_pk = self.kwargs.get('course_pk')
-        return Lesson.objects.filter(course_id=course_pk)
+        queryset = Lesson.objects.filter(course_id=course_pk).defer("search_vector")
+        if self.action == 'list' and not can_access_course(self.request.user, course_pk):
+            # outsiders only see the free previews of the curriculum
+            queryset = queryset.filter(is_preview=True)
+        elif self.action in ('retrieve', 'video'):
+            # lets IsEnrolledOrPreview recognise the instructor without a second query
+            queryset = queryset.annotate(course_instructor_id=F('course__instructor_id'))
+        return queryset
     
     def perform_create(self, serializer):
-        course_id = self.kwargs['course_pk']
-        serializer.save(course_id=course_id)
         """
         Automatically assign the course to the lesson during creation,
         using the course ID from the URL, not from request data.
+        Without an explicit `order` the lesson is appended to the end.
+        """
+        course_id = self.kwargs['course_pk']
+        extra = {}
+        with transaction.atomic():
+            # lock the course so two creates can't both take the same position
+            Course.objects.select_for_update().filter(pk=course_id).first()
+            if 'order' in serializer.validated_data:
+                self._check_order_free(course_id, serializer.validated_data['order'])
+            else:
+                extra['order'] = Lesson.objects.next_order(course_id)
+            serializer.save(course_id=course_id, **extra)
+
+    @staticmethod
+    def _check_order_free(course_id, order):
+        """
+        LessonSerializer.validate checked this before the course was locked;
+        a concurrent write may have taken the position since. Checked again
+        under the lock, so it is a 400 rather than an IntegrityError from the
+        deferred (course, order) constraint at commit.
+        """
+        if Lesson.objects.filter(course_id=course_id, order=order).exists():
+            raise ValidationError({'order': ['Another lesson of this course already has this position.']})
+
+    # GET /courses/{course_pk}/lessons/{pk}/video/ — seekable: honours Range,
+    # or hands the file to nginx / Apache when FILE_SERVE_BACKEND says so
+    @action(detail=True, methods=["get"])
+    def video(self, request, course_pk=None, pk=None):
+        return serve_file(request, self.get_object().video)
+
+    # POST /courses/{course_pk}/lessons/bulk/ — a whole curriculum in one request
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request, course_pk=None):
+        course = get_object_or_404(Course.objects.only("id", "instructor_id"), pk=course_pk)
+        self.check_object_permissions(request, course)  # owner teacher or admin
+        result = LessonImporter(scope={"course_id": course.pk}).run(request_records(request))
+        return Response(result, status=status.HTTP_201_CREATED)
+         
+    # PATCH /courses/{course_pk}/lessons/reorder/  {"order": [5, 2, 9, ...]}
+    @action(detail=False, methods=["patch"], url_path="reorder")
+    def reorder(self, request, course_pk=None):
+        """
+        Apply a whole new curriculum order in one statement.
+
+        The course row is locked for the duration, so concurrent editors
+        queue up instead of interleaving; the deferred (course, order) unique
+        constraint lets positions swap freely and is checked once at the end.
         """
-         
\ No newline at end of file
+        payload = LessonReorderSerializer(data=request.data)
+        payload.is_valid(raise_exception=True)
+        ids = payload.validated_data["order"]
+
+        with transaction.atomic():
+            course = get_object_or_404(
+                Course.objects.select_for_update().only("id", "instructor_id"), pk=course_pk,
+            )
+            self.check_object_permissions(request, course)
+
+            lessons = list(Lesson.objects.filter(course_id=course.pk).only("id", "order"))
+            if set(ids) != {lesson.id for lesson in lessons}:
+                return Response(
+                    {"order": ["Must list every lesson of this course exactly once."]},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            position = {lesson_id: index for index, lesson_id in enumerate(ids)}
+            changed = []
+            for lesson in lessons:
+                if lesson.order != position[lesson.id]:
+                    lesson.order = position[lesson.id]
+                    changed.append(lesson)
+            # one UPDATE ... SET order = CASE id WHEN ... END
+            Lesson.objects.bulk_update(changed, ["order"])
+            Lesson.objects.enforce_unique_order()
+
+        bump_version("lesson")
+        return Response({"order": ids}, status=status.HTTP_200_OK)
@@ -1,3 +1,7 @@
 from django.contrib import admin
-
+from .models import Order, Payment, WebhookEvent
 # Register your models here.
+
+admin.site.register(Order)
+admin.site.register(Payment)
+admin.site.register(WebhookEvent)
@@ -0,0 +1,33 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from payments.processing import process_pending_events
+
+
+class Command(BaseCommand):
+    help = (
+        "Apply stored payment webhook events (mark orders paid, enroll students). "
+        "Safe to run several workers at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true",
+                            help="drain the queue and exit instead of polling")
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--interval", type=float, default=1.0,
+                            help="seconds to sleep when the queue is empty")
+
+    def handle(self, *args, **options):
+        total = 0
+        try:
+            while True:
+                claimed = process_pending_events(options["batch_size"])
+                total += claimed
+                if not claimed:
+                    if options["once"]:
+                        break
+                    time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"{total} payment event(s) handled"))
@@ -1,3 +1,137 @@
+from django.conf import settings
 from django.db import models
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
 
-# Create your models here.
+from course.models import Course
+
+
+# ---------------------------------------------------------------------------
+# Order — one checkout attempt for one paid course
+# ---------------------------------------------------------------------------
+class Order(models.Model):
+
+    class Status(models.TextChoices):
+        PENDING   = "pending",   _("Pending")
+        PAID      = "paid",      _("Paid")
+        FAILED    = "failed",    _("Failed")
+        CANCELLED = "cancelled", _("Cancelled")
+        # charged, but the course was already paid for by another order
+        REFUND_DUE = "refund_due", _("Refund due")
+
+    student  = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.PROTECT,
+        related_name="orders",
+    )
+    course   = models.ForeignKey(Course, on_delete=models.PROTECT, related_name="orders")
+    amount   = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3, default=settings.PAYMENT_CURRENCY)
+    status   = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+
+    # client-supplied Idempotency-Key: retrying a checkout returns the same order
+    idempotency_key = models.CharField(max_length=255)
+    # the provider's checkout session id, set once the session exists
+    provider_ref    = models.CharField(max_length=255, blank=True, db_index=True)
+    checkout_url    = models.URLField(max_length=500, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    paid_at    = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("student", "idempotency_key"),
+                name="payments_order_unique_idempotency_key",
+            ),
+            # a student can pay for a course only once
+            models.UniqueConstraint(
+                fields=("student", "course"),
+                condition=Q(status="paid"),
+                name="payments_order_unique_paid_course",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"Order {self.pk} – {self.course_id} ({self.status})"
+
+
+# ---------------------------------------------------------------------------
+# Payment — a settled charge reported by the provider
+# ---------------------------------------------------------------------------
+class Payment(models.Model):
+
+    class Status(models.TextChoices):
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED    = "failed",    _("Failed")
+        REFUNDED  = "refunded",  _("Refunded")
+
+    order    = models.ForeignKey(Order, on_delete=models.PROTECT, related_name="payments")
+    provider = models.CharField(max_length=50)
+    # the provider's charge id doubles as the idempotency key for webhooks
+    provider_payment_id = models.CharField(max_length=255)
+    amount   = models.DecimalField(max_digits=10, decimal_places=2)
+    currency = models.CharField(max_length=3)
+    status   = models.CharField(max_length=20, choices=Status.choices)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("provider", "provider_payment_id"),
+                name="payments_payment_unique_provider_id",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.provider}:{self.provider_payment_id} ({self.status})"
+
+
+# ---------------------------------------------------------------------------
+# WebhookEvent — raw provider notifications, processed by a worker
+# ---------------------------------------------------------------------------
+class WebhookEvent(models.Model):
+
+    class Status(models.TextChoices):
+        PENDING   = "pending",   _("Pending")
+        PROCESSED = "processed", _("Processed")
+        FAILED    = "failed",    _("Failed")
+
+    provider = models.CharField(max_length=50)
+    event_id = models.CharField(max_length=255)
+    type     = models.CharField(max_length=100)
+    payload  = models.JSONField()               # normalised by the provider adapter
+    raw      = models.TextField(blank=True)     # request body as received, for audits
+    status   = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error    = models.TextField(blank=True)
+
+    received_at  = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    # a failed event waits (exponentially longer each time) before its next try
+    next_attempt_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("received_at",)
+        constraints = [
+            # providers redeliver: the same event is stored (and applied) once
+            models.UniqueConstraint(
+                fields=("provider", "event_id"),
+                name="payments_webhookevent_unique_event",
+            ),
+        ]
+        indexes = [
+            # the worker's queue: small, because processed rows drop out of it
+            models.Index(
+                fields=("received_at",),
+                condition=Q(status="pending"),
+                name="payments_webhook_pending_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.provider}:{self.event_id} {self.type} ({self.status})"
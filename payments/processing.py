@@ -0,0 +1,125 @@
+"""
+Webhook event worker.
+
+The webhook endpoint only stores events; this module applies them. Workers
+claim pending events with SELECT ... FOR UPDATE SKIP LOCKED, so any number
+of them can run side by side without waiting on, or double-applying, each
+other's events. Each event runs in its own savepoint: one bad event is
+retried later without rolling back the rest of the batch. "Later" backs off
+exponentially (PAYMENT_EVENT_RETRY_DELAY, doubling per attempt), so a short
+outage doesn't burn through PAYMENT_EVENT_MAX_ATTEMPTS in one go.
+"""
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from enrollments.models import Enrollment
+from payments.models import Order, Payment, WebhookEvent
+from payments.providers import PAYMENT_FAILED, PAYMENT_SUCCEEDED
+
+logger = logging.getLogger(__name__)
+
+
+class PaymentMismatch(Exception):
+    """The provider reports a charge that doesn't match the order."""
+
+
+def process_pending_events(batch_size=None):
+    """Claim and apply up to `batch_size` pending events; return how many were claimed."""
+    batch_size = batch_size or settings.PAYMENT_EVENT_BATCH_SIZE
+    with transaction.atomic():
+        events = list(
+            WebhookEvent.objects.select_for_update(skip_locked=True)
+            .filter(status=WebhookEvent.Status.PENDING)
+            .filter(Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now()))
+            .order_by("received_at")[:batch_size]
+        )
+        for event in events:
+            _process(event)
+    return len(events)
+
+
+def _process(event):
+    event.attempts += 1
+    try:
+        with transaction.atomic():
+            HANDLERS.get(event.type, _ignore)(event)
+    except Exception as exc:
+        logger.exception("Payment event %s failed (attempt %s)", event.pk, event.attempts)
+        event.error = f"{type(exc).__name__}: {exc}"
+        if event.attempts >= settings.PAYMENT_EVENT_MAX_ATTEMPTS:
+            event.status = WebhookEvent.Status.FAILED
+        else:
+            event.next_attempt_at = timezone.now() + retry_delay(event.attempts)
+    else:
+        event.status = WebhookEvent.Status.PROCESSED
+        event.processed_at = timezone.now()
+        event.error = ""
+    event.save(update_fields=["status", "attempts", "error", "processed_at", "next_attempt_at"])
+
+
+def retry_delay(attempts):
+    """Wait before the next try after `attempts` failures: 30s, 1m, 2m, ... capped."""
+    seconds = settings.PAYMENT_EVENT_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(seconds, settings.PAYMENT_EVENT_MAX_RETRY_DELAY))
+
+
+# ─── Handlers ──────────────────────────────────────────────────────────────
+def _payment_succeeded(event):
+    data = event.payload
+    order = Order.objects.select_for_update().get(pk=data["order_id"])
+    amount = Decimal(str(data["amount"]))
+    currency = data.get("currency", order.currency).lower()
+    if amount != order.amount or currency != order.currency:
+        raise PaymentMismatch(f"charged {amount} {currency}, order is {order.amount} {order.currency}")
+
+    Payment.objects.get_or_create(
+        provider=event.provider,
+        provider_payment_id=data["payment_id"],
+        defaults={
+            "order": order, "amount": amount, "currency": currency,
+            "status": Payment.Status.SUCCEEDED,
+        },
+    )
+    if order.status in (Order.Status.PAID, Order.Status.REFUND_DUE):
+        return  # redelivered, or a second event for the same charge
+
+    order.paid_at = timezone.now()
+    paid_elsewhere = (
+        Order.objects.filter(student_id=order.student_id, course_id=order.course_id, status=Order.Status.PAID)
+        .exclude(pk=order.pk).exists()
+    )
+    if paid_elsewhere:
+        # a second checkout for a course already paid for: the money is taken,
+        # so keep the Payment and leave the order for a refund; one paid order
+        # per course is a constraint, so it can't become PAID
+        logger.warning("Order %s paid for course %s twice; refund due", order.pk, order.course_id)
+        order.status = Order.Status.REFUND_DUE
+        order.save(update_fields=["status", "paid_at", "updated_at"])
+        return
+
+    order.status = Order.Status.PAID
+    order.save(update_fields=["status", "paid_at", "updated_at"])
+    # idempotent: a redelivered or duplicate event can't enroll twice
+    Enrollment.objects.enroll(order.student_id, order.course_id)
+
+
+def _payment_failed(event):
+    Order.objects.filter(
+        pk=event.payload["order_id"], status=Order.Status.PENDING,
+    ).update(status=Order.Status.FAILED, updated_at=timezone.now())
+
+
+def _ignore(event):
+    """Event types we don't act on are simply marked processed."""
+
+
+HANDLERS = {
+    PAYMENT_SUCCEEDED: _payment_succeeded,
+    PAYMENT_FAILED: _payment_failed,
+}
@@ -0,0 +1,70 @@
+"""
+Payment provider adapters.
+
+A provider opens hosted checkout sessions and turns its webhook requests
+into `ProviderEvent`s. The active one is `settings.PAYMENT_PROVIDER`; the
+bundled `FakeProvider` needs no network and signs webhooks with
+`PAYMENT_WEBHOOK_SECRET`, which is what dev and the tests use.
+"""
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import ParseError, PermissionDenied
+
+# Normalised event types the worker understands
+PAYMENT_SUCCEEDED = "payment.succeeded"
+PAYMENT_FAILED = "payment.failed"
+
+
+@dataclass
+class ProviderEvent:
+    event_id: str
+    type: str
+    data: dict = field(default_factory=dict)   # order_id, payment_id, amount, currency
+
+
+class PaymentProvider:
+    name = None
+
+    def create_checkout(self, order):
+        """Open a checkout session; return (provider_ref, checkout_url)."""
+        raise NotImplementedError
+
+    def parse_webhook(self, request):
+        """Verify the request came from the provider and return a ProviderEvent."""
+        raise NotImplementedError
+
+
+class FakeProvider(PaymentProvider):
+    """
+    Local stand-in: checkout sessions are made up and webhooks are JSON
+    bodies signed with HMAC-SHA256 in the X-Fake-Signature header.
+    """
+    name = "fake"
+
+    def create_checkout(self, order):
+        ref = f"fake_cs_{order.pk}"
+        return ref, f"https://payments.example.test/checkout/{ref}"
+
+    def parse_webhook(self, request):
+        body = request.body
+        if not hmac.compare_digest(request.headers.get("X-Fake-Signature", ""), self.sign(body)):
+            raise PermissionDenied("Invalid webhook signature.")
+        try:
+            payload = json.loads(body)
+            return ProviderEvent(payload["id"], payload["type"], payload.get("data", {}))
+        except (ValueError, KeyError, TypeError):
+            raise ParseError("Malformed webhook payload.")
+
+    @staticmethod
+    def sign(body):
+        secret = settings.PAYMENT_WEBHOOK_SECRET.encode()
+        return hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+
+def get_provider():
+    return import_string(settings.PAYMENT_PROVIDER)()
@@ -0,0 +1,15 @@
+from rest_framework import serializers
+
+from payments.models import Order
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = Order
+        fields = (
+            "id", "course", "amount", "currency", "status", "status_display",
+            "checkout_url", "created_at", "paid_at",
+        )
+        read_only_fields = fields
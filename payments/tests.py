@@ -1,3 +1,132 @@
-from django.test import TestCase
+import json
+from datetime import timedelta
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from enrollments.models import Enrollment
+from payments.models import Order, Payment, WebhookEvent
+from payments.processing import process_pending_events, retry_delay
+from payments.providers import FakeProvider
+
+User = get_user_model()
+
+
+class PaymentTests(APITestCase):
+    """Checkout → signed webhook → worker marks the order paid and enrolls once."""
+
+    def setUp(self):
+        cache.clear()
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+        self.course = Course.objects.create(
+            title="Django Pro", type="paid", price="49.00",
+            category=Category.objects.create(title="Programming"), instructor=teacher,
+        )
+        self.checkout_url = reverse("course-checkout", args=[self.course.id])
+        self.client.force_authenticate(self.student)
+
+    def _checkout(self, key="key-1"):
+        return self.client.post(self.checkout_url, HTTP_IDEMPOTENCY_KEY=key)
+
+    def _webhook(self, event_id, order_id, amount="49.00", type="payment.succeeded", signature=None):
+        body = json.dumps({"id": event_id, "type": type, "data": {
+            "order_id": order_id, "payment_id": f"ch_{order_id}", "amount": amount, "currency": "usd",
+        }}).encode()
+        self.client.force_authenticate(None)
+        return self.client.post(
+            reverse("payment-webhook"), body, content_type="application/json",
+            HTTP_X_FAKE_SIGNATURE=signature or FakeProvider.sign(body),
+        )
+
+    def test_checkout_is_idempotent(self):
+        first = self._checkout()
+        self.assertEqual(first.status_code, status.HTTP_201_CREATED)
+        self.assertTrue(first.data["checkout_url"])
+        again = self._checkout()
+        self.assertEqual(again.status_code, status.HTTP_200_OK)
+        self.assertEqual(again.data["id"], first.data["id"])
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_free_course_has_no_checkout(self):
+        Course.objects.filter(pk=self.course.pk).update(type="free", price=0)
+        self.assertEqual(self._checkout().status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_webhook_rejects_bad_signature(self):
+        resp = self._webhook("evt_1", 1, signature="nope")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(WebhookEvent.objects.exists())
+
+    def test_payment_enrolls_exactly_once(self):
+        order_id = self._checkout().data["id"]
+        # the provider redelivers, and also sends a second event for the same charge
+        self._webhook("evt_1", order_id)
+        self._webhook("evt_1", order_id)
+        self._webhook("evt_2", order_id)
+        self.assertEqual(WebhookEvent.objects.count(), 2)
+        self.assertFalse(Enrollment.objects.exists())  # nothing applied inline
+
+        call_command("process_payment_events", "--once", stdout=open("/dev/null", "w"))
+
+        self.assertEqual(Order.objects.get().status, Order.Status.PAID)
+        self.assertEqual(Payment.objects.count(), 1)
+        self.assertEqual(Enrollment.objects.filter(student=self.student, course=self.course).count(), 1)
+        self.assertFalse(WebhookEvent.objects.exclude(status="processed").exists())
+
+    def test_amount_mismatch_is_not_applied(self):
+        order_id = self._checkout().data["id"]
+        self._webhook("evt_1", order_id, amount="1.00")
+        process_pending_events()
+
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.status, WebhookEvent.Status.PENDING)  # retried later
+        self.assertEqual(event.attempts, 1)
+        self.assertIn("PaymentMismatch", event.error)
+        self.assertEqual(Order.objects.get().status, Order.Status.PENDING)
+
+    def test_failed_event_backs_off(self):
+        order_id = self._checkout().data["id"]
+        self._webhook("evt_1", order_id, amount="1.00")
+        self.assertEqual(process_pending_events(), 1)
+        # not claimed again straight away, so an outage can't use up every attempt
+        self.assertEqual(process_pending_events(), 0)
+        event = WebhookEvent.objects.get()
+        self.assertEqual(event.attempts, 1)
+        self.assertGreater(event.next_attempt_at, timezone.now() + timedelta(seconds=20))
+
+        WebhookEvent.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(process_pending_events(), 1)
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 2)
+        self.assertEqual(retry_delay(2), timedelta(seconds=60))
+        self.assertEqual(retry_delay(20), timedelta(seconds=3600))
+
+    def test_second_paid_order_is_recorded_for_refund(self):
+        # two checkouts (two tabs), both paid before either webhook is applied
+        first, second = self._checkout("key-1").data["id"], self._checkout("key-2").data["id"]
+        self._webhook("evt_1", first)
+        self._webhook("evt_2", second)
+        self.assertEqual(process_pending_events(), 2)
+
+        self.assertFalse(WebhookEvent.objects.exclude(status="processed").exists())
+        self.assertEqual(Order.objects.get(pk=first).status, Order.Status.PAID)
+        self.assertEqual(Order.objects.get(pk=second).status, Order.Status.REFUND_DUE)
+        self.assertEqual(Payment.objects.filter(order_id=second).count(), 1)   # the money is on record
+        self.assertEqual(Enrollment.objects.count(), 1)
+
+    def test_failed_payment_marks_the_order(self):
+        order_id = self._checkout().data["id"]
+        self._webhook("evt_1", order_id, type="payment.failed")
+        process_pending_events()
+        self.assertEqual(Order.objects.get().status, Order.Status.FAILED)
@@ -0,0 +1,7 @@
+from django.urls import path
+from payments.views import CheckoutView, WebhookView
+
+urlpatterns = [
+    path('courses/<int:course_pk>/checkout/', CheckoutView.as_view(), name='course-checkout'),
+    path('payments/webhook/', WebhookView.as_view(), name='payment-webhook'),
+]
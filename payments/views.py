@@ -1,3 +1,79 @@
-from django.shortcuts import render
+import uuid
 
-# Create your views here.
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework import status
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from course.models import Course
+from enrollments.access import is_enrolled
+from payments.models import Order, WebhookEvent
+from payments.providers import get_provider
+from payments.serializers import OrderSerializer
+
+
+class CheckoutView(APIView):
+    """
+    POST /api/courses/{course_pk}/checkout/   (header: Idempotency-Key)
+
+    Creates the order and its provider checkout session. Retrying with the
+    same Idempotency-Key returns the same order instead of a second one.
+    Only that order's row is locked, and only while its session is opened.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, course_pk):
+        course = get_object_or_404(Course.objects.only("id", "type", "price"), pk=course_pk, is_active=True)
+        if not course.is_paid:
+            return Response({"detail": "This course is free. Enroll directly."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if is_enrolled(request.user.id, course.pk):
+            return Response({"detail": "Already enrolled in this course."},
+                            status=status.HTTP_409_CONFLICT)
+
+        key = request.headers.get("Idempotency-Key") or uuid.uuid4().hex
+        order, created = Order.objects.get_or_create(
+            student_id=request.user.id, idempotency_key=key,
+            defaults={"course_id": course.pk, "amount": course.price},
+        )
+        if order.course_id != course.pk:
+            return Response({"detail": "This Idempotency-Key was used for another course."},
+                            status=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+        if not order.provider_ref:
+            with transaction.atomic():
+                order = Order.objects.select_for_update().get(pk=order.pk)
+                if not order.provider_ref:  # a concurrent retry may have won
+                    order.provider_ref, order.checkout_url = get_provider().create_checkout(order)
+                    order.save(update_fields=["provider_ref", "checkout_url", "updated_at"])
+
+        return Response(
+            OrderSerializer(order).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
+class WebhookView(APIView):
+    """
+    POST /api/payments/webhook/
+
+    Verifies and stores the event, then answers at once; the
+    `process_payment_events` worker applies it. Redeliveries of an event
+    already stored are dropped by the (provider, event_id) unique index.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        provider = get_provider()
+        event = provider.parse_webhook(request)
+        WebhookEvent.objects.bulk_create(
+            [WebhookEvent(
+                provider=provider.name, event_id=event.event_id, type=event.type,
+                payload=event.data, raw=request.body.decode("utf-8", "replace"),
+            )],
+            ignore_conflicts=True,
+        )
+        return Response({"received": True}, status=status.HTTP_200_OK)
@@ -0,0 +1,9 @@
+from rest_framework import serializers
+
+
+class SearchHitSerializer(serializers.Serializer):
+    kind      = serializers.CharField()           # "course" | "lesson"
+    id        = serializers.IntegerField()
+    course_id = serializers.IntegerField(source="course_ref")
+    title     = serializers.CharField()
+    rank      = serializers.FloatField()
@@ -0,0 +1,61 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from course.models import Category, Course
+from lessons.models import Lesson
+
+User = get_user_model()
+
+
+class SearchViewTests(APITestCase):
+    """
+    /api/search/ ranks hits from both courses and lessons, relying on the
+    trigger-maintained search_vector columns.
+    """
+
+    def setUp(self):
+        teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        category = Category.objects.create(title="Programming")
+        self.django = Course.objects.create(
+            title="Django for APIs", description="Build REST services",
+            category=category, instructor=teacher,
+        )
+        self.hidden = Course.objects.create(
+            title="Django drafts", description="unpublished", is_active=False,
+            category=category, instructor=teacher,
+        )
+        self.go = Course.objects.create(
+            title="Go basics", description="Goroutines and channels",
+            category=category, instructor=teacher,
+        )
+        self.lesson = Lesson.objects.create(
+            course=self.go, title="Calling Go from a Django service",
+            content="Use gRPC",
+        )
+
+    def _search(self, q):
+        resp = self.client.get(reverse("search"), {"q": q})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return resp.data["results"]
+
+    def test_hits_span_courses_and_lessons_ranked(self):
+        hits = self._search("django")
+        self.assertEqual(
+            [(h["kind"], h["id"]) for h in hits],
+            [("course", self.django.id), ("lesson", self.lesson.id)],
+        )
+        self.assertEqual(hits[1]["course_id"], self.go.id)
+
+    def test_vector_follows_updates(self):
+        self.go.syllabus = "week 1: kubernetes"
+        self.go.save()
+        self.assertEqual([h["id"] for h in self._search("kubernetes")], [self.go.id])
+
+    def test_missing_query_is_400(self):
+        resp = self.client.get(reverse("search"))
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,49 @@
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import CharField, F, Value
+from rest_framework.exceptions import ValidationError
+from rest_framework.generics import ListAPIView
+from rest_framework.permissions import AllowAny
+
+from backend.instrumentation import TimedSerializerMixin
+from course.models import Course
+from course.pagination import SearchPagination
+from lessons.models import Lesson
+from search.serializers import SearchHitSerializer
+
+SEARCH_CONFIG = "english"
+
+
+class SearchView(TimedSerializerMixin, ListAPIView):
+    """
+    GET /api/search/?q=django+orm
+
+    Ranked full-text search over published courses (title, tags, description,
+    syllabus) and their lessons (title, content). Both tables carry a
+    trigger-maintained `search_vector` with a GIN index, so the match is an
+    index lookup and only the hits get ranked.
+    """
+    serializer_class = SearchHitSerializer
+    pagination_class = SearchPagination
+    permission_classes = [AllowAny]
+
+    def get_queryset(self):
+        text = self.request.query_params.get("q", "").strip()
+        if not text:
+            raise ValidationError({"q": "This query parameter is required."})
+
+        query = SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+        rank = SearchRank(F("search_vector"), query)
+
+        courses = (
+            Course.objects.filter(is_active=True, search_vector=query)
+            .order_by()
+            .annotate(kind=Value("course", output_field=CharField()), rank=rank)
+            .values("kind", "id", "title", "rank", course_ref=F("id"))
+        )
+        lessons = (
+            Lesson.objects.filter(course__is_active=True, search_vector=query)
+            .order_by()
+            .annotate(kind=Value("lesson", output_field=CharField()), rank=rank)
+            .values("kind", "id", "title", "rank", course_ref=F("course_id"))
+        )
+        return courses.union(lessons, all=True).order_by("-rank", "kind", "id")
@@ -0,0 +1,201 @@
+"""
+Chunked writes for resumable uploads and ranged reads for serving them.
+
+Neither direction ever holds a whole file in memory: uploads are copied
+from the request stream to disk UPLOAD_CHUNK_SIZE bytes at a time, and
+downloads are either handed to the web server (X-Accel-Redirect /
+X-Sendfile) or streamed from the requested byte range.
+"""
+import fcntl
+import mimetypes
+import os
+import re
+from contextlib import contextmanager
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.files import File
+from django.db import transaction
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+
+from course.models import Course
+from lessons.models import Lesson
+from uploads.models import UploadSession
+
+# target -> (model, file field, accepted content-type prefix)
+TARGETS = {
+    UploadSession.Target.LESSON_VIDEO:  (Lesson, "video", "video/"),
+    UploadSession.Target.COURSE_BANNER: (Course, "banner", "image/"),
+}
+
+
+class UploadConflict(Exception):
+    """Another request is writing to this session right now."""
+
+
+# ─── Targets ───────────────────────────────────────────────────────────────
+def target_course_instructor(target, object_id):
+    """Instructor id of the course owning the target, or None if it doesn't exist."""
+    if target == UploadSession.Target.LESSON_VIDEO:
+        row = Lesson.objects.filter(pk=object_id).values_list("course__instructor_id", flat=True)
+    else:
+        row = Course.objects.filter(pk=object_id).values_list("instructor_id", flat=True)
+    return row.first()
+
+
+# ─── Writing ───────────────────────────────────────────────────────────────
+class _PartialFile(File):
+    """
+    The assembled upload. Exposing temporary_file_path() lets
+    FileSystemStorage move it into place instead of copying it.
+    """
+    def temporary_file_path(self):
+        return self.file.name
+
+
+@contextmanager
+def locked_partial(session):
+    """
+    The session's partial file, opened for appending and exclusively
+    locked, so two PATCHes of the same upload can't interleave.
+    """
+    os.makedirs(settings.UPLOAD_TEMP_DIR, exist_ok=True)
+    with open(session.partial_path, "ab") as out:
+        try:
+            fcntl.flock(out, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadConflict()
+        yield out
+
+
+def append_chunk(out, offset, stream, length):
+    """
+    Write up to `length` bytes from `stream` at `offset` and return how many
+    arrived. A client that disconnects midway keeps what was received, and
+    resumes from there.
+    """
+    # bytes past the recorded offset belong to a request that died before
+    # it could save its progress; the client will send them again
+    out.truncate(offset)
+    out.seek(offset)
+
+    received = 0
+    while received < length:
+        chunk = stream.read(min(settings.UPLOAD_CHUNK_SIZE, length - received))
+        if not chunk:
+            break
+        out.write(chunk)
+        received += len(chunk)
+    out.flush()
+    return received
+
+
+def finalize_upload(session):
+    """Attach the assembled file to its lesson / course and drop the partial."""
+    model, field_name, _ = TARGETS[session.target]
+    instance = model.objects.get(pk=session.object_id)
+    field = getattr(instance, field_name)
+    previous = field.name
+
+    with open(session.partial_path, "rb") as fh:
+        field.save(session.filename, _PartialFile(fh), save=False)
+    instance.save(update_fields=[field_name])
+
+    if os.path.exists(session.partial_path):   # storage copied instead of moving
+        os.remove(session.partial_path)
+    if previous and previous != field.name:
+        storage = field.storage
+        transaction.on_commit(lambda: storage.delete(previous))
+    return field.name
+
+
+def discard_partial(session):
+    try:
+        os.remove(session.partial_path)
+    except FileNotFoundError:
+        pass
+
+
+# ─── Serving ───────────────────────────────────────────────────────────────
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+UNSATISFIABLE = object()
+
+
+def parse_range(header, size):
+    """
+    (start, end) for a single `bytes=` range, UNSATISFIABLE, or None to send
+    the whole file (no header, multiple ranges or anything malformed).
+    """
+    match = RANGE_RE.match((header or "").strip())
+    if not match or match.groups() == ("", ""):
+        return None
+    first, last = match.groups()
+    if first == "":                         # bytes=-500: the last 500 bytes
+        suffix = int(last)
+        if suffix == 0:
+            return UNSATISFIABLE
+        return max(size - suffix, 0), size - 1
+    start = int(first)
+    if last != "" and int(last) < start:
+        return None
+    if start >= size:
+        return UNSATISFIABLE
+    return start, size - 1 if last == "" else min(int(last), size - 1)
+
+
+def _read_range(fh, length):
+    try:
+        while length > 0:
+            chunk = fh.read(min(settings.UPLOAD_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        fh.close()
+
+
+def serve_file(request, field):
+    """
+    Response for a stored FileField value, honouring `Range`.
+
+    FILE_SERVE_BACKEND "nginx" / "sendfile" only sets the offload header —
+    the web server then streams the file (and handles ranges) itself.
+    """
+    if not field:
+        raise Http404("No file.")
+    content_type = mimetypes.guess_type(field.name)[0] or "application/octet-stream"
+
+    backend = settings.FILE_SERVE_BACKEND
+    if backend == "nginx":
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.FILE_SERVE_ACCEL_PREFIX + quote(field.name)
+        return response
+    if backend == "sendfile":
+        response = HttpResponse(content_type=content_type)
+        response["X-Sendfile"] = field.path
+        return response
+
+    try:
+        size = field.size
+    except FileNotFoundError:
+        raise Http404("No file.")
+    byte_range = None if "If-Range" in request.headers else parse_range(request.headers.get("Range"), size)
+
+    if byte_range is UNSATISFIABLE:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif byte_range is None:
+        # whole file; wsgi.file_wrapper can sendfile() it
+        response = FileResponse(field.open("rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        fh = field.open("rb")
+        fh.seek(start)
+        response = StreamingHttpResponse(
+            _read_range(fh, end - start + 1), status=206, content_type=content_type,
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+    response["Accept-Ranges"] = "bytes"
+    return response
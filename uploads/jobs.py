@@ -0,0 +1,217 @@
+"""
+Media job queue: banner thumbnails and video metadata.
+
+Saving a new banner or video queues a `MediaJob` (uploads/signals.py).
+`process_media_jobs` claims a batch with SELECT ... FOR UPDATE SKIP LOCKED,
+marks it running and commits, so no lock is held while the pool works;
+the CPU-heavy part (uploads/media.py) runs in worker processes and only
+the small results come back to be stored next to the originals.
+
+A job whose worker died is picked up again once MEDIA_JOB_TIMEOUT has
+passed; a job that keeps failing is given up on after MEDIA_JOB_MAX_ATTEMPTS.
+"""
+import logging
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future
+from contextlib import ExitStack, contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from course.cache import bump_version
+from course.models import Course
+from course.stats import adjust_course_counters
+from lessons.models import Lesson
+from uploads import media
+from uploads.models import MediaJob
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_media_job(kind, object_id, source_name):
+    """
+    Queue work for this exact file. A job for the same name goes back to
+    pending whatever its state: the name may now hold a new upload.
+    """
+    if source_name:
+        MediaJob.objects.bulk_create(
+            [MediaJob(kind=kind, object_id=object_id, source_name=source_name)],
+            update_conflicts=True,
+            unique_fields=["kind", "object_id", "source_name"],
+            update_fields=["status", "attempts", "error", "result", "created_at", "started_at", "finished_at"],
+        )
+
+
+def process_media_jobs(batch_size=None, executor=None):
+    """
+    Claim and run up to `batch_size` jobs; return how many were claimed.
+    With no `executor` the work runs inline (tests, one-off commands).
+    """
+    jobs = _claim(batch_size or settings.MEDIA_JOB_BATCH_SIZE)
+    submit = executor.submit if executor is not None else _run_inline
+
+    with ExitStack() as files:
+        futures = []
+        for job in jobs:
+            try:
+                path = files.enter_context(_local_path(job.source_name))
+                futures.append((job, submit(*_task(job, path))))
+            except Exception as exc:
+                _finish(job, error=exc)
+
+        for job, future in futures:
+            try:
+                output = future.result()
+                with transaction.atomic():
+                    result = APPLY[job.kind](job, output)
+            except Exception as exc:
+                _finish(job, error=exc)
+            else:
+                _finish(job, result=result)
+    return len(jobs)
+
+
+def _claim(batch_size):
+    now = timezone.now()
+    stalled = now - timedelta(seconds=settings.MEDIA_JOB_TIMEOUT)
+    with transaction.atomic():
+        jobs = list(
+            MediaJob.objects.select_for_update(skip_locked=True)
+            .filter(Q(status=MediaJob.Status.PENDING)
+                    | Q(status=MediaJob.Status.RUNNING, started_at__lt=stalled))
+            .order_by("created_at")[:batch_size]
+        )
+        MediaJob.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=MediaJob.Status.RUNNING, started_at=now, attempts=F("attempts") + 1,
+        )
+    for job in jobs:
+        job.attempts += 1
+        job.started_at = now
+    return jobs
+
+
+def _run_inline(func, *args):
+    future = Future()
+    try:
+        future.set_result(func(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def _finish(job, result=None, error=None):
+    if error is None:
+        job.status, job.result, job.error = MediaJob.Status.DONE, result or {}, ""
+    else:
+        logger.error("Media job %s failed (attempt %s): %s", job.pk, job.attempts, error)
+        job.error = f"{type(error).__name__}: {error}"
+        failed = job.attempts >= settings.MEDIA_JOB_MAX_ATTEMPTS
+        job.status = MediaJob.Status.FAILED if failed else MediaJob.Status.PENDING
+    job.finished_at = timezone.now()
+    # only if still ours: re-queued meanwhile (a new upload under the same
+    # name), or re-claimed after stalling, it stays with its new state
+    MediaJob.objects.filter(pk=job.pk, status=MediaJob.Status.RUNNING, started_at=job.started_at).update(
+        status=job.status, result=job.result, error=job.error, finished_at=job.finished_at,
+    )
+
+
+@contextmanager
+def _local_path(name):
+    """A filesystem path for the stored file, downloading it first for remote storages."""
+    try:
+        path = default_storage.path(name)
+    except NotImplementedError:
+        path = None
+    if path is not None:
+        yield path
+        return
+    with tempfile.NamedTemporaryFile(suffix=os.path.splitext(name)[1]) as copy:
+        with default_storage.open(name, "rb") as source:
+            shutil.copyfileobj(source, copy, settings.UPLOAD_CHUNK_SIZE)
+        copy.flush()
+        yield copy.name
+
+
+def _task(job, path):
+    if job.kind == MediaJob.Kind.BANNER_THUMBNAILS:
+        return media.banner_thumbnails, path, settings.MEDIA_THUMBNAIL_WIDTHS, settings.MEDIA_THUMBNAIL_QUALITY
+    return (media.video_metadata, path,
+            shutil.which(settings.FFMPEG_BINARY), shutil.which(settings.FFPROBE_BINARY))
+
+
+def _stem(name):
+    return os.path.splitext(os.path.basename(name))[0]
+
+
+def _delete_later(storage, names):
+    names = [name for name in names if name]
+
+    def delete():
+        for name in names:
+            storage.delete(name)
+
+    if names:
+        transaction.on_commit(delete)
+
+
+# ─── Storing results ───────────────────────────────────────────────────────
+# Rows are updated only if they still point at the job's source file: a
+# banner or video replaced in the meantime has a newer job of its own.
+def _apply_banner_thumbnails(job, thumbnails):
+    storage = Course._meta.get_field("banner").storage
+    current = Course.objects.filter(pk=job.object_id, banner=job.source_name)
+    previous = current.values_list("banner_thumbnails", flat=True).first()
+    if previous is None:
+        return {"skipped": "banner replaced"}
+
+    stem = _stem(job.source_name)
+    names = {
+        str(width): storage.save(f"course_banners/thumbs/{stem}-{width}.webp", ContentFile(data))
+        for width, data in thumbnails.items()
+    }
+    if not current.update(banner_thumbnails=names):
+        _delete_later(storage, names.values())
+        return {"skipped": "banner replaced"}
+    bump_version("course")
+    _delete_later(storage, set(previous.values()) - set(names.values()))
+    return {"thumbnails": names}
+
+
+def _apply_video_metadata(job, metadata):
+    storage = Lesson._meta.get_field("poster").storage
+    current = Lesson.objects.filter(pk=job.object_id, video=job.source_name)
+    row = current.values("poster", "course_id", "duration_seconds").first()
+    if row is None:
+        return {"skipped": "video replaced"}
+
+    duration = metadata["duration"]
+    fields = {"duration_seconds": round(duration) if duration is not None else None}
+    if metadata["poster"]:
+        fields["poster"] = storage.save(
+            f"lessons/posters/{_stem(job.source_name)}.jpg", ContentFile(metadata["poster"]),
+        )
+    if not current.update(**fields):
+        _delete_later(storage, [fields.get("poster")])
+        return {"skipped": "video replaced"}
+    # a queryset update skips the lesson signals (course/stats.py)
+    adjust_course_counters(
+        row["course_id"],
+        total_duration_seconds=(fields["duration_seconds"] or 0) - (row["duration_seconds"] or 0),
+    )
+    bump_version("lesson")
+    if "poster" in fields:
+        _delete_later(storage, [row["poster"]])
+    return {"duration": duration, "poster": fields.get("poster")}
+
+
+APPLY = {
+    MediaJob.Kind.BANNER_THUMBNAILS: _apply_banner_thumbnails,
+    MediaJob.Kind.VIDEO_METADATA: _apply_video_metadata,
+}
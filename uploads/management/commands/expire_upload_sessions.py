@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from uploads.files import discard_partial
+from uploads.models import UploadSession
+
+
+class Command(BaseCommand):
+    help = "Delete abandoned upload sessions and the partial files they left on disk."
+
+    def handle(self, *args, **options):
+        stale = UploadSession.objects.filter(
+            Q(status=UploadSession.Status.UPLOADING, expires_at__lte=timezone.now())
+            | Q(status=UploadSession.Status.ABORTED)
+        )
+        removed = 0
+        for session in stale.iterator():
+            discard_partial(session)
+            session.delete()
+            removed += 1
+        self.stdout.write(f"Removed {removed} upload session(s).")
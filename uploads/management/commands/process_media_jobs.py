@@ -0,0 +1,43 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from uploads.jobs import process_media_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Build banner thumbnails and read lesson video metadata in a process pool. "
+        "Safe to run several workers at once."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true",
+                            help="drain the queue and exit instead of polling")
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--workers", type=int, help="pool processes (default: MEDIA_WORKERS)")
+        parser.add_argument("--interval", type=float, default=2.0,
+                            help="seconds to sleep when the queue is empty")
+
+    def handle(self, *args, **options):
+        total = 0
+        # "spawn": the children never inherit this process's database connections
+        pool = ProcessPoolExecutor(
+            max_workers=options["workers"] or settings.MEDIA_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            with pool:
+                while True:
+                    claimed = process_media_jobs(options["batch_size"], executor=pool)
+                    total += claimed
+                    if not claimed:
+                        if options["once"]:
+                            break
+                        time.sleep(options["interval"])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(f"{total} media job(s) handled"))
@@ -0,0 +1,121 @@
+"""
+CPU-bound media work, run in the worker's process pool.
+
+Everything here is plain Python + Pillow on local file paths: no Django,
+no database, so the functions can run in freshly spawned processes and
+hand back only small results (thumbnail bytes, a duration, a poster).
+ffmpeg is optional — without it videos still get a duration (read from
+the MP4 header) but no poster frame.
+"""
+import io
+import os
+import struct
+import subprocess
+
+from PIL import Image, ImageOps
+
+
+# ─── Banners ───────────────────────────────────────────────────────────────
+def banner_thumbnails(path, widths, quality):
+    """{width: WebP bytes} for each requested width, never upscaling."""
+    with Image.open(path) as image:
+        # JPEG can decode straight at a reduced scale: much less work for
+        # a 6000px banner when the largest thumbnail is 1280px
+        largest = max(widths)
+        if image.width > largest:
+            image.draft("RGB", (largest, largest * image.height // image.width))
+        image = ImageOps.exif_transpose(image)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+
+        thumbnails = {}
+        for width in sorted(set(widths)):
+            width = min(width, image.width)
+            if width in thumbnails:
+                continue
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            resized.save(buffer, "WEBP", quality=quality, method=4)
+            thumbnails[width] = buffer.getvalue()
+    return thumbnails
+
+
+# ─── Videos ────────────────────────────────────────────────────────────────
+def _boxes(fh, end):
+    """(type, payload start, payload end) of the ISO-BMFF boxes up to `end`."""
+    while fh.tell() + 8 <= end:
+        start = fh.tell()
+        size, kind = struct.unpack(">I4s", fh.read(8))
+        header = 8
+        if size == 1:                       # 64-bit size follows
+            size = struct.unpack(">Q", fh.read(8))[0]
+            header = 16
+        elif size == 0:                     # box runs to the end of the file
+            size = end - start
+        if size < header:
+            return
+        yield kind, start + header, start + size
+        fh.seek(start + size)
+
+
+def mp4_duration(path):
+    """
+    Duration in seconds from the movie header (moov/mvhd), or None if the
+    file isn't MP4/MOV. Only box headers are read — `mdat` is skipped with
+    a seek — so it is instant however large the video.
+    """
+    try:
+        with open(path, "rb") as fh:
+            for kind, start, end in _boxes(fh, os.fstat(fh.fileno()).st_size):
+                if kind != b"moov":
+                    continue
+                fh.seek(start)
+                for inner, body, _ in _boxes(fh, end):
+                    if inner != b"mvhd":
+                        continue
+                    fh.seek(body)
+                    version = fh.read(1)[0]
+                    fh.seek(3 + (16 if version == 1 else 8), os.SEEK_CUR)  # flags, creation/modification
+                    if version == 1:
+                        timescale, duration = struct.unpack(">IQ", fh.read(12))
+                    else:
+                        timescale, duration = struct.unpack(">II", fh.read(8))
+                    return duration / timescale if timescale else None
+    except (OSError, struct.error, IndexError):
+        pass
+    return None
+
+
+def _probe_duration(path, ffprobe):
+    result = subprocess.run(
+        [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", path],
+        capture_output=True, text=True, timeout=60,
+    )
+    try:
+        return float(result.stdout.strip())
+    except ValueError:
+        return None
+
+
+def _poster_frame(path, ffmpeg, at, width):
+    result = subprocess.run(
+        [ffmpeg, "-v", "error", "-ss", f"{at:.2f}", "-i", path, "-frames:v", "1",
+         "-vf", f"scale={width}:-2", "-f", "image2pipe", "-c:v", "mjpeg", "-"],
+        capture_output=True, timeout=120,
+    )
+    return result.stdout or None
+
+
+def video_metadata(path, ffmpeg=None, ffprobe=None, poster_width=640):
+    """{"duration": seconds or None, "poster": JPEG bytes or None}."""
+    duration = mp4_duration(path)
+    if duration is None and ffprobe:
+        duration = _probe_duration(path, ffprobe)
+
+    poster = None
+    if ffmpeg:
+        # a frame a little way in: the very first one is often black
+        at = min(duration * 0.1, 10.0) if duration else 0.0
+        poster = _poster_frame(path, ffmpeg, at, poster_width)
+    return {"duration": duration, "poster": poster}
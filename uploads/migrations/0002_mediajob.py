@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('uploads', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MediaJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('banner_thumbnails', 'Banner thumbnails'), ('video_metadata', 'Video metadata')], max_length=30)),
+                ('object_id', models.PositiveBigIntegerField()),
+                ('source_name', models.CharField(max_length=500)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('result', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ('created_at',),
+                'indexes': [models.Index(condition=models.Q(('status__in', ('pending', 'running'))), fields=['created_at'], name='uploads_mediajob_queue_idx')],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'object_id', 'source_name'), name='uploads_mediajob_unique_source')],
+            },
+        ),
+    ]
@@ -0,0 +1,128 @@
+import os
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+def default_expiry():
+    return timezone.now() + timedelta(hours=settings.UPLOAD_SESSION_TTL_HOURS)
+
+
+# ---------------------------------------------------------------------------
+# UploadSession — one resumable upload of a lesson video or course banner
+# ---------------------------------------------------------------------------
+class UploadSession(models.Model):
+    """
+    The client announces the file (target, size), then PATCHes its bytes in
+    as many pieces as it likes. `offset` is the source of truth for how much
+    has arrived: a dropped connection resumes from HEAD's Upload-Offset.
+    Parts are appended to `partial_path` on local disk; the finished file
+    is handed to the target's storage in one move.
+    """
+
+    class Target(models.TextChoices):
+        LESSON_VIDEO  = "lesson_video",  _("Lesson video")
+        COURSE_BANNER = "course_banner", _("Course banner")
+
+    class Status(models.TextChoices):
+        UPLOADING = "uploading", _("Uploading")
+        COMPLETE  = "complete",  _("Complete")
+        ABORTED   = "aborted",   _("Aborted")
+
+    id        = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner     = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="upload_sessions",
+    )
+    target    = models.CharField(max_length=20, choices=Target.choices)
+    object_id = models.PositiveBigIntegerField()
+
+    filename     = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    size         = models.PositiveBigIntegerField()
+    offset       = models.PositiveBigIntegerField(default=0)
+    status       = models.CharField(max_length=20, choices=Status.choices, default=Status.UPLOADING)
+    # storage name of the finished file
+    stored_name  = models.CharField(max_length=500, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(default=default_expiry)
+
+    class Meta:
+        ordering = ("-created_at",)
+        indexes = [
+            # expire_upload_sessions: stale unfinished sessions
+            models.Index(fields=("status", "expires_at")),
+        ]
+
+    @property
+    def partial_path(self):
+        return os.path.join(settings.UPLOAD_TEMP_DIR, f"{self.pk}.part")
+
+    @property
+    def is_open(self):
+        return self.status == self.Status.UPLOADING and self.expires_at > timezone.now()
+
+    def __str__(self) -> str:
+        return f"Upload {self.pk} – {self.target}:{self.object_id} ({self.offset}/{self.size})"
+
+
+# ---------------------------------------------------------------------------
+# MediaJob — derived files to build from an uploaded original
+# ---------------------------------------------------------------------------
+class MediaJob(models.Model):
+    """
+    Queued when a banner or video changes; `process_media_jobs` renders
+    the thumbnails / reads the video metadata in a process pool. Keyed by
+    the source file, so saving the same file twice queues it once and a
+    result for a file that has since been replaced is thrown away. A new
+    upload stored under a name seen before puts that job back to pending.
+    """
+
+    class Kind(models.TextChoices):
+        BANNER_THUMBNAILS = "banner_thumbnails", _("Banner thumbnails")
+        VIDEO_METADATA    = "video_metadata",    _("Video metadata")
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        DONE    = "done",    _("Done")
+        FAILED  = "failed",  _("Failed")
+
+    kind        = models.CharField(max_length=30, choices=Kind.choices)
+    object_id   = models.PositiveBigIntegerField()     # course (banners) or lesson (videos)
+    source_name = models.CharField(max_length=500)     # storage name of the original
+    status      = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts    = models.PositiveSmallIntegerField(default=0)
+    error       = models.TextField(blank=True)
+    result      = models.JSONField(default=dict, blank=True)
+
+    created_at  = models.DateTimeField(auto_now_add=True)
+    started_at  = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("created_at",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("kind", "object_id", "source_name"),
+                name="uploads_mediajob_unique_source",
+            ),
+        ]
+        indexes = [
+            # the worker's queue: finished jobs drop out of it
+            models.Index(
+                fields=("created_at",),
+                condition=models.Q(status__in=("pending", "running")),
+                name="uploads_mediajob_queue_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} {self.object_id} ({self.status})"
@@ -0,0 +1,45 @@
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.exceptions import PermissionDenied
+
+from uploads.files import TARGETS, target_course_instructor
+from uploads.models import UploadSession
+
+
+class UploadSessionSerializer(serializers.ModelSerializer):
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = UploadSession
+        fields = (
+            "id", "target", "object_id", "filename", "content_type", "size",
+            "offset", "status", "status_display", "stored_name", "created_at", "expires_at",
+        )
+        read_only_fields = ("id", "offset", "status", "stored_name", "created_at", "expires_at")
+
+    def validate_size(self, value):
+        if value < 1:
+            raise serializers.ValidationError("Must be at least one byte.")
+        if value > settings.UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"Uploads are limited to {settings.UPLOAD_MAX_SIZE} bytes.")
+        return value
+
+    def validate_filename(self, value):
+        # only the last path component, whatever the client's OS sent
+        value = value.replace("\\", "/").rsplit("/", 1)[-1].strip()
+        if not value:
+            raise serializers.ValidationError("A file name is required.")
+        return value
+
+    def validate(self, attrs):
+        _, _, accepted = TARGETS[attrs["target"]]
+        if not attrs["content_type"].startswith(accepted):
+            raise serializers.ValidationError({"content_type": f"Expected {accepted}* for this target."})
+
+        instructor_id = target_course_instructor(attrs["target"], attrs["object_id"])
+        if instructor_id is None:
+            raise serializers.ValidationError({"object_id": "Invalid pk - object does not exist."})
+        user = self.context["request"].user
+        if user.role != "admin" and instructor_id != user.id:
+            raise PermissionDenied("Only the course instructor can upload files for it.")
+        return attrs
@@ -0,0 +1,33 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from course.models import Course
+from lessons.models import Lesson
+from uploads.jobs import enqueue_media_job
+from uploads.models import MediaJob
+
+
+def _changed_file(instance, field, created):
+    """Storage name of `field` if this save put a new file there, else None."""
+    if field not in instance.__dict__:
+        return None  # deferred and never touched
+    name = getattr(instance, field).name
+    loaded = getattr(instance, "_loaded", {})
+    if not name or (not created and loaded.get(field) == name):
+        return None
+    instance._loaded = {**loaded, field: name}
+    return name
+
+
+@receiver(post_save, sender=Course)
+def queue_banner_thumbnails(sender, instance, created, **kwargs):
+    name = _changed_file(instance, "banner", created)
+    if name:
+        enqueue_media_job(MediaJob.Kind.BANNER_THUMBNAILS, instance.pk, name)
+
+
+@receiver(post_save, sender=Lesson)
+def queue_video_metadata(sender, instance, created, **kwargs):
+    name = _changed_file(instance, "video", created)
+    if name:
+        enqueue_media_job(MediaJob.Kind.VIDEO_METADATA, instance.pk, name)
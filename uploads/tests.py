@@ -0,0 +1,238 @@
+import io
+import os
+import shutil
+import struct
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from PIL import Image
+
+from course.models import Category, Course
+from lessons.models import Lesson
+from uploads.files import UNSATISFIABLE, parse_range
+from uploads.jobs import APPLY, enqueue_media_job, process_media_jobs
+from uploads.media import mp4_duration
+from uploads.models import MediaJob, UploadSession
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix="lms-media-")
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(
+    MEDIA_ROOT=MEDIA_ROOT, UPLOAD_TEMP_DIR=os.path.join(MEDIA_ROOT, "partial"),
+    UPLOAD_CHUNK_SIZE=4, FILE_SERVE_BACKEND="django",
+)
+class ResumableUploadTests(APITestCase):
+    """Announce → PATCH parts (resuming after a gap) → ranged download."""
+
+    VIDEO = b"0123456789abcdefghij"
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=self.teacher,
+        )
+        self.lesson = Lesson.objects.create(course=self.course, title="Intro", is_preview=True)
+        self.client.force_authenticate(self.teacher)
+
+    def _start(self, **overrides):
+        body = {
+            "target": "lesson_video", "object_id": self.lesson.pk, "filename": "intro.mp4",
+            "content_type": "video/mp4", "size": len(self.VIDEO), **overrides,
+        }
+        return self.client.post(reverse("upload-create"), body, format="json")
+
+    def _patch(self, url, offset, data):
+        return self.client.generic(
+            "PATCH", url, data, content_type="application/offset+octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def _upload(self):
+        url = self._start()["Location"]
+        self._patch(url, 0, self.VIDEO[:7])
+        return self._patch(url, 7, self.VIDEO[7:])
+
+    def test_parts_resume_and_complete(self):
+        created = self._start()
+        self.assertEqual(created.status_code, status.HTTP_201_CREATED)
+        url = created["Location"]
+
+        first = self._patch(url, 0, self.VIDEO[:7])
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first["Upload-Offset"], "7")
+
+        # a retry from a stale offset is refused and told where to resume
+        stale = self._patch(url, 0, self.VIDEO[:7])
+        self.assertEqual(stale.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(stale.data["offset"], 7)
+        self.assertEqual(self.client.head(url)["Upload-Offset"], "7")
+
+        done = self._patch(url, 7, self.VIDEO[7:])
+        self.assertEqual(done.status_code, status.HTTP_200_OK)
+        self.assertEqual(done.data["status"], UploadSession.Status.COMPLETE)
+
+        self.lesson.refresh_from_db()
+        with self.lesson.video.open("rb") as fh:
+            self.assertEqual(fh.read(), self.VIDEO)
+        session = UploadSession.objects.get()
+        self.assertFalse(os.path.exists(session.partial_path))
+
+    def test_overlong_part_and_bad_target_rejected(self):
+        url = self._start()["Location"]
+        too_long = self._patch(url, 0, self.VIDEO + b"!")
+        self.assertEqual(too_long.status_code, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+        self.assertEqual(self._start(content_type="image/png").status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_only_course_instructor_may_upload(self):
+        other = User.objects.create_user(
+            username="other", email="other@example.com", password="pass123", role="teacher",
+        )
+        self.client.force_authenticate(other)
+        self.assertEqual(self._start().status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_range_download(self):
+        self._upload()
+        url = reverse("course-lessons-video", args=[self.course.pk, self.lesson.pk])
+
+        whole = self.client.get(url)
+        self.assertEqual(whole.status_code, status.HTTP_200_OK)
+        self.assertEqual(whole["Accept-Ranges"], "bytes")
+        self.assertEqual(b"".join(whole.streaming_content), self.VIDEO)
+
+        part = self.client.get(url, HTTP_RANGE="bytes=5-9")
+        self.assertEqual(part.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(part["Content-Range"], f"bytes 5-9/{len(self.VIDEO)}")
+        self.assertEqual(b"".join(part.streaming_content), self.VIDEO[5:10])
+
+        self.assertEqual(self.client.get(url, HTTP_RANGE="bytes=100-").status_code, 416)
+
+    @override_settings(FILE_SERVE_BACKEND="nginx")
+    def test_offload_to_nginx(self):
+        self._upload()
+        self.lesson.refresh_from_db()
+        response = self.client.get(reverse("course-lessons-video", args=[self.course.pk, self.lesson.pk]))
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.lesson.video.name}")
+
+    def test_parse_range(self):
+        self.assertEqual(parse_range("bytes=0-", 10), (0, 9))
+        self.assertEqual(parse_range("bytes=-3", 10), (7, 9))
+        self.assertEqual(parse_range("bytes=2-50", 10), (2, 9))
+        self.assertIsNone(parse_range("bytes=0-1,4-5", 10))
+        self.assertIs(parse_range("bytes=10-", 10), UNSATISFIABLE)
+
+
+def png(width=2000, height=1000):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, "PNG")
+    return SimpleUploadedFile("banner.png", buffer.getvalue(), content_type="image/png")
+
+
+def mp4(seconds, timescale=1000):
+    """Just enough of an MP4 for the header parser: ftyp, a big mdat, moov/mvhd."""
+    def box(kind, payload):
+        return struct.pack(">I4s", 8 + len(payload), kind) + payload
+    mvhd = box(b"mvhd", bytes(4) + struct.pack(">IIII", 0, 0, timescale, seconds * timescale) + bytes(80))
+    data = box(b"ftyp", b"isom" + bytes(4)) + box(b"mdat", bytes(4096)) + box(b"moov", mvhd)
+    return SimpleUploadedFile("lecture.mp4", data, content_type="video/mp4")
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, MEDIA_THUMBNAIL_WIDTHS=[320, 640], FFMPEG_BINARY="", FFPROBE_BINARY="")
+class MediaJobTests(APITestCase):
+    """New banners / videos queue a job; the worker stores thumbnails and metadata."""
+
+    def setUp(self):
+        cache.clear()
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", category=Category.objects.create(title="Programming"),
+            instructor=self.teacher,
+        )
+
+    def test_banner_thumbnails(self):
+        self.course.banner = png()
+        self.course.save()
+        self.course.save()   # same file: still one job
+        self.assertEqual(MediaJob.objects.filter(kind=MediaJob.Kind.BANNER_THUMBNAILS).count(), 1)
+
+        self.assertEqual(process_media_jobs(), 1)
+        job = MediaJob.objects.get()
+        self.assertEqual(job.status, MediaJob.Status.DONE, job.error)
+
+        self.course.refresh_from_db()
+        self.assertEqual(set(self.course.banner_thumbnails), {"320", "640"})
+        with Image.open(self.course.banner.storage.path(self.course.banner_thumbnails["320"])) as thumb:
+            self.assertEqual((thumb.format, thumb.size), ("WEBP", (320, 160)))
+
+        row = self.client.get(reverse("courses-list")).data["results"][0]
+        self.assertTrue(row["banner_thumbnails"]["320"].endswith(".webp"))
+
+    def test_reupload_under_a_processed_name_is_queued_again(self):
+        self.course.banner = png()
+        self.course.save()
+        process_media_jobs()
+        job = MediaJob.objects.get()
+        self.assertEqual(job.status, MediaJob.Status.DONE, job.error)
+
+        # the same storage name now holds a new file
+        enqueue_media_job(job.kind, job.object_id, job.source_name)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.result), (MediaJob.Status.PENDING, 0, {}))
+        self.assertEqual(process_media_jobs(), 1)
+
+    def test_requeued_while_running_stays_pending(self):
+        self.course.banner = png()
+        self.course.save()
+        apply = APPLY[MediaJob.Kind.BANNER_THUMBNAILS]
+
+        def reuploaded_meanwhile(job, output):
+            enqueue_media_job(job.kind, job.object_id, job.source_name)
+            return apply(job, output)
+
+        with mock.patch.dict(APPLY, {MediaJob.Kind.BANNER_THUMBNAILS: reuploaded_meanwhile}):
+            process_media_jobs()
+        self.assertEqual(MediaJob.objects.get().status, MediaJob.Status.PENDING)
+
+    def test_replaced_banner_result_is_dropped(self):
+        self.course.banner = png()
+        self.course.save()
+        self.course.banner = png(800, 400)
+        self.course.save()
+
+        process_media_jobs()
+        first, second = MediaJob.objects.order_by("pk")
+        self.assertEqual(first.result, {"skipped": "banner replaced"})
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.banner_thumbnails, second.result["thumbnails"])
+
+    def test_video_duration(self):
+        self.assertEqual(mp4_duration(__file__), None)
+        lesson = Lesson.objects.create(course=self.course, title="Intro", video=mp4(754))
+
+        call_command("process_media_jobs", "--once", "--workers", "1", stdout=io.StringIO())
+        lesson.refresh_from_db()
+        self.assertEqual(lesson.duration_seconds, 754)
+        self.course.refresh_from_db()
+        self.assertEqual(self.course.total_duration_seconds, 754)
+        self.assertFalse(lesson.poster)
@@ -0,0 +1,7 @@
+from django.urls import path
+from uploads.views import UploadSessionCreateView, UploadSessionView
+
+urlpatterns = [
+    path('uploads/', UploadSessionCreateView.as_view(), name='upload-create'),
+    path('uploads/<uuid:pk>/', UploadSessionView.as_view(), name='upload-session'),
+]
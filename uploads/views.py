@@ -0,0 +1,114 @@
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from course.permissions import IsCourseTeacherOrAdmin
+from uploads.files import UploadConflict, append_chunk, discard_partial, finalize_upload, locked_partial
+from uploads.models import UploadSession, default_expiry
+from uploads.serializers import UploadSessionSerializer
+
+
+def _progress_headers(response, session):
+    response["Upload-Offset"] = str(session.offset)
+    response["Upload-Length"] = str(session.size)
+    response["Cache-Control"] = "no-store"
+    return response
+
+
+class UploadSessionCreateView(APIView):
+    """
+    POST /api/uploads/
+        {"target": "lesson_video", "object_id": 12, "filename": "intro.mp4",
+         "content_type": "video/mp4", "size": 734003200}
+
+    Opens a resumable upload for the course's instructor (or an admin).
+    The bytes then go to the returned Location with PATCH.
+    """
+    permission_classes = [IsCourseTeacherOrAdmin]
+
+    def post(self, request):
+        serializer = UploadSessionSerializer(data=request.data, context={"request": request})
+        serializer.is_valid(raise_exception=True)
+        session = serializer.save(owner_id=request.user.id)
+        response = Response(serializer.data, status=status.HTTP_201_CREATED)
+        response["Location"] = reverse("upload-session", kwargs={"pk": session.pk})
+        return _progress_headers(response, session)
+
+
+class UploadSessionView(APIView):
+    """
+    /api/uploads/{id}/
+
+        HEAD    → Upload-Offset: how much has arrived (where to resume)
+        GET     → the session as JSON
+        PATCH   → append the raw body at Upload-Offset
+                  (Content-Type: application/offset+octet-stream)
+        DELETE  → abort and discard what was received
+
+    The body is copied off the request stream in chunks, so a part can be
+    any size without being buffered in memory. Once the last byte arrives
+    the file is attached to its lesson / course.
+    """
+    permission_classes = [IsCourseTeacherOrAdmin]
+
+    def get_session(self, request, pk):
+        return get_object_or_404(UploadSession, pk=pk, owner_id=request.user.id)
+
+    def head(self, request, pk):
+        return _progress_headers(Response(status=status.HTTP_200_OK), self.get_session(request, pk))
+
+    def get(self, request, pk):
+        session = self.get_session(request, pk)
+        return _progress_headers(Response(UploadSessionSerializer(session).data), session)
+
+    def patch(self, request, pk):
+        session = self.get_session(request, pk)
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except (KeyError, ValueError):
+            return Response({"detail": "Upload-Offset and Content-Length headers are required."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            with locked_partial(session) as out:
+                # re-read under the file lock: a previous part may just have landed
+                session.refresh_from_db()
+                if not session.is_open:
+                    return Response({"detail": "This upload is no longer accepting data."},
+                                    status=status.HTTP_410_GONE)
+                if offset != session.offset:
+                    return _progress_headers(Response(
+                        {"detail": "Upload-Offset does not match the data received so far.",
+                         "offset": session.offset},
+                        status=status.HTTP_409_CONFLICT,
+                    ), session)
+                if offset + length > session.size:
+                    return Response({"detail": "The part runs past the announced size."},
+                                    status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+                session.offset += append_chunk(out, offset, request.stream, length)
+                session.expires_at = default_expiry()
+                if session.offset < session.size:
+                    session.save(update_fields=["offset", "expires_at", "updated_at"])
+                else:
+                    with transaction.atomic():
+                        session.stored_name = finalize_upload(session)
+                        session.status = UploadSession.Status.COMPLETE
+                        session.save()
+        except UploadConflict:
+            return Response({"detail": "Another part of this upload is being written."},
+                            status=status.HTTP_409_CONFLICT)
+
+        return _progress_headers(Response(UploadSessionSerializer(session).data), session)
+
+    def delete(self, request, pk):
+        session = self.get_session(request, pk)
+        if session.status == UploadSession.Status.UPLOADING:
+            session.status = UploadSession.Status.ABORTED
+            session.save(update_fields=["status", "updated_at"])
+            discard_partial(session)
+        return Response(status=status.HTTP_204_NO_CONTENT)
@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
+from users.models import RevokedToken
 
 User = get_user_model()
 
@@ -33,3 +34,9 @@ class CustomUserAdmin(BaseUserAdmin):
             'fields': ('email', 'password1', 'password2', 'role'),
         }),
     )
+
+
+@admin.register(RevokedToken)
+class RevokedTokenAdmin(admin.ModelAdmin):
+    list_display = ['jti', 'user_id', 'revoked_at', 'expires_at']
+    search_fields = ['jti']
@@ -0,0 +1,66 @@
+from django.contrib.auth import get_user_model
+from django.utils.functional import cached_property
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from users.cache import user_cache
+
+User = get_user_model()
+
+
+class ClaimsUser(TokenUser):
+    """
+    `request.user` built from the access-token claims alone.
+
+    `id`, `role`, `is_staff` (what the permission classes look at) come
+    straight from the token. Anything else (email, phone_number, ...) falls
+    through to the real `User` row, which is fetched once, on first access.
+    """
+
+    @cached_property
+    def id(self):
+        return int(self.token[api_settings.USER_ID_CLAIM])
+
+    @cached_property
+    def role(self):
+        return self.token["role"]
+
+    @cached_property
+    def full_user(self):
+        """The database row, loaded lazily and only if a view asks for it."""
+        try:
+            return user_cache.get(self.id)
+        except User.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+    def __getattr__(self, name):
+        # only reached for attributes the claims don't cover
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.full_user, name)
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication without the per-request `User` query.
+
+    Tokens issued by `RoleRefreshToken` carry the role; they are turned into a
+    `ClaimsUser`. Older tokens without the claim still need the full row,
+    which is served from the in-process `user_cache`.
+    """
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken("Token contained no recognizable user identification")
+        if "role" in validated_token:
+            return api_settings.TOKEN_USER_CLASS(validated_token)
+
+        try:
+            user = user_cache.get(validated_token[api_settings.USER_ID_CLAIM])
+        except User.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        return user
@@ -0,0 +1,82 @@
+"""
+Login backend that upgrades old password hashes off the request path.
+
+Django's ModelBackend re-hashes a password whose hash is outdated (older
+algorithm, lower cost) inside the login request, paying for a second full
+hash before the tokens go out. Here the login only verifies; the upgrade
+runs after the response, on a small thread pool (PASSWORD_REHASH_WORKERS).
+The hash functions release the GIL, so the pool doesn't hold up requests.
+
+The upgrade is a conditional UPDATE on the old hash, so a password changed
+in the meantime is never overwritten. The plain password only lives in
+memory until the pool gets to it.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.hashers import make_password, verify_password
+from django.db import connection, transaction
+
+from users.cache import user_cache
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _executor():
+    return ThreadPoolExecutor(
+        max_workers=settings.PASSWORD_REHASH_WORKERS, thread_name_prefix="password-rehash",
+    )
+
+
+def rehash_password(user_id, old_hash, password):
+    """Store a hash made with the current hasher and cost, unless the password changed."""
+    updated = (
+        get_user_model().objects.all_users()
+        .filter(pk=user_id, password=old_hash)
+        .update(password=make_password(password))
+    )
+    if updated:
+        user_cache.invalidate(user_id)
+    return bool(updated)
+
+
+def _rehash_in_background(user_id, old_hash, password):
+    try:
+        rehash_password(user_id, old_hash, password)
+    except Exception:
+        logger.exception("Password rehash failed for user %s", user_id)
+    finally:
+        connection.close()       # pool threads must not keep connections open
+
+
+class DeferredRehashBackend(ModelBackend):
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # hash once anyway, so unknown emails take as long as wrong passwords
+            make_password(password)
+            return
+        is_correct, must_update = verify_password(password, user.password)
+        if not (is_correct and self.user_can_authenticate(user)):
+            return
+        if must_update:
+            old_hash = user.password
+            transaction.on_commit(
+                lambda: _executor().submit(_rehash_in_background, user.pk, old_hash, password)
+            )
+        return user
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        return await sync_to_async(self.authenticate)(request, username, password, **kwargs)
@@ -0,0 +1,76 @@
+"""
+Small in-process LRU cache of `User` rows for authenticated requests.
+
+Bursts of requests from the same student or teacher would otherwise
+re-select the same row each time. Entries expire after USER_CACHE_TTL
+seconds and are dropped right away when the user is saved or deleted in
+this process (see users/signals.py); other worker processes pick the change
+up once the TTL runs out.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+
+
+class UserCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()       # user_id -> (expires_at, user)
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        """
+        Return the user with this id (inactive users included), from the cache
+        when fresh, otherwise from the database. Raises User.DoesNotExist.
+        """
+        user_id = int(user_id)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._data.move_to_end(user_id)
+                self.hits += 1
+                # hand out a copy so a view mutating request.user can't
+                # poison the cached instance
+                return copy.copy(entry[1])
+            self.misses += 1
+
+        user = get_user_model().objects.all_users().get(pk=user_id)
+        self.set(user)
+        return user
+
+    def set(self, user):
+        with self._lock:
+            self._data[user.pk] = (time.monotonic() + self.ttl, copy.copy(user))
+            self._data.move_to_end(user.pk)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._data.pop(int(user_id), None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+user_cache = UserCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL)
@@ -0,0 +1,79 @@
+"""
+Password hashers whose cost comes from PASSWORD_HASH_PROFILE.
+
+Hashing is deliberately expensive, and at term start it is most of what
+the login and registration endpoints spend CPU on. These are Django's own
+PBKDF2 / scrypt / Argon2 hashers with the same algorithm names, so stored
+hashes keep verifying; only the cost of *new* hashes follows the profile:
+
+    fast        OWASP minimums, for hosts short on CPU (and for tests)
+    standard    Django's defaults
+    strong      for when there is CPU to spare
+
+The cost is read from settings on every call, so changing the profile (or
+PASSWORD_HASHER) makes existing hashes "need an update" and they are
+re-hashed after the user's next successful login (users/backends.py).
+Argon2 needs `pip install argon2-cffi`.
+
+Nothing here needs the app registry, so pool workers that only hash
+(users/provisioning.py) can import it without setting Django up.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+PROFILES = {
+    "fast": {
+        "pbkdf2_sha256": {"iterations": 600_000},
+        "scrypt": {"work_factor": 2**14, "block_size": 8, "parallelism": 1},
+        "argon2": {"time_cost": 2, "memory_cost": 19_456, "parallelism": 1},
+    },
+    "standard": {
+        "pbkdf2_sha256": {"iterations": 1_000_000},
+        "scrypt": {"work_factor": 2**14, "block_size": 8, "parallelism": 5},
+        "argon2": {"time_cost": 2, "memory_cost": 102_400, "parallelism": 8},
+    },
+    "strong": {
+        "pbkdf2_sha256": {"iterations": 2_000_000},
+        "scrypt": {"work_factor": 2**15, "block_size": 8, "parallelism": 5},
+        "argon2": {"time_cost": 3, "memory_cost": 262_144, "parallelism": 8},
+    },
+}
+
+
+class _ProfileCost:
+    """Class attribute that looks its value up in the current profile."""
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, hasher, owner=None):
+        return PROFILES[settings.PASSWORD_HASH_PROFILE][owner.algorithm][self.name]
+
+
+class ProfilePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    iterations = _ProfileCost()
+
+
+class ProfileScryptPasswordHasher(ScryptPasswordHasher):
+    work_factor = _ProfileCost()
+    block_size = _ProfileCost()
+    parallelism = _ProfileCost()
+    # OpenSSL refuses more than 32 MiB by default, which "strong" (and any
+    # hash made under it) needs; this is a ceiling, not an allocation
+    maxmem = 256 * 1024 * 1024
+
+
+class ProfileArgon2PasswordHasher(Argon2PasswordHasher):
+    time_cost = _ProfileCost()
+    memory_cost = _ProfileCost()
+    parallelism = _ProfileCost()
+
+
+def init_hash_worker(hashers, profile):
+    """Process-pool initializer: hashing needs just these two settings, not the project."""
+    if not settings.configured:
+        settings.configure(PASSWORD_HASHERS=hashers, PASSWORD_HASH_PROFILE=profile)
@@ -0,0 +1,53 @@
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.exceptions import ValidationError
+
+from course.bulk import read_records
+from users.provisioning import UserImporter, hash_pool
+
+
+class Command(BaseCommand):
+    help = (
+        "Create users in bulk from a CSV or JSON Lines file (use '-' for stdin). "
+        "Columns: email, username, phone_number, role, first_name, last_name, password. "
+        "Passwords are hashed in a process pool; nothing is written if any row fails."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="input file, or '-' for stdin")
+        parser.add_argument("--format", choices=("jsonl", "csv"),
+                            help="defaults to the file extension")
+        parser.add_argument("--batch-size", type=int)
+        parser.add_argument("--workers", type=int,
+                            help="hashing processes (default: USER_IMPORT_HASH_WORKERS, 0 = inline)")
+        parser.add_argument("--skip-existing", action="store_true",
+                            help="skip rows whose email is already registered")
+
+    def handle(self, *args, **options):
+        path, fmt = options["path"], options["format"]
+        if fmt is None:
+            fmt = "csv" if path.endswith(".csv") else "jsonl"
+        workers = options["workers"]
+        if workers is None:
+            workers = settings.USER_IMPORT_HASH_WORKERS
+
+        pool = hash_pool(workers) if workers else None
+        importer = UserImporter(
+            batch_size=options["batch_size"], executor=pool, skip_existing=options["skip_existing"],
+        )
+        stream = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+        try:
+            result = importer.run(read_records(stream, fmt))
+        except ValidationError as exc:
+            raise CommandError(f"Import failed, nothing was written: {exc.detail}")
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if pool is not None:
+                pool.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"users: {result['created']} created, {result['skipped']} skipped"
+        ))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from users.revocation import prune_revoked_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete revoked refresh tokens that have expired anyway (run daily from cron)."
+
+    def handle(self, *args, **options):
+        deleted = prune_revoked_tokens()
+        self.stdout.write(self.style.SUCCESS(f"{deleted} expired revocation(s) pruned"))
@@ -0,0 +1,106 @@
+# Generated by Django 5.2.18 on 2026-10-18 09:04
+
+import django.db.models.functions.text
+from django.db import IntegrityError, migrations, models, transaction
+from django.db.models import Count, F
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+
+def _reassign(model, field, old_ids, new_id):
+    """Point `field` of `model` rows at new_id; rows that would clash stay put."""
+    rows = model._base_manager.filter(**{f"{field.attname}__in": old_ids})
+    try:
+        with transaction.atomic():
+            rows.update(**{field.attname: new_id})
+    except IntegrityError:
+        # e.g. both accounts are enrolled in the same course: keep the survivor's
+        for pk in list(rows.values_list("pk", flat=True)):
+            try:
+                with transaction.atomic():
+                    model._base_manager.filter(pk=pk).update(**{field.attname: new_id})
+            except IntegrityError:
+                pass
+
+
+def _tombstone_email(user):
+    local, _, domain = user.email.rpartition("@")
+    return f"{local}+merged-{user.pk}@{domain}"[-254:]
+
+
+def merge_case_duplicates(apps, schema_editor):
+    """
+    Before the Lower() unique indexes go on:
+
+    * accounts whose emails differ only by case are one person: the one
+      used most recently is kept, everything pointing at the others
+      (enrollments, payments, courses, uploads, groups, ...) is moved to it,
+      and the others are deactivated, logged out and their email renamed
+      to "local+merged-<id>@domain";
+    * usernames that differ only by case belong to different people: all but
+      the oldest get "-<id>" appended.
+    """
+    User = apps.get_model("users", "User")
+    references = [
+        (rel.related_model, rel.field) for rel in User._meta.related_objects
+        if not rel.many_to_many
+    ] + [
+        (field.remote_field.through, field.remote_field.through._meta.get_field(field.m2m_field_name()))
+        for field in User._meta.many_to_many
+    ]
+
+    users = User.objects.annotate(key=Lower("email"))
+    duplicated = (
+        users.values("key").annotate(n=Count("id")).filter(n__gt=1).values_list("key", flat=True)
+    )
+    for key in list(duplicated):
+        keep, *others = users.filter(key=key).order_by(F("last_login").desc(nulls_last=True), "pk")
+        old_ids = [user.pk for user in others]
+        for model, field in references:
+            _reassign(model, field, old_ids, keep.pk)
+        for user in others:
+            user.email = _tombstone_email(user)
+            user.is_active = False
+            user.tokens_valid_after = timezone.now()
+            user.save(update_fields=["email", "is_active", "tokens_valid_after"])
+
+    users = User.objects.annotate(key=Lower("username"))
+    duplicated = (
+        users.values("key").annotate(n=Count("id")).filter(n__gt=1).values_list("key", flat=True)
+    )
+    for key in list(duplicated):
+        _, *others = users.filter(key=key).order_by("pk")
+        for user in others:
+            suffix = f"-{user.pk}"
+            user.username = user.username[:150 - len(suffix)] + suffix
+            user.save(update_fields=["username"])
+
+    # run the deferred foreign-key checks for the moved rows now: PostgreSQL
+    # won't build an index on a table with trigger events still pending
+    schema_editor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('users', '0002_revokedtoken_user_tokens_valid_after'),
+        # every table with a foreign key to users, so the merge can move its rows
+        ('admin', '0003_logentry_add_action_flag_choices'),
+        ('course', '0007_course_banner_thumbnails'),
+        ('enrollments', '0002_lessonprogress'),
+        ('payments', '0001_initial'),
+        ('uploads', '0002_mediajob'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_case_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='users_user_email_ci_unique', violation_error_message='A user with this email already exists.'),
+        ),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('username'), name='users_user_username_ci_unique', violation_error_message='A user with this username already exists.'),
+        ),
+    ]
@@ -2,6 +2,8 @@ from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import RegexValidator
+from django.db.models import Value
+from django.db.models.functions import Lower
 
 # Create your models here.
 
@@ -32,8 +34,10 @@ class UserManager(BaseUserManager):
         return self.create_user(email, password, **extra_fields)
 
     #object methods
+    # Emails and usernames are unique whatever their case (the Lower() unique
+    # indexes below); lookups compare the same way, so each is one index probe.
     def get_by_natural_key(self, email):
-        return self.get(email=email)
+        return self.get(email__lower=Lower(Value(email)))
     
     def get_queryset(self):
         return super().get_queryset().filter(is_active=True)
@@ -43,8 +47,8 @@ class UserManager(BaseUserManager):
         return super().get_queryset()
     
     def get_user_by_email(self, email):
-        """Return a user by their email address."""
-        return self.get(email=email)
+        """Return a user by their email address, in any case."""
+        return self.get(email__lower=Lower(Value(email)))
     
     def get_user_by_id(self, user_id):
         """Return a user by their ID."""
@@ -79,12 +83,49 @@ class User(AbstractUser):
         ]
     )
 
+    # "log out everywhere": refresh tokens issued before this are refused
+    tokens_valid_after = models.DateTimeField(null=True, blank=True, editable=False)
+
     USERNAME_FIELD = 'email'   # ✅ Still using email for login
     REQUIRED_FIELDS = ['username']  # ✅ This is required for `createsuperuser`
 
     objects = UserManager()
 
+    class Meta(AbstractUser.Meta):
+        constraints = [
+            # "Ana@School.org" and "ana@school.org" are the same account; these
+            # functional indexes also serve the `__lower` lookups
+            models.UniqueConstraint(
+                Lower("email"), name="users_user_email_ci_unique",
+                violation_error_message="A user with this email already exists.",
+            ),
+            models.UniqueConstraint(
+                Lower("username"), name="users_user_username_ci_unique",
+                violation_error_message="A user with this username already exists.",
+            ),
+        ]
+
     def __str__(self):
         return f"{self.email} ({self.get_role_display()})"
-    
-    
\ No newline at end of file
+
+
+# `email__lower=` / `username__lower=` lookups, answered by the indexes above
+User._meta.get_field("email").register_lookup(Lower)
+User._meta.get_field("username").register_lookup(Lower)
+
+
+# ── Revoked refresh tokens ────────────────────────────────────
+class RevokedToken(models.Model):
+    """
+    A refresh token that was logged out or rotated away. Rows are only
+    needed until the token would have expired anyway; `prune_revoked_tokens`
+    deletes the rest. Lookups normally hit the cache (users/revocation.py).
+    """
+    jti = models.CharField(max_length=255, primary_key=True)
+    # plain id, not a FK: a revocation may outlive the user row until it expires
+    user_id = models.BigIntegerField(null=True, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.jti} (user {self.user_id}, expires {self.expires_at:%Y-%m-%d})"
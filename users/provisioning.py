@@ -0,0 +1,139 @@
+"""
+Bulk user provisioning, shared by POST /api/users/import/ and the
+`import_users` management command.
+
+Schools hand over thousands of students at once. Rows are streamed (CSV,
+JSON Lines or a JSON array) through the catalogue importer machinery
+(course/bulk.py): validated a batch at a time, checked against existing
+emails / usernames / phone numbers with one query per batch, and written
+with bulk_create in one transaction, so a bad row rolls the import back.
+
+Hashing is what makes this slow: each password costs a full
+PASSWORD_HASH_PROFILE hash. They are hashed in a process pool, a batch at a
+time. Running the import with PASSWORD_HASH_PROFILE=fast makes it cheaper
+still; those hashes are upgraded on each user's first login
+(users/backends.py).
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db.models import Q
+
+from course.bulk import BulkImporter
+from users.hashers import init_hash_worker
+from users.serializers.auth import UserImportSerializer
+
+User = get_user_model()
+
+UNIQUE_FIELDS = ("email", "username", "phone_number")
+CASE_INSENSITIVE_FIELDS = {"email", "username"}
+
+# Passwords sent to a pool worker per round trip: enough to amortise the
+# pickling, few enough that every worker gets a share of a batch
+HASH_CHUNK_SIZE = 16
+
+
+def hash_pool(workers=None):
+    """
+    A process pool that hashes with this process's PASSWORD_HASHERS and
+    profile. "spawn": the children never inherit database connections.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers or settings.USER_IMPORT_HASH_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_hash_worker,
+        initargs=(settings.PASSWORD_HASHERS, settings.PASSWORD_HASH_PROFILE),
+    )
+
+
+@lru_cache(maxsize=None)
+def shared_hash_pool():
+    """The pool API imports use; started on first use and kept for the process."""
+    return hash_pool()
+
+
+def hash_passwords(passwords, executor=None):
+    """Hashes for `passwords` in order; None gets an unusable password."""
+    hashes = [make_password(None) if password is None else None for password in passwords]
+    todo = [i for i, password in enumerate(passwords) if password is not None]
+    if executor is None:
+        results = map(make_password, (passwords[i] for i in todo))
+    else:
+        results = executor.map(make_password, [passwords[i] for i in todo], chunksize=HASH_CHUNK_SIZE)
+    for index, encoded in zip(todo, results):
+        hashes[index] = encoded
+    return hashes
+
+
+class UserImporter(BulkImporter):
+    """
+    Create-only: a row whose email is already registered is an error, or is
+    skipped with `skip_existing` (re-running the same roster file). Any other
+    clash on username / phone number is always an error.
+    """
+    model = User
+    serializer_class = UserImportSerializer
+
+    def __init__(self, batch_size=None, executor=None, skip_existing=False):
+        super().__init__(batch_size)
+        self.executor = executor
+        self.skip_existing = skip_existing
+        self.skipped = 0
+        self.seen = {field: set() for field in UNIQUE_FIELDS}   # earlier rows of this import
+
+    def run(self, records):
+        result = super().run(records)
+        return {**result, "skipped": self.skipped}
+
+    @staticmethod
+    def _key(field, value):
+        # emails and usernames are unique whatever their case (users/models.py)
+        return value.lower() if field in CASE_INSENSITIVE_FIELDS else value
+
+    def check_batch(self, rows):
+        keys = [
+            {field: self._key(field, row[field]) for field in UNIQUE_FIELDS if row.get(field)}
+            for row in rows
+        ]
+        values = {field: {key[field] for key in keys if field in key} for field in UNIQUE_FIELDS}
+        # one query for all three unique columns, through the Lower() indexes
+        existing = User.objects.all_users().filter(
+            Q(email__lower__in=values["email"]) | Q(username__lower__in=values["username"])
+            | Q(phone_number__in=values["phone_number"])
+        )
+        taken = {field: set() for field in UNIQUE_FIELDS}
+        for row in existing.values_list(*UNIQUE_FIELDS):
+            for field, value in zip(UNIQUE_FIELDS, row):
+                if value:
+                    taken[field].add(self._key(field, value))
+
+        errors = {}
+        for index, (row, key) in enumerate(zip(rows, keys)):
+            if self.skip_existing and key["email"] in taken["email"]:
+                row["skip"] = True
+                continue
+            clashes = {
+                field: [f"A user with this {field.replace('_', ' ')} already exists."]
+                for field, value in key.items()
+                if value in taken[field] or value in self.seen[field]
+            }
+            if clashes:
+                errors[index] = clashes
+            for field, value in key.items():
+                self.seen[field].add(value)
+        return errors
+
+    def write_batch(self, rows):
+        new = [row for row in rows if not row.pop("skip", False)]
+        self.skipped += len(rows) - len(new)
+        passwords = [row.pop("password", None) for row in new]
+        users = [
+            User(password=encoded, **row)
+            for row, encoded in zip(new, hash_passwords(passwords, self.executor))
+        ]
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        return len(users), 0
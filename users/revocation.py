@@ -0,0 +1,119 @@
+"""
+Refresh-token revocation.
+
+Two kinds of revocation are checked on every /api/token/refresh/:
+
+    RevokedToken        one token (logout, or the old token after rotation),
+                        keyed by its `jti`
+    tokens_valid_after  all of a user's tokens issued before a moment
+                        ("log out everywhere")
+
+Both are answered from the cache in one round trip. Rotating a refresh
+token is its own check: the old jti is inserted, and only the request
+whose insert created the row gets a new pair. The database is the
+durable copy and is only read on a cache miss, by primary key; expired
+rows are deleted by `prune_revoked_tokens`, so the table never holds more
+than one refresh lifetime of logouts.
+
+Access tokens are not checked: they stay usable for the rest of their
+short ACCESS_TOKEN_LIFETIME.
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+
+from users.models import RevokedToken
+
+REVOKED_KEY = "auth:revoked:{}"
+VALID_AFTER_KEY = "auth:valid-after:{}"
+
+
+def _refresh_lifetime():
+    return int(settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].total_seconds())
+
+
+def revoke_token(token):
+    """
+    Revoke one refresh token until it expires. Returns True if this call
+    revoked it, False if it already was: of two concurrent refreshes with the
+    same token, only one gets True (the jti is the primary key).
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    expires_at = datetime.fromtimestamp(token["exp"], tz=dt_timezone.utc)
+    _, created = RevokedToken.objects.get_or_create(
+        jti=jti, defaults={"user_id": token.get(api_settings.USER_ID_CLAIM), "expires_at": expires_at},
+    )
+    remaining = int(token["exp"] - timezone.now().timestamp())
+    if remaining > 0:
+        cache.set(REVOKED_KEY.format(jti), True, remaining)
+    return created
+
+
+def revoke_all_tokens(user_id):
+    """Revoke every refresh token issued to this user so far. False if no such user."""
+    now = timezone.now()
+    updated = get_user_model().objects.all_users().filter(pk=user_id).update(tokens_valid_after=now)
+    if updated:
+        cache.set(VALID_AFTER_KEY.format(user_id), int(now.timestamp()), _refresh_lifetime())
+    return bool(updated)
+
+
+def is_revoked(token, cache_negative=True, valid_after=None):
+    """
+    Whether the token was logged out, rotated away or predates "log out
+    everywhere". With `cache_negative=False` only a "revoked" answer is taken
+    from (or put in) the cache; a refresh must not trust another process's
+    stale "not revoked". A caller holding the user row passes its cut-off
+    as `valid_after` (see `valid_after_of`).
+    """
+    jti = token[api_settings.JTI_CLAIM]
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    revoked_key, valid_after_key = REVOKED_KEY.format(jti), VALID_AFTER_KEY.format(user_id)
+    found = cache.get_many([revoked_key, valid_after_key])
+
+    revoked = found.get(revoked_key)
+    if revoked is None or (revoked is False and not cache_negative):
+        revoked = RevokedToken.objects.filter(pk=jti).exists()
+        # a revoked token stays revoked; "not revoked" is cached briefly, since
+        # with a per-process cache another worker's logout shows up once it lapses
+        if revoked:
+            cache.set(revoked_key, True, max(int(token["exp"] - timezone.now().timestamp()), 1))
+        elif cache_negative:
+            cache.set(revoked_key, False, settings.TOKEN_REVOCATION_CACHE_TIMEOUT)
+    if revoked:
+        return True
+    if valid_after is None:
+        valid_after = found.get(valid_after_key)
+    return issued_before_cutoff(token, valid_after)
+
+
+def valid_after_of(user):
+    """The user's "log out everywhere" cut-off, as issued_before_cutoff() takes it."""
+    return int(user.tokens_valid_after.timestamp()) if user.tokens_valid_after else 0
+
+
+def issued_before_cutoff(token, valid_after=None):
+    """Whether the token predates the user's "log out everywhere"."""
+    user_id = token.get(api_settings.USER_ID_CLAIM)
+    if valid_after is None:
+        valid_after = cache.get(VALID_AFTER_KEY.format(user_id))
+    if valid_after is None:
+        cutoff = (
+            get_user_model().objects.all_users().filter(pk=user_id)
+            .values_list("tokens_valid_after", flat=True).first()
+        )
+        valid_after = int(cutoff.timestamp()) if cutoff else 0   # as valid_after_of()
+        cache.set(VALID_AFTER_KEY.format(user_id), valid_after, settings.TOKEN_REVOCATION_CACHE_TIMEOUT)
+    # `iat` has one-second resolution: a token from the same second as the
+    # cut-off may predate it, so it goes too
+    return token.get("iat", 0) <= valid_after
+
+
+def prune_revoked_tokens():
+    """Delete revocations of tokens that have expired anyway; return how many."""
+    deleted, _ = RevokedToken.objects.filter(expires_at__lte=timezone.now()).delete()
+    return deleted
@@ -2,9 +2,28 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.validators import RegexValidator
+from django.db.models import Value
+from django.db.models.functions import Lower
+from rest_framework.validators import UniqueValidator
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+from users.revocation import is_revoked, issued_before_cutoff, revoke_token, valid_after_of
+from users.tokens import RoleRefreshToken, set_role_claims
 
 User = get_user_model()
 
+
+class CaseInsensitiveUniqueValidator(UniqueValidator):
+    """`unique=True` the way the Lower() unique indexes see it: "Ana" clashes with "ana"."""
+
+    def filter_queryset(self, value, queryset, field_name):
+        return queryset.filter(**{f"{field_name}__lower": Lower(Value(value))})
+
+
 class RegisterSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
     password2 = serializers.CharField(write_only=True, required=True)
@@ -14,7 +33,12 @@ class RegisterSerializer(serializers.ModelSerializer):
         fields = ('email', 'username', 'password', 'password2', 'role', 'phone_number')
         extra_kwargs = {
             'role': {'required': False},
-            'phone_number': {'required': False}
+            'phone_number': {'required': False},
+            # inactive accounts keep their email / username too
+            'email': {'validators': [CaseInsensitiveUniqueValidator(
+                User.objects.all_users(), message="A user with this email already exists.")]},
+            'username': {'validators': [UnicodeUsernameValidator(), CaseInsensitiveUniqueValidator(
+                User.objects.all_users(), message="A user with this username already exists.")]},
         }
 
     def validate(self, attrs):
@@ -35,6 +59,94 @@ class RegisterSerializer(serializers.ModelSerializer):
         return user
 
 
+class UserImportSerializer(serializers.ModelSerializer):
+    """
+    Row serializer for bulk user imports. Unique fields are only checked
+    for format here: `UserImporter` checks a whole batch against the
+    database with one query instead of three per row. No password means
+    an unusable one (the user sets it through a reset link).
+    """
+    password = serializers.CharField(write_only=True, required=False, trim_whitespace=False)
+    role = serializers.ChoiceField(choices=[User.Role.STUDENT, User.Role.TEACHER], default=User.Role.STUDENT)
+
+    class Meta:
+        model = User
+        fields = ('email', 'username', 'phone_number', 'role', 'first_name', 'last_name', 'password')
+        extra_kwargs = {
+            'email': {'validators': []},
+            'username': {'validators': [UnicodeUsernameValidator()]},
+            'phone_number': {'validators': [
+                v for v in User._meta.get_field('phone_number').validators if isinstance(v, RegexValidator)
+            ]},
+        }
+
+    def validate_email(self, value):
+        return User.objects.normalize_email(value)
+
+    def validate_password(self, value):
+        validate_password(value)
+        return value
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login serializer that issues tokens carrying `role` and `is_staff`."""
+    token_class = RoleRefreshToken
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refuses logged-out tokens, and revokes the old refresh token when it is
+    rotated, so each one can be used once (users/revocation.py).
+
+    Refreshing copies the old token's claims, so `role` / `is_staff` are
+    re-read from the user row here: a demoted user loses their rights, and a
+    deactivated or deleted one their session, at the next refresh.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = User.objects.all_users().filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        # the "log out everywhere" cut-off comes from the row just read, not
+        # from a cache another worker's logout may not have reached
+        valid_after = valid_after_of(user)
+        rotate = api_settings.ROTATE_REFRESH_TOKENS
+        if rotate:
+            # the jti is checked by claiming it below, not by a lookup
+            revoked = issued_before_cutoff(refresh, valid_after)
+        else:
+            revoked = is_revoked(refresh, cache_negative=False, valid_after=valid_after)
+        if revoked:
+            raise InvalidToken("Token has been revoked")
+        set_role_claims(refresh, user)          # copied into the access token below
+
+        # revoking the old token is atomic: of two concurrent refreshes with
+        # it, only the one whose revocation created the row goes on
+        if rotate and not revoke_token(refresh):
+            raise InvalidToken("Token has been revoked")
+
+        data = {"access": str(refresh.access_token)}
+        if rotate:
+            refresh.set_jti()
+            refresh.set_exp()
+            refresh.set_iat()
+            data["refresh"] = str(refresh)
+        return data
+
+
+class LogoutSerializer(serializers.Serializer):
+    refresh = serializers.CharField()
+
+    def validate_refresh(self, value):
+        try:
+            return RefreshToken(value)
+        except TokenError as exc:
+            raise serializers.ValidationError(str(exc))
+
+
 
 # # RegisterSerializer
 # # LoginSerializer
@@ -1,3 +1,442 @@
-from django.test import TestCase
+import io
+import os
+import tempfile
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from rest_framework.throttling import SimpleRateThrottle
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from course.models import Category, Course
+from users.authentication import ClaimsUser
+from users.backends import rehash_password
+from users.cache import UserCache, user_cache
+from users.models import RevokedToken
+from users.revocation import is_revoked, revoke_token
+
+User = get_user_model()
+
+
+class StatelessJWTTests(APITestCase):
+    """
+    Access tokens carry role/is_staff, so authorising a write doesn't need
+    the users table.
+    """
+
+    def setUp(self):
+        self.teacher = User.objects.create_user(
+            username="teacher", email="teacher@example.com",
+            password="pass123", role="teacher",
+        )
+        self.course = Course.objects.create(
+            title="Python 101", description="...",
+            category=Category.objects.create(title="Programming"),
+            instructor=self.teacher,
+        )
+
+    def _login(self, email="teacher@example.com", password="pass123"):
+        resp = self.client.post(reverse("token_obtain_pair"), {"email": email, "password": password})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        return resp.data
+
+    def test_tokens_carry_role_claims(self):
+        access = AccessToken(self._login()["access"])
+        self.assertEqual(access["role"], "teacher")
+        self.assertFalse(access["is_staff"])
+
+    def test_write_request_skips_user_lookup(self):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self._login()['access']}")
+        url = reverse("courses-publish", args=[self.course.id])
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.patch(url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertFalse(any('"users_user"' in q["sql"] for q in ctx.captured_queries))
+
+    def test_claims_user_loads_row_lazily(self):
+        user = ClaimsUser(AccessToken(self._login()["access"]))
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual((user.id, user.role), (self.teacher.id, "teacher"))
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(user.email, "teacher@example.com")
+
+    def test_refreshed_access_token_keeps_claims(self):
+        resp = self.client.post(reverse("token_refresh"), {"refresh": self._login()["refresh"]})
+        self.assertEqual(AccessToken(resp.data["access"])["role"], "teacher")
+
+    def test_refresh_rereads_role_from_the_user(self):
+        refresh = self._login()["refresh"]
+        self.teacher.role, self.teacher.is_staff = "student", False
+        self.teacher.save()
+
+        resp = self.client.post(reverse("token_refresh"), {"refresh": refresh})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(AccessToken(resp.data["access"])["role"], "student")
+        self.assertEqual(RefreshToken(resp.data["refresh"])["role"], "student")
+
+        self.teacher.is_active = False
+        self.teacher.save()
+        resp = self.client.post(reverse("token_refresh"), {"refresh": resp.data["refresh"]})
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserCacheTests(APITestCase):
+    """
+    LRU + TTL cache of User rows, invalidated by post_save/post_delete.
+    """
+
+    def setUp(self):
+        user_cache.clear()
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+
+    def test_second_get_is_a_hit(self):
+        user_cache.get(self.student.id)
+        with CaptureQueriesContext(connection) as ctx:
+            user = user_cache.get(self.student.id)
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(user.email, "student@example.com")
+        self.assertEqual((user_cache.stats()["hits"], user_cache.stats()["misses"]), (1, 1))
+
+    def test_save_invalidates(self):
+        user_cache.get(self.student.id)
+        self.student.role = User.Role.TEACHER
+        self.student.save()
+        self.assertEqual(user_cache.get(self.student.id).role, "teacher")
+
+    def test_ttl_and_lru_bounds(self):
+        other = User.objects.create_user(username="o", email="o@example.com", password="x")
+        small = UserCache(maxsize=1, ttl=60)
+        small.get(self.student.id)
+        small.get(other.id)
+        self.assertEqual(small.stats()["size"], 1)
+
+        expired = UserCache(maxsize=10, ttl=0)
+        expired.get(self.student.id)
+        expired.get(self.student.id)
+        self.assertEqual(expired.stats()["misses"], 2)
+
+    def test_legacy_token_is_served_from_cache(self):
+        # tokens issued before the role claim existed fall back to the full row
+        token = AccessToken.for_user(self.student)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        url = reverse("category-list")
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get(url)
+        self.assertFalse(any('"users_user"' in q["sql"] for q in ctx.captured_queries))
+
+    def test_deactivated_user_is_rejected(self):
+        token = AccessToken.for_user(self.student)
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.client.get(reverse("category-list"))
+        self.student.is_active = False
+        self.student.save()
+        resp = self.client.get(reverse("category-list"))
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class TokenRevocationTests(APITestCase):
+    """Logout, rotation and "log out everywhere" all stop a refresh token working."""
+
+    def setUp(self):
+        cache.clear()
+        self.student = User.objects.create_user(
+            username="student", email="student@example.com", password="pass123",
+        )
+
+    def _login(self):
+        return self.client.post(
+            reverse("token_obtain_pair"), {"email": "student@example.com", "password": "pass123"},
+        ).data
+
+    def _refresh(self, token):
+        return self.client.post(reverse("token_refresh"), {"refresh": token})
+
+    def test_logout_revokes_refresh_token(self):
+        refresh = self._login()["refresh"]
+        self.assertEqual(self.client.post(reverse("logout"), {"refresh": refresh}).status_code,
+                         status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._refresh(refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self.client.post(reverse("logout"), {"refresh": "junk"}).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+    def test_rotated_token_is_single_use(self):
+        refresh = self._login()["refresh"]
+        rotated = self._refresh(refresh)
+        self.assertEqual(rotated.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._refresh(refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(self._refresh(rotated.data["refresh"]).status_code, status.HTTP_200_OK)
+
+    def test_only_one_rotation_claims_a_token(self):
+        token = RefreshToken(self._login()["refresh"])
+        self.assertTrue(revoke_token(token))
+        self.assertFalse(revoke_token(token))
+
+    def test_stale_cached_answer_does_not_allow_reuse(self):
+        refresh = self._login()["refresh"]
+        token = RefreshToken(refresh)
+        self.assertFalse(is_revoked(token))      # this worker caches "not revoked"
+        # ... then another worker rotates the token away (its own cache, not ours)
+        RevokedToken.objects.create(jti=token["jti"], user_id=self.student.pk,
+                                    expires_at=timezone.now() + timedelta(days=1))
+        self.assertEqual(self._refresh(refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_stale_cached_cutoff_does_not_allow_refresh(self):
+        refresh = self._login()["refresh"]
+        self.assertFalse(is_revoked(RefreshToken(refresh)))   # caches "no cut-off" here
+        # another worker logs the user out everywhere (its own cache, not ours)
+        User.objects.filter(pk=self.student.pk).update(
+            tokens_valid_after=timezone.now() + timedelta(seconds=1),
+        )
+        self.assertEqual(self._refresh(refresh).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_all_sessions(self):
+        first, second = self._login(), self._login()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {first['access']}")
+        self.assertEqual(self.client.post(reverse("logout_all")).status_code, status.HTTP_204_NO_CONTENT)
+        self.client.credentials()
+        self.assertEqual(self._refresh(second["refresh"]).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # tokens issued afterwards still work
+        self.student.refresh_from_db()
+        later = RefreshToken.for_user(self.student)
+        later.set_iat(at_time=self.student.tokens_valid_after + timedelta(seconds=1))
+        self.assertFalse(is_revoked(later))
+
+    def test_only_admins_end_other_users_sessions(self):
+        other = User.objects.create_user(username="other", email="other@example.com", password="pass123")
+        self.client.force_authenticate(self.student)
+        self.assertEqual(self.client.post(reverse("logout_all"), {"user": other.pk}).status_code,
+                         status.HTTP_403_FORBIDDEN)
+        admin = User.objects.create_superuser(email="admin@example.com", username="admin", password="pass123")
+        self.client.force_authenticate(admin)
+        self.assertEqual(self.client.post(reverse("logout_all"), {"user": other.pk}).status_code,
+                         status.HTTP_204_NO_CONTENT)
+        other.refresh_from_db()
+        self.assertIsNotNone(other.tokens_valid_after)
+
+    def test_check_is_served_from_cache(self):
+        token = RefreshToken(self._login()["refresh"])
+        is_revoked(token)
+        with self.assertNumQueries(0):
+            self.assertFalse(is_revoked(token))
+
+    def test_prune_expired(self):
+        RevokedToken.objects.create(jti="old", user_id=self.student.pk, expires_at=timezone.now() - timedelta(days=1))
+        RevokedToken.objects.create(jti="live", user_id=self.student.pk, expires_at=timezone.now() + timedelta(days=1))
+        call_command("prune_revoked_tokens", stdout=io.StringIO())
+        self.assertEqual(list(RevokedToken.objects.values_list("jti", flat=True)), ["live"])
+
+
+class PasswordHashingTests(APITestCase):
+    """Cost follows the profile; outdated hashes are upgraded after login, not during it."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        with self.settings(PASSWORD_HASH_PROFILE="fast"):
+            self.student = User.objects.create_user(
+                username="student", email="student@example.com",
+                password="pass123", role="student",
+            )
+
+    def _login(self, password="pass123"):
+        return self.client.post(
+            reverse("token_obtain_pair"), {"email": "student@example.com", "password": password},
+        )
+
+    def test_profile_sets_cost(self):
+        self.assertTrue(self.student.password.startswith("pbkdf2_sha256$600000$"))
+        with self.settings(PASSWORD_HASH_PROFILE="strong"):
+            self.assertTrue(make_password("x").startswith("pbkdf2_sha256$2000000$"))
+
+    def test_outdated_hash_rehashed_after_login(self):
+        old_hash = self.student.password
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+        self.assertEqual(len(callbacks), 1)          # queued, not done in the request
+        self.student.refresh_from_db()
+        self.assertEqual(self.student.password, old_hash)
+
+        self.assertTrue(rehash_password(self.student.pk, old_hash, "pass123"))
+        self.student.refresh_from_db()
+        self.assertTrue(self.student.password.startswith("pbkdf2_sha256$1000000$"))
+        # a password changed in the meantime is left alone
+        self.assertFalse(rehash_password(self.student.pk, old_hash, "pass123"))
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(self._login().status_code, status.HTTP_200_OK)
+        self.assertEqual(callbacks, [])
+
+    def test_wrong_password_queues_nothing(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(self._login("wrong").status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(callbacks, [])
+
+
+@override_settings(PASSWORD_HASH_PROFILE="fast")
+class LoginThrottleTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+    def _login(self, email, ip="10.0.0.1", **extra):
+        return self.client.post(
+            reverse("token_obtain_pair"), {"email": email, "password": "wrong"}, REMOTE_ADDR=ip, **extra,
+        )
+
+    @mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"login_email": "2/min"})
+    def test_per_email(self):
+        self._login("a@example.com", ip="10.0.0.1")
+        self._login("a@example.com", ip="10.0.0.2")
+        blocked = self._login("A@example.com ", ip="10.0.0.3")
+        self.assertEqual(blocked.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn("Retry-After", blocked)
+        self.assertEqual(self._login("b@example.com").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"login_ip": "2/min"})
+    def test_per_ip_ignores_forwarded_for(self):
+        self._login("a@example.com")
+        self._login("b@example.com", HTTP_X_FORWARDED_FOR="1.2.3.4")
+        blocked = self._login("c@example.com", HTTP_X_FORWARDED_FOR="5.6.7.8")
+        self.assertEqual(blocked.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(self._login("c@example.com", ip="10.0.0.9").status_code, status.HTTP_401_UNAUTHORIZED)
+
+    @mock.patch.dict(SimpleRateThrottle.THROTTLE_RATES, {"register_ip": "1/min"})
+    def test_register_per_ip(self):
+        def register(name):
+            return self.client.post(reverse("register"), {
+                "email": f"{name}@example.com", "username": name,
+                "password": "S3cure-pass!", "password2": "S3cure-pass!",
+            })
+        self.assertEqual(register("first").status_code, status.HTTP_201_CREATED)
+        self.assertEqual(register("second").status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
+@override_settings(PASSWORD_HASH_PROFILE="fast", USER_IMPORT_HASH_WORKERS=0)
+class UserImportTests(APITestCase):
+    """Rosters are validated per batch with one uniqueness query and bulk-created."""
+
+    CSV = (
+        "email,username,phone_number,role,password\n"
+        "ana@School.org,ana,+8801711111111,student,Str0ng-pass!\n"
+        "ben@school.org,ben,,teacher,Str0ng-pass!\n"
+        "cy@school.org,cy,,,\n"
+    )
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="admin123",
+        )
+
+    def _post(self, body, query=""):
+        return self.client.generic(
+            "POST", reverse("user-import") + query, body, content_type="text/csv",
+        )
+
+    def test_api_import(self):
+        self.client.force_authenticate(self.admin)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self._post(self.CSV)
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual(resp.data, {"created": 3, "updated": 0, "skipped": 0})
+        self.assertLess(len(ctx.captured_queries), 8)
+
+        ana = User.objects.get(username="ana")
+        self.assertEqual((ana.email, ana.role), ("ana@school.org", "student"))
+        self.assertTrue(ana.check_password("Str0ng-pass!"))
+        self.assertEqual(User.objects.get(username="ben").role, "teacher")
+        self.assertFalse(User.objects.get(username="cy").has_usable_password())
+
+        again = self._post(self.CSV, "?skip_existing=1")
+        self.assertEqual(again.data, {"created": 0, "updated": 0, "skipped": 3})
+
+    def test_clashes_fail_the_whole_import(self):
+        self.client.force_authenticate(self.admin)
+        body = self.CSV + "dup@school.org,ben,,,\nadmin@example.com,zed,,,\n"
+        resp = self._post(body)
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([e["row"] for e in resp.data["errors"]], [4, 5])
+        self.assertIn("username", resp.data["errors"][0]["errors"])
+        self.assertIn("email", resp.data["errors"][1]["errors"])
+        self.assertEqual(User.objects.all_users().count(), 1)
+
+    def test_admins_only(self):
+        student = User.objects.create_user(username="s", email="s@example.com", password="pass123")
+        self.client.force_authenticate(student)
+        self.assertEqual(self._post(self.CSV).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_command_hashes_in_process_pool(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as fh:
+            fh.write(self.CSV)
+        self.addCleanup(os.unlink, fh.name)
+
+        out = io.StringIO()
+        call_command("import_users", fh.name, "--workers", "1", "--batch-size", "2", stdout=out)
+        self.assertIn("3 created", out.getvalue())
+        password = User.objects.get(username="ben").password
+        self.assertTrue(password.startswith("pbkdf2_sha256$600000$"))
+
+        with self.assertRaises(CommandError):
+            call_command("import_users", fh.name, "--workers", "0", stdout=io.StringIO())
+
+
+class CaseInsensitiveIdentityTests(APITestCase):
+    """Emails / usernames are unique and looked up whatever their case, via Lower() indexes."""
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.student = User.objects.create_user(
+            username="Student", email="Student@Example.com", password="pass123",
+        )
+
+    def test_login_in_any_case(self):
+        resp = self.client.post(
+            reverse("token_obtain_pair"), {"email": "student@EXAMPLE.com", "password": "pass123"},
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(User.objects.get_user_by_email("STUDENT@example.com"), self.student)
+
+    def test_lookup_is_an_index_probe(self):
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        plan = User.objects.all_users().filter(email__lower="student@example.com").explain()
+        self.assertIn("users_user_email_ci_unique", plan)
+
+    def test_case_duplicates_rejected(self):
+        resp = self.client.post(reverse("register"), {
+            "email": "STUDENT@example.com", "username": "student",
+            "password": "S3cure-pass!", "password2": "S3cure-pass!",
+        })
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(resp.data), {"email", "username"})
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user(username="other", email="student@example.COM", password="x")
+
+    @override_settings(USER_IMPORT_HASH_WORKERS=0)
+    def test_import_clash_in_other_case(self):
+        self.client.force_authenticate(User.objects.create_superuser(
+            username="admin", email="admin@example.com", password="admin123",
+        ))
+        resp = self.client.post(reverse("user-import"), [
+            {"email": "STUDENT@example.com", "username": "someone"},
+            {"email": "new@example.com", "username": "STUDENT"},
+        ], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            [list(error["errors"]) for error in resp.data["errors"]], [["email"], ["username"]],
+        )
@@ -0,0 +1,41 @@
+"""
+Rate limits for the endpoints that hash passwords.
+
+Every login and registration attempt costs a full password hash, so a
+credential-stuffing run could otherwise keep every worker busy hashing.
+Counters live in the default cache (shared between workers once CACHE_URL
+points at Redis); rates are in REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"].
+
+    login_ip      attempts per client IP (NUM_PROXIES decides which address
+                  counts as the client's when behind a proxy)
+    login_email   attempts per account, however many IPs they come from
+    register_ip   sign-ups per client IP
+"""
+import hashlib
+
+from rest_framework.throttling import SimpleRateThrottle
+
+
+class _IPThrottle(SimpleRateThrottle):
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class LoginIPThrottle(_IPThrottle):
+    scope = "login_ip"
+
+
+class RegisterIPThrottle(_IPThrottle):
+    scope = "register_ip"
+
+
+class LoginEmailThrottle(SimpleRateThrottle):
+    scope = "login_email"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email") if hasattr(request.data, "get") else None
+        if not isinstance(email, str) or not email.strip():
+            return None          # nothing to hash against; login_ip still applies
+        # hashed: keys must be short and free of characters memcached rejects
+        ident = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return self.cache_format % {"scope": self.scope, "ident": ident}
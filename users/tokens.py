@@ -0,0 +1,25 @@
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+def set_role_claims(token, user):
+    """Write the claims `ClaimsUser` authorises with, from the user row."""
+    token["role"] = user.role
+    token["is_staff"] = user.is_staff
+
+
+class RoleRefreshToken(RefreshToken):
+    """
+    Refresh token that also carries the user's `role` and `is_staff`.
+
+    Access tokens minted from it (at login and on every refresh) copy those
+    claims, which lets `ClaimsJWTAuthentication` authorise requests without
+    loading the user row. A refresh re-reads them from the row first
+    (`RevocableTokenRefreshSerializer`), so a role change takes effect at the
+    next refresh.
+    """
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        set_role_claims(token, user)
+        return token
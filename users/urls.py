@@ -1,6 +1,7 @@
 from django.urls import path
-from users.views import RegisterView
+from users.views import RegisterView, UserImportView
 
 urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
+    path('import/', UserImportView.as_view(), name='user-import'),
 ]
\ No newline at end of file
@@ -1,9 +1,19 @@
+from django.conf import settings
 from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from users.serializers.auth import RegisterSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView
+from course.bulk import request_records
+from users.provisioning import UserImporter, shared_hash_pool
+from users.revocation import revoke_all_tokens, revoke_token
+from users.serializers.auth import LogoutSerializer, RegisterSerializer
+from users.throttles import LoginEmailThrottle, LoginIPThrottle, RegisterIPThrottle
 
 class RegisterView(APIView):
+    throttle_classes = [RegisterIPThrottle]
+
     def post(self, request, *args, **kwargs):
         serializer = RegisterSerializer(data=request.data)
         if serializer.is_valid():
@@ -11,6 +21,73 @@ class RegisterView(APIView):
             return Response({"message": "User registered successfully."}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
+
+class UserImportView(APIView):
+    """
+    POST /api/users/import/   (admins)   CSV, JSON Lines or a JSON array
+
+    Columns: email, username, phone_number, role (student | teacher),
+    first_name, last_name, password. ?skip_existing=1 skips rows whose email
+    is already registered instead of failing the import.
+    """
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        skip_existing = request.query_params.get("skip_existing", "").lower() in ("1", "true", "yes")
+        executor = shared_hash_pool() if settings.USER_IMPORT_HASH_WORKERS else None
+        result = UserImporter(executor=executor, skip_existing=skip_existing).run(request_records(request))
+        return Response(result, status=status.HTTP_201_CREATED)
+
+
+class LoginView(TokenObtainPairView):
+    """
+    POST /api/login/  {"email": "...", "password": "..."}
+
+    Throttled per client IP and per email before any password is hashed;
+    over the limit the answer is 429 with a Retry-After header.
+    """
+    throttle_classes = [LoginIPThrottle, LoginEmailThrottle]
+
+
+class LogoutView(APIView):
+    """
+    POST /api/logout/  {"refresh": "..."}
+
+    Revokes this refresh token: /api/token/refresh/ refuses it from now on.
+    Holding the token is proof enough, so no access token is needed.
+    """
+    authentication_classes = []
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        revoke_token(serializer.validated_data["refresh"])
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class LogoutAllView(APIView):
+    """
+    POST /api/logout/all/              → end all of my sessions
+    POST /api/logout/all/ {"user": 7}  → end all of user 7's sessions (admins)
+
+    Every refresh token issued so far stops working; access tokens run out
+    within ACCESS_TOKEN_LIFETIME.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        user_id = request.data.get("user", request.user.id)
+        if str(user_id) != str(request.user.id) and request.user.role != "admin":
+            raise PermissionDenied("Only admins can end another user's sessions.")
+        try:
+            found = revoke_all_tokens(int(user_id))
+        except (TypeError, ValueError):
+            return Response({"user": ["A valid integer is required."]}, status=status.HTTP_400_BAD_REQUEST)
+        if not found:
+            return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
 # class RegisterAPIView(generics.CreateAPIView):
 #     """
 #     API view to register a new user.